@@ -0,0 +1 @@
+"""Performance benchmarks for Wispr-Flow Clone."""
@@ -0,0 +1,230 @@
+"""End-to-end dictation latency benchmark.
+
+Replays WAV fixtures through the same capture path as ``AudioRecorder``
+(chunked callback processing into the preallocated buffer), then VAD
+trimming, ``Transcriber.transcribe`` and a stub text injector, and reports
+p50/p95 latency per stage, real-time factor and peak RSS.
+
+Usage:
+    python -m benchmarks.latency                       # mock backend (CI)
+    python -m benchmarks.latency --backend config      # model from config.yaml
+    python -m benchmarks.latency --output new.json --compare old.json
+"""
+
+import argparse
+import json
+import platform
+import resource
+import subprocess
+import time
+from collections import defaultdict
+from pathlib import Path
+
+import numpy as np
+
+from src.audio_buffer import AudioRingBuffer
+from src.config import Config
+from src.preprocessing import CapturePreprocessor
+from src.transcriber import Transcriber
+from src.vad import EnergyVAD
+
+from .fixtures import Fixture, load_fixtures
+from .mock_backend import MockTranscriber, StubInjector
+
+
+DEFAULT_FIXTURES = Path(__file__).parent / "data"
+STAGES = ('capture_chunk', 'stop', 'vad', 'transcribe', 'inject', 'release_to_text')
+
+
+def replay(
+    fixture: Fixture,
+    transcriber: Transcriber,
+    injector: StubInjector,
+    vad: EnergyVAD,
+    chunk_size: int,
+    preprocess: bool,
+    timings: dict
+) -> float:
+    """Run one fixture through capture, trimming, transcription and injection.
+
+    Args:
+        fixture: Recording to replay
+        transcriber: Transcriber under test
+        injector: Stub injector
+        vad: Voice activity detector
+        chunk_size: Frames per simulated callback
+        preprocess: Use capture-time preprocessing like the recorder default
+        timings: Stage name -> list of seconds, appended to
+
+    Returns:
+        Transcription time in seconds
+    """
+    target_rate = 16000
+    preprocessor = CapturePreprocessor(fixture.sample_rate, fixture.channels, target_rate)
+    buffer = AudioRingBuffer(
+        target_rate if preprocess else fixture.sample_rate,
+        channels=1 if preprocess else fixture.channels,
+        dtype=np.float32 if preprocess else np.int16
+    )
+    buffer.start()
+
+    step = chunk_size * fixture.channels
+    for offset in range(0, len(fixture.audio), step):
+        chunk = fixture.audio[offset:offset + step]
+        start = time.perf_counter()
+        buffer.write(preprocessor.process(chunk) if preprocess else chunk)
+        timings['capture_chunk'].append(time.perf_counter() - start)
+
+    released = time.perf_counter()
+    audio = buffer.stop()
+    rate = buffer.sample_rate
+    stopped = time.perf_counter()
+
+    result = vad.trim(audio, rate) if preprocess or fixture.channels == 1 else None
+    if result is not None and result.audio is not None:
+        audio = result.audio
+    trimmed = time.perf_counter()
+
+    text = transcriber.transcribe(audio, rate)
+    transcribed = time.perf_counter()
+
+    injector.inject_text(text)
+    injected = time.perf_counter()
+
+    timings['stop'].append(stopped - released)
+    timings['vad'].append(trimmed - stopped)
+    timings['transcribe'].append(transcribed - trimmed)
+    timings['inject'].append(injected - transcribed)
+    timings['release_to_text'].append(injected - released)
+    return transcribed - trimmed
+
+
+def summarize(samples: list[float]) -> dict:
+    """Compute latency percentiles in milliseconds."""
+    values = np.array(samples) * 1000
+    return {
+        'p50_ms': round(float(np.percentile(values, 50)), 3),
+        'p95_ms': round(float(np.percentile(values, 95)), 3),
+        'count': len(samples),
+    }
+
+
+def git_revision() -> str:
+    """Get the current commit hash, if available."""
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, check=True
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def run(args: argparse.Namespace) -> dict:
+    """Run the benchmark.
+
+    Returns:
+        JSON-serializable results
+    """
+    config = Config(args.config)
+    # Every run replays the same audio, so a cache would time lookups instead of decodes
+    config.cache.enabled = args.cache
+    if args.backend == 'mock':
+        transcriber = Transcriber(config, model=MockTranscriber(args.mock_rtf))
+    else:
+        transcriber = Transcriber(config)
+
+    injector = StubInjector()
+    vad = EnergyVAD(min_speech_seconds=config.app.min_audio_length)
+    fixtures = load_fixtures(args.fixtures)
+
+    timings: dict = defaultdict(list)
+    per_fixture = {}
+    for fixture in fixtures:
+        for _ in range(args.warmup):
+            replay(fixture, transcriber, injector, vad, args.chunk_size,
+                   args.preprocess, defaultdict(list))
+
+        fixture_timings: dict = defaultdict(list)
+        rtfs = [
+            replay(fixture, transcriber, injector, vad, args.chunk_size,
+                   args.preprocess, fixture_timings) / fixture.duration
+            for _ in range(args.runs)
+        ]
+        for stage, values in fixture_timings.items():
+            timings[stage].extend(values)
+        per_fixture[fixture.name] = {
+            'duration_s': round(fixture.duration, 3),
+            'sample_rate': fixture.sample_rate,
+            'channels': fixture.channels,
+            'rtf_p50': round(float(np.median(rtfs)), 4),
+            'release_to_text': summarize(fixture_timings['release_to_text']),
+        }
+
+    return {
+        'meta': {
+            'revision': git_revision(),
+            'backend': args.backend if args.backend == 'mock' else config.model.type,
+            'preprocess': args.preprocess,
+            'cache': args.cache,
+            'runs': args.runs,
+            'chunk_size': args.chunk_size,
+            'python': platform.python_version(),
+            'machine': platform.machine(),
+        },
+        'stages': {stage: summarize(timings[stage]) for stage in STAGES},
+        'fixtures': per_fixture,
+        # ru_maxrss is reported in kilobytes on Linux
+        'peak_rss_mb': round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def print_report(results: dict, baseline: dict = None) -> None:
+    """Print a stage table, with deltas against a baseline if given."""
+    print(f"revision {results['meta']['revision']}, backend {results['meta']['backend']}")
+    header = f"{'stage':<16}{'p50 ms':>10}{'p95 ms':>10}"
+    print(header + (f"{'base p50':>10}{'delta':>9}" if baseline else ""))
+    for stage, stats in results['stages'].items():
+        line = f"{stage:<16}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}"
+        if baseline and stage in baseline.get('stages', {}):
+            base = baseline['stages'][stage]['p50_ms']
+            delta = (stats['p50_ms'] - base) / base * 100 if base else 0.0
+            line += f"{base:>10.3f}{delta:>+8.1f}%"
+        print(line)
+    for name, stats in results['fixtures'].items():
+        print(
+            f"  {name}: {stats['duration_s']:.1f}s, RTF {stats['rtf_p50']:.3f}, "
+            f"release->text p50 {stats['release_to_text']['p50_ms']:.1f}ms"
+        )
+    print(f"peak RSS {results['peak_rss_mb']:.1f} MB")
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Dictation latency benchmark")
+    parser.add_argument('--backend', choices=('mock', 'config'), default='mock',
+                        help="mock: stub model for CI; config: model from config.yaml")
+    parser.add_argument('--config', type=Path, default=None, help="config.yaml path")
+    parser.add_argument('--fixtures', type=Path, default=DEFAULT_FIXTURES,
+                        help="directory of 16-bit WAV files")
+    parser.add_argument('--runs', type=int, default=5)
+    parser.add_argument('--warmup', type=int, default=1)
+    parser.add_argument('--chunk-size', type=int, default=1024)
+    parser.add_argument('--no-preprocess', dest='preprocess', action='store_false',
+                        help="store raw device audio and resample after release")
+    parser.add_argument('--mock-rtf', type=float, default=0.05)
+    parser.add_argument('--cache', action='store_true',
+                        help="keep the transcript cache on (repeat runs become cache hits)")
+    parser.add_argument('--output', type=Path, help="write JSON results here")
+    parser.add_argument('--compare', type=Path, help="baseline JSON to diff against")
+    args = parser.parse_args()
+
+    results = run(args)
+    baseline = json.loads(args.compare.read_text()) if args.compare else None
+    print_report(results, baseline)
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""Stand-ins for the model backend and text injector used in benchmarks."""
+
+import time
+
+import numpy as np
+
+
+class MockTranscriber:
+    """Tiny deterministic backend with the same interface as the real models.
+
+    It computes a log-spectrogram of the input (so cost grows with audio
+    length like a real encoder) and then sleeps to reach a target real-time
+    factor. Lets the harness run in CI without model weights.
+    """
+
+    def __init__(self, real_time_factor: float = 0.05, fixed_latency: float = 0.01):
+        """Initialize mock backend.
+
+        Args:
+            real_time_factor: Simulated inference seconds per second of audio
+            fixed_latency: Simulated per-call overhead in seconds
+        """
+        self.real_time_factor = real_time_factor
+        self.fixed_latency = fixed_latency
+
+    def transcribe(self, audio_data: np.ndarray, sample_rate: int = 16000) -> str:
+        """Pretend to transcribe audio.
+
+        Returns:
+            One placeholder word per half second of audio
+        """
+        start = time.perf_counter()
+        audio = audio_data.astype(np.float32)
+        frames = len(audio) // 400
+        if frames:
+            spectrum = np.fft.rfft(audio[:frames * 400].reshape(frames, 400), axis=1)
+            np.log1p(np.abs(spectrum)).mean()
+
+        duration = len(audio_data) / sample_rate
+        target = self.fixed_latency + duration * self.real_time_factor
+        remaining = target - (time.perf_counter() - start)
+        if remaining > 0:
+            time.sleep(remaining)
+        return " ".join(f"word{i}" for i in range(int(duration * 2)))
+
+    def is_ready(self) -> bool:
+        """Mock backend is always ready."""
+        return True
+
+
+class StubInjector:
+    """TextInjector replacement that records text instead of typing it."""
+
+    def __init__(self):
+        """Initialize stub injector."""
+        self.injected: list[str] = []
+
+    def inject_text(self, text: str) -> bool:
+        """Record injected text.
+
+        Returns:
+            Always True
+        """
+        self.injected.append(text)
+        return True
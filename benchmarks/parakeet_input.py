@@ -0,0 +1,96 @@
+"""Compare Parakeet per-utterance latency: temporary WAV file vs in-memory tensor.
+
+Usage:
+    python -m benchmarks.parakeet_input [--device cpu] [--repeats 5]
+
+The "wav" path reproduces the previous implementation (float32 conversion,
+temporary WAV written with soundfile, ``model.transcribe([path])``); the
+"tensor" path is ``ParakeetTranscriber.transcribe``.
+"""
+
+import argparse
+import statistics
+import tempfile
+import time
+
+import numpy as np
+
+from src.models.parakeet_model import ParakeetTranscriber
+
+
+def synthetic_clip(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """Create a speech-like int16 clip (modulated tones plus noise).
+
+    Args:
+        seconds: Clip duration
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        Audio as int16 array
+    """
+    rng = np.random.default_rng(0)
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    envelope = 0.5 * (1 + np.sin(2 * np.pi * 3 * t))
+    voice = np.sin(2 * np.pi * 180 * t) + 0.5 * np.sin(2 * np.pi * 720 * t)
+    audio = 0.3 * envelope * voice + 0.01 * rng.standard_normal(len(t))
+    return (audio * 32767).astype(np.int16)
+
+
+def transcribe_via_wav(transcriber: ParakeetTranscriber, audio: np.ndarray) -> str:
+    """Previous implementation: round-trip through a temporary WAV file."""
+    import soundfile as sf
+
+    audio_float = audio.astype(np.float32) / 32768.0
+    with tempfile.NamedTemporaryFile(suffix='.wav', delete=True) as tmp:
+        sf.write(tmp.name, audio_float, 16000)
+        result = transcriber.model.transcribe([tmp.name])[0]
+    return result.text.strip() if hasattr(result, 'text') else str(result).strip()
+
+
+def measure(func, audio: np.ndarray, repeats: int) -> list[float]:
+    """Time repeated calls, after one untimed warm-up call.
+
+    Returns:
+        Latencies in seconds
+    """
+    func(audio)
+    latencies = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func(audio)
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def main() -> None:
+    """Run the benchmark and print a latency table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--device', default='cpu', help='cpu or cuda')
+    parser.add_argument('--repeats', type=int, default=5)
+    parser.add_argument(
+        '--durations', type=float, nargs='+', default=[2.0, 5.0, 10.0, 20.0]
+    )
+    args = parser.parse_args()
+
+    transcriber = ParakeetTranscriber(device=args.device)
+    paths = {
+        'wav': lambda audio: transcribe_via_wav(transcriber, audio),
+        'tensor': lambda audio: transcriber.transcribe(audio, 16000),
+    }
+
+    print(f"{'clip':>6}  {'wav p50':>9}  {'tensor p50':>10}  {'speedup':>7}")
+    for seconds in args.durations:
+        audio = synthetic_clip(seconds)
+        medians = {
+            name: statistics.median(measure(func, audio, args.repeats))
+            for name, func in paths.items()
+        }
+        print(
+            f"{seconds:>5.1f}s  {medians['wav'] * 1000:>7.1f}ms  "
+            f"{medians['tensor'] * 1000:>8.1f}ms  "
+            f"{medians['wav'] / medians['tensor']:>6.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -10,9 +10,13 @@ YELLOW='\033[1;33m'
 BLUE='\033[0;34m'
 NC='\033[0m' # No Color
 
+# Process patterns (the frontend runs without arguments, the daemon with "daemon")
+APP_PATTERN="python -m src\.main$"
+DAEMON_PATTERN="python -m src\.main daemon"
+
 # Check if running
 check_status() {
-    if pgrep -f "python -m src.main" > /dev/null; then
+    if pgrep -f "${APP_PATTERN}" > /dev/null; then
         return 0  # Running
     else
         return 1  # Not running
@@ -27,7 +31,7 @@ status() {
     echo ""
     
     if check_status; then
-        PID=$(pgrep -f "python -m src.main")
+        PID=$(pgrep -f "${APP_PATTERN}")
         echo -e "${GREEN}✅ Status: RUNNING${NC}"
         echo -e "   PID: ${PID}"
         
@@ -87,16 +91,16 @@ stop() {
         return 1
     fi
     
-    PID=$(pgrep -f "python -m src.main")
+    PID=$(pgrep -f "${APP_PATTERN}")
     echo -e "${YELLOW}🛑 Stopping Wispr-Flow (PID: ${PID})...${NC}"
-    pkill -f "python -m src.main"
+    pkill -f "${APP_PATTERN}"
     sleep 2
     
     if ! check_status; then
         echo -e "${GREEN}✅ Stopped successfully${NC}"
     else
         echo -e "${RED}❌ Failed to stop. Trying force kill...${NC}"
-        pkill -9 -f "python -m src.main"
+        pkill -9 -f "${APP_PATTERN}"
         sleep 1
         if ! check_status; then
             echo -e "${GREEN}✅ Force stopped${NC}"
@@ -143,11 +147,54 @@ gpu() {
     echo "────────────────────────────────────────────"
 }
 
+# Latency metrics (requires metrics.enabled in config.yaml)
+metrics() {
+    PORT=$(grep -A5 '^metrics:' "${SCRIPT_DIR}/config.yaml" | grep 'port:' | awk '{print $2}')
+    PORT=${PORT:-9464}
+    echo -e "${BLUE}⏱️  Stage latency (sum / count):${NC}"
+    echo "────────────────────────────────────────────"
+    if ! curl -s "http://127.0.0.1:${PORT}/metrics" | grep -E '^wispr_stage_seconds_(sum|count)|^wispr_dictations_total|queue_depth '; then
+        echo -e "${YELLOW}⚠️  Metrics endpoint not reachable on port ${PORT}${NC}"
+        echo "   Set metrics.enabled: true in config.yaml and restart"
+    fi
+    echo "────────────────────────────────────────────"
+}
+
+# Resident model daemon
+daemon_start() {
+    if pgrep -f "${DAEMON_PATTERN}" > /dev/null; then
+        echo -e "${YELLOW}⚠️  Daemon already running${NC}"
+        return 1
+    fi
+    echo -e "${GREEN}🚀 Starting model daemon...${NC}"
+    cd "${SCRIPT_DIR}"
+    nohup .venv/bin/python -m src.main daemon > /tmp/wispr-daemon.log 2>&1 &
+    sleep 2
+    daemon_status
+}
+
+daemon_stop() {
+    cd "${SCRIPT_DIR}"
+    if .venv/bin/python -m src.client shutdown > /dev/null 2>&1; then
+        echo -e "${GREEN}✅ Daemon stopped${NC}"
+    else
+        pkill -f "${DAEMON_PATTERN}" && echo -e "${GREEN}✅ Daemon stopped${NC}" \
+            || echo -e "${YELLOW}⚠️  Daemon not running${NC}"
+    fi
+}
+
+daemon_status() {
+    cd "${SCRIPT_DIR}"
+    if ! .venv/bin/python -m src.client status 2>/dev/null; then
+        echo -e "${RED}❌ Daemon not reachable (log: /tmp/wispr-daemon.log)${NC}"
+    fi
+}
+
 # Help
 usage() {
     echo -e "${BLUE}Wispr-Flow Management Script${NC}"
     echo ""
-    echo "Usage: $0 {status|start|stop|restart|logs|gpu|help}"
+    echo "Usage: $0 {status|start|stop|restart|logs|gpu|metrics|daemon-start|daemon-stop|daemon-status|help}"
     echo ""
     echo "Commands:"
     echo "  status   - Check if running and show details"
@@ -156,6 +203,11 @@ usage() {
     echo "  restart  - Restart the service"
     echo "  logs     - Show recent logs"
     echo "  gpu      - Show GPU information"
+    echo "  metrics  - Show per-stage latency metrics"
+    echo "  daemon-start  - Start the resident model daemon (keeps the model"
+    echo "                  loaded across app restarts; set daemon.use_daemon)"
+    echo "  daemon-stop   - Stop the model daemon"
+    echo "  daemon-status - Show model daemon status"
     echo "  help     - Show this help message"
     echo ""
     echo "Examples:"
@@ -185,6 +237,18 @@ case "$1" in
     gpu)
         gpu
         ;;
+    metrics)
+        metrics
+        ;;
+    daemon-start)
+        daemon_start
+        ;;
+    daemon-stop)
+        daemon_stop
+        ;;
+    daemon-status)
+        daemon_status
+        ;;
     help|--help|-h|"")
         usage
         ;;
@@ -0,0 +1,186 @@
+"""Preallocated capture buffer written in place by the audio callback."""
+
+import logging
+from threading import Lock
+from typing import Optional
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+
+class AudioRingBuffer:
+    """Growable sample arena with an optional pre-roll ring.
+
+    While capturing, callbacks copy samples straight into a preallocated
+    arena that doubles in size as needed (up to ``max_seconds``). ``stop``
+    hands the filled part of the arena out as a zero-copy view; a fresh
+    arena is allocated on the next ``start`` so the returned view is never
+    overwritten. Outside of a capture, samples go into a small ring holding
+    the last ``preroll_seconds`` of audio, which is copied to the front of
+    the arena when the next capture starts.
+    """
+
+    def __init__(
+        self,
+        sample_rate: int,
+        channels: int = 1,
+        max_seconds: float = 300.0,
+        initial_seconds: float = 15.0,
+        preroll_seconds: float = 0.0,
+        dtype: type = np.int16
+    ):
+        """Initialize buffer.
+
+        Args:
+            sample_rate: Sample rate of written audio in Hz
+            channels: Number of interleaved channels
+            max_seconds: Maximum capture length; later samples are dropped
+            initial_seconds: Initial arena size
+            preroll_seconds: Audio kept from before ``start``
+            dtype: Sample type
+        """
+        self.sample_rate = sample_rate
+        self.channels = channels
+        self.dtype = dtype
+
+        samples_per_second = sample_rate * channels
+        self._max_capacity = max(int(max_seconds * samples_per_second), 1)
+        self._initial_capacity = min(
+            max(int(initial_seconds * samples_per_second), 1),
+            self._max_capacity
+        )
+
+        self._lock = Lock()
+        self._arena: Optional[np.ndarray] = np.empty(self._initial_capacity, dtype=dtype)
+        self._length = 0
+        self._capturing = False
+        self._truncated = False
+
+        ring_size = int(preroll_seconds * samples_per_second)
+        ring_size -= ring_size % channels
+        self._ring = np.zeros(ring_size, dtype=dtype)
+        self._ring_pos = 0
+        self._ring_filled = 0
+
+    @property
+    def is_capturing(self) -> bool:
+        """Whether samples are currently written to the arena."""
+        return self._capturing
+
+    def __len__(self) -> int:
+        """Number of samples captured so far."""
+        return self._length
+
+    def start(self) -> np.ndarray:
+        """Begin a capture, seeding it with the pre-roll audio.
+
+        Returns:
+            The pre-roll audio the capture starts with (may be empty)
+        """
+        with self._lock:
+            if self._arena is None:
+                self._arena = np.empty(self._initial_capacity, dtype=self.dtype)
+            self._length = 0
+            self._truncated = False
+
+            preroll = self._drain_ring()
+            if len(preroll):
+                self._append(preroll)
+            self._capturing = True
+            return preroll
+
+    def write(self, samples: np.ndarray) -> None:
+        """Write samples. Called from the audio callback thread.
+
+        Args:
+            samples: Interleaved samples of the buffer's dtype
+        """
+        with self._lock:
+            if self._capturing:
+                self._append(samples)
+            elif len(self._ring):
+                self._write_ring(samples)
+
+    def stop(self) -> np.ndarray:
+        """End the capture and return the captured audio.
+
+        Returns:
+            Zero-copy view of the captured samples
+        """
+        with self._lock:
+            self._capturing = False
+            if self._arena is None:
+                return np.zeros(0, dtype=self.dtype)
+
+            view = self._arena[:self._length]
+            # The view now belongs to the caller; the next capture gets a new arena
+            self._arena = None
+            self._length = 0
+            return view
+
+    def clear_preroll(self) -> None:
+        """Forget the audio held for pre-roll."""
+        with self._lock:
+            self._ring_pos = 0
+            self._ring_filled = 0
+
+    def _append(self, samples: np.ndarray) -> None:
+        """Copy samples into the arena, growing it if needed."""
+        needed = self._length + len(samples)
+        if needed > len(self._arena):
+            self._grow(needed)
+
+        count = min(len(samples), len(self._arena) - self._length)
+        if count < len(samples) and not self._truncated:
+            self._truncated = True
+            logger.warning(
+                f"Recording exceeds maximum length "
+                f"({self._max_capacity / (self.sample_rate * self.channels):.0f}s), "
+                "dropping further audio"
+            )
+        self._arena[self._length:self._length + count] = samples[:count]
+        self._length += count
+
+    def _grow(self, needed: int) -> None:
+        """Enlarge the arena to hold at least ``needed`` samples."""
+        capacity = min(max(len(self._arena) * 2, needed), self._max_capacity)
+        if capacity <= len(self._arena):
+            return
+        arena = np.empty(capacity, dtype=self.dtype)
+        arena[:self._length] = self._arena[:self._length]
+        self._arena = arena
+        logger.debug(f"Audio buffer grown to {capacity} samples")
+
+    def _write_ring(self, samples: np.ndarray) -> None:
+        """Write samples into the pre-roll ring, overwriting the oldest."""
+        size = len(self._ring)
+        if len(samples) >= size:
+            self._ring[:] = samples[-size:]
+            self._ring_pos = 0
+            self._ring_filled = size
+            return
+
+        end = self._ring_pos + len(samples)
+        if end <= size:
+            self._ring[self._ring_pos:end] = samples
+        else:
+            split = size - self._ring_pos
+            self._ring[self._ring_pos:] = samples[:split]
+            self._ring[:end - size] = samples[split:]
+        self._ring_pos = end % size
+        self._ring_filled = min(self._ring_filled + len(samples), size)
+
+    def _drain_ring(self) -> np.ndarray:
+        """Return the pre-roll audio in chronological order and reset the ring."""
+        if not self._ring_filled:
+            return self._ring[:0]
+        start = (self._ring_pos - self._ring_filled) % len(self._ring)
+        if start + self._ring_filled <= len(self._ring):
+            preroll = self._ring[start:start + self._ring_filled].copy()
+        else:
+            preroll = np.concatenate((self._ring[start:], self._ring[:self._ring_pos]))
+        self._ring_pos = 0
+        self._ring_filled = 0
+        return preroll
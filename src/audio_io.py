@@ -0,0 +1,92 @@
+"""Decoding audio files into mono sample arrays."""
+
+import logging
+import shutil
+import subprocess
+import wave
+from pathlib import Path
+
+import numpy as np
+
+from .resampler import resample
+
+
+logger = logging.getLogger(__name__)
+
+AUDIO_EXTENSIONS = {'.wav', '.flac', '.mp3', '.ogg', '.opus', '.m4a', '.aac', '.webm', '.mp4', '.mkv'}
+
+
+def read_wav(path: Path) -> tuple[np.ndarray, int]:
+    """Read a 16-bit PCM WAV file as mono int16.
+
+    Returns:
+        (audio, sample_rate)
+    """
+    with wave.open(str(path), 'rb') as wav:
+        if wav.getsampwidth() != 2:
+            raise ValueError(f"{path}: only 16-bit PCM WAV is supported")
+        audio = np.frombuffer(wav.readframes(wav.getnframes()), dtype=np.int16)
+        channels = wav.getnchannels()
+        if channels > 1:
+            audio = audio.reshape(-1, channels).mean(axis=1).astype(np.int16)
+        return audio, wav.getframerate()
+
+
+def _decode_ffmpeg(path: Path, sample_rate: int) -> np.ndarray:
+    """Decode any format ffmpeg understands to mono float32."""
+    if shutil.which('ffmpeg') is None:
+        raise RuntimeError(f"{path}: ffmpeg is required for this format (sudo apt install ffmpeg)")
+    result = subprocess.run(
+        ['ffmpeg', '-nostdin', '-v', 'error', '-i', str(path),
+         '-f', 'f32le', '-ac', '1', '-ar', str(sample_rate), '-'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        check=False
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"{path}: ffmpeg failed: {result.stderr.decode(errors='replace').strip()}")
+    return np.frombuffer(result.stdout, dtype=np.float32)
+
+
+def load_audio(path: Path, sample_rate: int = 16000) -> np.ndarray:
+    """Decode an audio file to mono float32 at the given rate.
+
+    16-bit WAV files are read directly and resampled with the cached
+    polyphase filter; other formats go through ffmpeg.
+
+    Args:
+        path: Audio file
+        sample_rate: Output sample rate
+
+    Returns:
+        float32 audio in [-1, 1]
+    """
+    if path.suffix.lower() == '.wav':
+        try:
+            audio, rate = read_wav(path)
+        except (ValueError, wave.Error) as e:
+            logger.debug(f"Falling back to ffmpeg for {path}: {e}")
+        else:
+            audio = audio.astype(np.float32) / 32768.0
+            return resample(audio, rate, sample_rate) if rate != sample_rate else audio
+    return _decode_ffmpeg(path, sample_rate)
+
+
+def find_audio_files(paths: list[Path]) -> list[Path]:
+    """Expand directories (recursively) into the audio files they contain.
+
+    Args:
+        paths: Files and directories
+
+    Returns:
+        Audio files in a stable order
+    """
+    files = []
+    for path in paths:
+        if path.is_dir():
+            files.extend(sorted(
+                p for p in path.rglob('*') if p.suffix.lower() in AUDIO_EXTENSIONS
+            ))
+        else:
+            files.append(path)
+    return files
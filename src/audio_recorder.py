@@ -1,14 +1,22 @@
 """Audio recording module using PyAudio."""
 
-import pyaudio
 import numpy as np
 import logging
-from typing import Optional
+from typing import Callable, Optional
 from threading import Lock
 
+from .audio_buffer import AudioRingBuffer
+from .device_monitor import DeviceMonitor
+from .input_stream import InputStream
+from .metrics import span
+from .preprocessing import CapturePreprocessor
+
 
 logger = logging.getLogger(__name__)
 
+# Receives (chunk, sample_rate) on the audio callback thread
+ChunkListener = Callable[[np.ndarray, int], None]
+
 
 class AudioRecorder:
     """Records audio from microphone to memory buffer."""
@@ -18,7 +26,12 @@ class AudioRecorder:
         sample_rate: int = 16000,
         channels: int = 1,
         chunk_size: int = 1024,
-        device_index: Optional[int] = None
+        device_index: Optional[int] = None,
+        max_duration: float = 300.0,
+        persistent_stream: bool = False,
+        preroll_ms: int = 0,
+        device_check_interval: float = 2.0,
+        preprocess: bool = True
     ):
         """Initialize audio recorder.
         
@@ -27,73 +40,136 @@ class AudioRecorder:
             channels: Number of audio channels
             chunk_size: Size of audio chunks
             device_index: Microphone device index (None for default)
+            max_duration: Maximum recording length in seconds
+            persistent_stream: Keep the input stream open between recordings
+            preroll_ms: Audio kept from before the hotkey press (warm stream only)
+            device_check_interval: Seconds between warm stream health checks
+            preprocess: Downmix, resample and normalize chunks in the callback
+                so recordings come out as float32 mono at ``sample_rate``
         """
         self.sample_rate = sample_rate
         self.channels = channels
         self.chunk_size = chunk_size
         self.device_index = device_index
+        self.max_duration = max_duration
+        self.persistent_stream = persistent_stream
+        self.preroll_seconds = preroll_ms / 1000.0 if persistent_stream else 0.0
+        self.preprocess = preprocess
+        self.preprocessor: Optional[CapturePreprocessor] = None
         
-        self.audio = pyaudio.PyAudio()
-        self.stream: Optional[pyaudio.Stream] = None
         self.is_recording = False
-        self.audio_buffer: list[np.ndarray] = []
         self._lock = Lock()
-        self.actual_sample_rate = sample_rate  # Actual device sample rate
-        
-        # Log device information
-        try:
-            if device_index is None:
-                device_info = self.audio.get_default_input_device_info()
-                self.actual_sample_rate = int(device_info['defaultSampleRate'])
-                logger.info(
-                    f"Using system default input device: {device_info['name']} "
-                    f"(native rate: {self.actual_sample_rate}Hz)"
-                )
-                if self.actual_sample_rate != sample_rate:
-                    logger.info(
-                        f"Will record at {self.actual_sample_rate}Hz and resample to {sample_rate}Hz for transcription"
-                    )
-            else:
-                device_info = self.audio.get_device_info_by_index(device_index)
-                self.actual_sample_rate = int(device_info['defaultSampleRate'])
-                logger.info(
-                    f"Using device {device_index}: {device_info['name']} "
-                    f"(native rate: {self.actual_sample_rate}Hz)"
-                )
-        except Exception as e:
-            logger.warning(f"Could not get device info: {e}")
-            self.actual_sample_rate = sample_rate
+        self._chunk_listeners: list[ChunkListener] = []
+        # Pre-roll of the current recording, not yet sent to chunk listeners
+        self._pending_preroll: Optional[np.ndarray] = None
+        self.input = InputStream(
+            self._on_chunk,
+            channels=channels,
+            chunk_size=chunk_size,
+            device_index=device_index,
+            fallback_rate=sample_rate
+        )
+        self._configure_capture()
         
         logger.info(
             f"AudioRecorder initialized: {sample_rate}Hz target, "
             f"{channels} channel(s), chunk={chunk_size}"
         )
+        
+        self.device_monitor: Optional[DeviceMonitor] = None
+        if persistent_stream:
+            self._open_stream()
+            self.device_monitor = DeviceMonitor(
+                is_stalled=self.input.is_stalled,
+                on_change=self._reopen_stream,
+                follow_default=device_index is None,
+                interval=device_check_interval
+            )
+            self.device_monitor.start()
+    
+    def _configure_capture(self) -> None:
+        """Set up preprocessing and the capture buffer for the device's native rate."""
+        if self.actual_sample_rate != self.sample_rate:
+            logger.info(
+                f"Will record at {self.actual_sample_rate}Hz and resample to {self.sample_rate}Hz for transcription"
+            )
+        
+        if self.preprocess:
+            self.preprocessor = CapturePreprocessor(
+                self.actual_sample_rate, self.channels, self.sample_rate
+            )
+        
+        # Preallocated buffer the callback writes into in place
+        self.audio_buffer = AudioRingBuffer(
+            self.output_sample_rate,
+            channels=1 if self.preprocess else self.channels,
+            max_seconds=self.max_duration,
+            preroll_seconds=self.preroll_seconds,
+            dtype=np.float32 if self.preprocess else np.int16
+        )
+    
+    @property
+    def actual_sample_rate(self) -> int:
+        """Native sample rate of the device."""
+        return self.input.sample_rate
+    
+    @property
+    def output_sample_rate(self) -> int:
+        """Sample rate of recorded audio handed to callers."""
+        return self.sample_rate if self.preprocess else self.actual_sample_rate
     
-    def start_recording(self) -> None:
-        """Start recording audio."""
+    def _open_stream(self) -> None:
+        """Open and start the input stream."""
+        # The resampler history belongs to the previous stream; carried over,
+        # it would bleed into the first samples of this recording
+        if self.preprocessor is not None:
+            self.preprocessor.reset()
+        self.input.open()
+    
+    def _reopen_stream(self, reason: str) -> bool:
+        """Reopen the warm stream, rescanning devices.
+        
+        Args:
+            reason: Why the stream is reopened (for logging)
+            
+        Returns:
+            False if a recording is in progress and reopening must wait
+        """
+        with self._lock:
+            if self.is_recording:
+                return False
+            
+            logger.info(f"Reopening audio stream: {reason}")
+            self.input.reinitialize()
+            self._configure_capture()
+            self._open_stream()
+            return True
+    
+    def start_recording(self, buffer_audio: bool = True) -> None:
+        """Start recording audio.
+        
+        Args:
+            buffer_audio: Keep the recording for stop_recording(); when False
+                chunks only go to the chunk listeners (for open-ended capture)
+        """
         with self._lock:
             if self.is_recording:
                 logger.warning("Recording already in progress")
                 return
             
-            self.audio_buffer = []
+            if buffer_audio:
+                preroll = self.audio_buffer.start()
+                self._pending_preroll = preroll if len(preroll) else None
             self.is_recording = True
             
             try:
-                # Use actual device sample rate to avoid resampling issues in PyAudio
-                self.stream = self.audio.open(
-                    format=pyaudio.paInt16,
-                    channels=self.channels,
-                    rate=self.actual_sample_rate,
-                    input=True,
-                    input_device_index=self.device_index,
-                    frames_per_buffer=self.chunk_size,
-                    stream_callback=self._audio_callback
-                )
-                self.stream.start_stream()
+                if not self.input.is_open:
+                    self._open_stream()
                 logger.info("Recording started")
             except Exception as e:
                 self.is_recording = False
+                if buffer_audio:
+                    self.audio_buffer.stop()
                 logger.error(f"Failed to start recording: {e}")
                 raise
     
@@ -109,37 +185,66 @@ class AudioRecorder:
                 return None
             
             self.is_recording = False
+            self._pending_preroll = None
             
-            if self.stream:
-                try:
-                    self.stream.stop_stream()
-                    self.stream.close()
-                except Exception as e:
-                    logger.error(f"Error stopping stream: {e}")
-                finally:
-                    self.stream = None
+            # A warm stream stays open; the hotkey only toggles capture
+            if not self.persistent_stream:
+                with span('stream_stop'):
+                    self.input.close()
+            
+            if not self.audio_buffer.is_capturing:
+                logger.info("Recording stopped")
+                return None
             
-            if not self.audio_buffer:
+            # Zero-copy view of the preallocated buffer
+            with span('concatenate'):
+                audio_data = self.audio_buffer.stop()
+            if len(audio_data) == 0:
                 logger.warning("No audio data recorded")
                 return None
             
-            # Concatenate all chunks
-            audio_data = np.concatenate(self.audio_buffer, axis=0)
             logger.info(f"Recording stopped: {len(audio_data)} samples")
             
             return audio_data
     
-    def _audio_callback(self, in_data, frame_count, time_info, status):
-        """Callback for audio stream."""
-        if status:
-            logger.warning(f"Audio callback status: {status}")
+    def _on_chunk(self, audio_chunk: np.ndarray) -> None:
+        """Handle a chunk from the input stream (audio callback thread).
+        
+        Outside a recording the buffer only keeps it for pre-roll.
+        """
+        if self.preprocessor is not None:
+            audio_chunk = self.preprocessor.process(audio_chunk)
+        self.audio_buffer.write(audio_chunk)
         
         if self.is_recording:
-            # Convert bytes to numpy array
-            audio_chunk = np.frombuffer(in_data, dtype=np.int16)
-            self.audio_buffer.append(audio_chunk)
+            # Listeners (streaming) get the pre-roll first, like the buffer
+            preroll, self._pending_preroll = self._pending_preroll, None
+            for chunk in (preroll, audio_chunk):
+                if chunk is None:
+                    continue
+                for listener in self._chunk_listeners:
+                    try:
+                        listener(chunk, self.output_sample_rate)
+                    except Exception as e:
+                        logger.error(f"Chunk listener failed: {e}")
+    
+    def add_chunk_listener(self, listener: ChunkListener) -> None:
+        """Register a callback that receives each recorded chunk.
         
-        return (in_data, pyaudio.paContinue)
+        Listeners run on the audio callback thread and must return quickly.
+        
+        Args:
+            listener: Called with (chunk, sample_rate) for every chunk
+        """
+        self._chunk_listeners = self._chunk_listeners + [listener]
+    
+    def remove_chunk_listener(self, listener: ChunkListener) -> None:
+        """Unregister a chunk listener.
+        
+        Args:
+            listener: Previously registered callback
+        """
+        self._chunk_listeners = [l for l in self._chunk_listeners if l is not listener]
     
     def get_audio_duration(self, audio_data: np.ndarray) -> float:
         """Get duration of audio data in seconds.
@@ -150,8 +255,7 @@ class AudioRecorder:
         Returns:
             Duration in seconds
         """
-        # Use actual sample rate since that's what we recorded at
-        return len(audio_data) / self.actual_sample_rate
+        return len(audio_data) / self.output_sample_rate
     
     def list_devices(self) -> list[dict]:
         """List available audio input devices.
@@ -159,27 +263,15 @@ class AudioRecorder:
         Returns:
             List of device information dictionaries
         """
-        devices = []
-        for i in range(self.audio.get_device_count()):
-            try:
-                info = self.audio.get_device_info_by_index(i)
-                if info['maxInputChannels'] > 0:
-                    devices.append({
-                        'index': i,
-                        'name': info['name'],
-                        'channels': info['maxInputChannels'],
-                        'sample_rate': int(info['defaultSampleRate'])
-                    })
-            except Exception as e:
-                logger.warning(f"Error getting device {i} info: {e}")
-        
-        return devices
+        return self.input.list_devices()
     
     def close(self) -> None:
         """Clean up resources."""
+        if self.device_monitor is not None:
+            self.device_monitor.stop()
+        
         if self.is_recording:
             self.stop_recording()
         
-        if self.audio:
-            self.audio.terminate()
-            logger.info("AudioRecorder closed")
+        self.input.terminate()
+        logger.info("AudioRecorder closed")
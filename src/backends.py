@@ -0,0 +1,251 @@
+"""Creating, warming up and fingerprinting transcription backends."""
+
+import json
+import logging
+import time
+from dataclasses import asdict
+from typing import Callable, Optional
+
+import numpy as np
+
+from .cache import TranscriptCache, audio_fingerprint
+from .config import Config
+from .router import ModelRouter
+
+
+logger = logging.getLogger(__name__)
+
+# Clip lengths (seconds) run at startup when no buckets are configured
+DEFAULT_WARMUP_SECONDS = (1.0, 4.0, 8.0)
+
+# Common Parakeet names -> Hugging Face model names
+PARAKEET_MODELS = {
+    "parakeet": "nvidia/parakeet-tdt-0.6b-v3",
+    "parakeet-0.6b": "nvidia/parakeet-tdt-0.6b-v3",
+    "parakeet-1.1b": "nvidia/parakeet-rnnt-1.1b"
+}
+
+
+def create_backend(
+    config: Config,
+    model_type: str,
+    size: str,
+    device: str,
+    whisper_profile: Optional[str] = None
+):
+    """Load one backend.
+
+    Args:
+        config: Application configuration (language and Whisper settings)
+        model_type: "whisper" or "parakeet"
+        size: Model size or name
+        device: Device to run on
+        whisper_profile: Whisper decoding profile instead of the configured one
+
+    Returns:
+        Loaded backend
+    """
+    model_type = model_type.lower()
+
+    if model_type == "whisper":
+        from .models.whisper_model import WhisperTranscriber
+
+        whisper = config.whisper
+        backend = WhisperTranscriber(
+            model_size=size,
+            device=device,
+            language=config.model.language,
+            profile=whisper_profile or whisper.profile,
+            profiles=whisper.profiles,
+            adaptive_threshold=whisper.adaptive_threshold_seconds,
+            compute_type=whisper.compute_type,
+            cpu_threads=whisper.cpu_threads,
+            num_workers=whisper.num_workers
+        )
+
+    elif model_type == "parakeet":
+        from .models.parakeet_model import ParakeetTranscriber
+
+        backend = ParakeetTranscriber(
+            model_name=parakeet_model_name(size),
+            device=device,
+            language=config.model.language
+        )
+
+    else:
+        raise ValueError(
+            f"Unknown model type: {model_type}. "
+            "Supported types: whisper, parakeet"
+        )
+
+    if not backend.is_ready():
+        raise RuntimeError(f"Failed to initialize {model_type} model")
+    return backend
+
+
+def parakeet_model_name(size: str) -> str:
+    """Get Parakeet model name from size specification.
+
+    Args:
+        size: Model size or full name
+
+    Returns:
+        Full Hugging Face model name
+    """
+    return PARAKEET_MODELS.get(size.lower(), "nvidia/parakeet-tdt-0.6b-v3")
+
+
+def create_router(config: Config) -> Optional[ModelRouter]:
+    """Create the model router, without backends (see load_router_backends).
+
+    Returns:
+        Router, or None if routing is disabled
+    """
+    router = config.router
+    if not router.enabled:
+        return None
+    return ModelRouter(
+        latency_budget=router.latency_budget,
+        short_clip_seconds=router.short_clip_seconds,
+        ewma_alpha=router.ewma_alpha,
+        default_rtf=router.default_rtf,
+        rtf_decay=router.rtf_decay,
+        decision_log=router.decision_log or None
+    )
+
+
+def load_router_backends(config: Config, router: ModelRouter) -> None:
+    """Load the configured routed backends into the router.
+
+    Raises:
+        ValueError: If no backends are configured
+    """
+    model = config.model
+    for entry in config.router.backends:
+        model_type = entry.get('type', model.type)
+        size = entry.get('size', model.size)
+        name = entry.get('name', f"{model_type}-{size}")
+        logger.info(f"Initializing routed model {name}")
+        router.add_backend(name, create_backend(
+            config,
+            model_type,
+            size,
+            entry.get('device', model.device),
+            whisper_profile=entry.get('profile')
+        ), rtf=entry.get('rtf'))
+    if not router.backends:
+        raise ValueError("Model router is enabled but no backends are configured")
+    logger.info(f"Model router initialized with {len(router.backends)} backends")
+
+
+def load_models(config: Config, router: Optional[ModelRouter] = None) -> tuple:
+    """Load the configured model and, for two-pass decoding, the draft model.
+
+    Args:
+        config: Application configuration
+        router: Router to load the routed backends into and use as the model
+
+    Returns:
+        (model, draft model or None)
+    """
+    model = config.model
+    if router is not None:
+        load_router_backends(config, router)
+        main = router
+    else:
+        logger.info(f"Initializing transcription model: {model.type.lower()}")
+        main = create_backend(config, model.type, model.size, model.device)
+        logger.info("Transcription model initialized successfully")
+
+    draft = None
+    refine = config.refine
+    if refine.enabled:
+        logger.info(f"Initializing draft model: {refine.draft_type} {refine.draft_size}")
+        draft = create_backend(
+            config,
+            refine.draft_type,
+            refine.draft_size,
+            refine.draft_device,
+            whisper_profile=refine.draft_profile
+        )
+    return main, draft
+
+
+def create_cache(config: Config) -> Optional[TranscriptCache]:
+    """Create the transcript cache, or None if caching is disabled."""
+    cache = config.cache
+    if not cache.enabled:
+        return None
+    return TranscriptCache(
+        max_entries=cache.max_entries,
+        disk_dir=cache.disk_dir if cache.disk else None,
+        disk_max_mb=cache.disk_max_mb
+    )
+
+
+def cache_key(config: Config, audio_data: np.ndarray, kind: str = 'text', routed: bool = False) -> str:
+    """Fingerprint model-rate audio with the settings that shape its transcript.
+
+    Args:
+        config: Application configuration
+        audio_data: Audio at 16kHz
+        kind: Result type stored under the key
+        routed: Whether the model router picks the backend
+
+    Returns:
+        Cache key
+    """
+    model = config.model
+    params = f"{kind}|{model.type}|{model.size}|{model.language}"
+    if model.type.lower() == "whisper":
+        # Decoding profiles and compute type change the transcript too
+        params += "|" + json.dumps(asdict(config.whisper), sort_keys=True)
+    if routed:
+        # The routed backend depends on load, so key on the whole backend set
+        params += "|router|" + json.dumps(
+            [config.router.backends, asdict(config.whisper)], sort_keys=True
+        )
+    return audio_fingerprint(audio_data, params)
+
+
+def warmup_clip(seconds: float, sample_rate: int = 16000) -> np.ndarray:
+    """Create a speech-like clip for warming up a model.
+
+    Syllable-rate modulated harmonics, so voice activity filters (e.g. the
+    one in faster-whisper) pass it on and the decoder runs as well.
+
+    Returns:
+        float32 audio in [-1, 1]
+    """
+    t = np.arange(int(seconds * sample_rate), dtype=np.float32) / sample_rate
+    envelope = np.clip(np.sin(2 * np.pi * 2.5 * t), 0, None)
+    voice = sum(np.sin(2 * np.pi * f * t) / (i + 1) for i, f in enumerate((150, 300, 450, 900)))
+    return (0.25 * envelope * voice).astype(np.float32)
+
+
+def run_warmup(
+    decode: Callable[[np.ndarray], object],
+    durations: Optional[list[float]] = None
+) -> dict[float, float]:
+    """Decode a warm-up clip of each length, logging failures.
+
+    Args:
+        decode: Runs a 16kHz clip through the backends
+        durations: Clip lengths in seconds, one per input-length bucket
+
+    Returns:
+        Seconds spent on each clip length
+    """
+    timings = {}
+    for seconds in durations or DEFAULT_WARMUP_SECONDS:
+        start = time.perf_counter()
+        try:
+            decode(warmup_clip(seconds))
+        except Exception as e:
+            logger.warning(f"Warm-up with {seconds:.1f}s clip failed: {e}")
+            continue
+        timings[seconds] = time.perf_counter() - start
+
+    summary = ", ".join(f"{s:.1f}s: {t * 1000:.0f}ms" for s, t in timings.items())
+    logger.info(f"Model warm-up complete ({summary})")
+    return timings
@@ -0,0 +1,277 @@
+"""Batch transcription of audio files (``python -m src.main transcribe``).
+
+Files are decoded and resampled on a background thread while the model
+works on the previous ones. Whisper transcribes each file with its batched
+long-form pipeline; other backends get the audio cut into windows at quiet
+points, and windows from consecutive files are decoded together in batches.
+"""
+
+import argparse
+import json
+import logging
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from multiprocessing import get_context
+from pathlib import Path
+from typing import Iterator, Optional
+
+import numpy as np
+
+from .audio_io import find_audio_files, load_audio
+from .config import Config
+from .transcriber import Transcriber
+from .vad import EnergyVAD
+
+
+logger = logging.getLogger(__name__)
+
+SAMPLE_RATE = 16000
+
+# Windows are cut at the quietest frame within this last fraction of a window
+CUT_SEARCH_FRACTION = 0.2
+
+
+@dataclass
+class FileResult:
+    """Transcript of one file."""
+    path: str
+    duration: float
+    segments: list = field(default_factory=list)  # (start, end, text) tuples
+    seconds: float = 0.0
+    error: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """Full transcript."""
+        return " ".join(text for _, _, text in self.segments if text)
+
+    def to_json(self) -> str:
+        """Serialize as one JSONL record."""
+        record = asdict(self)
+        record['text'] = self.text
+        record['segments'] = [
+            {'start': round(start, 3), 'end': round(end, 3), 'text': text}
+            for start, end, text in self.segments
+        ]
+        return json.dumps(record, ensure_ascii=False)
+
+
+def split_windows(audio: np.ndarray, window_seconds: float, vad: EnergyVAD) -> list[tuple[int, int]]:
+    """Cut audio into windows of at most ``window_seconds``, at quiet points.
+
+    Returns:
+        (start, end) sample ranges covering the audio
+    """
+    window = int(window_seconds * SAMPLE_RATE)
+    frame = max(int(SAMPLE_RATE * vad.frame_ms / 1000), 1)
+    levels = vad.frame_levels(audio, SAMPLE_RATE)
+
+    ranges = []
+    start = 0
+    while len(audio) - start > window:
+        search_from = (start + int(window * (1 - CUT_SEARCH_FRACTION))) // frame
+        search_to = (start + window) // frame
+        candidates = levels[search_from:search_to]
+        cut = (search_from + int(np.argmin(candidates))) * frame if len(candidates) else start + window
+        ranges.append((start, cut))
+        start = cut
+    ranges.append((start, len(audio)))
+    return ranges
+
+
+def format_srt(result: FileResult) -> str:
+    """Render segments as SubRip subtitles."""
+    def timestamp(seconds: float) -> str:
+        millis = int(round(seconds * 1000))
+        hours, millis = divmod(millis, 3600000)
+        minutes, millis = divmod(millis, 60000)
+        secs, millis = divmod(millis, 1000)
+        return f"{hours:02d}:{minutes:02d}:{secs:02d},{millis:03d}"
+
+    cues = [
+        f"{index}\n{timestamp(start)} --> {timestamp(end)}\n{text}\n"
+        for index, (start, end, text) in enumerate(
+            (s for s in result.segments if s[2]), start=1
+        )
+    ]
+    return "\n".join(cues)
+
+
+def decode_files(paths: list[Path], prefetch: int = 2) -> Iterator[tuple[Path, object]]:
+    """Decode files on a background thread, a few files ahead of the consumer.
+
+    Yields:
+        (path, float32 audio at 16kHz) or (path, exception) on failure
+    """
+    def load(path: Path):
+        try:
+            return load_audio(path, SAMPLE_RATE)
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=1, thread_name_prefix="decoder") as pool:
+        futures = [pool.submit(load, path) for path in paths[:prefetch]]
+        for index, path in enumerate(paths):
+            if index + prefetch < len(paths):
+                futures.append(pool.submit(load, paths[index + prefetch]))
+            yield path, futures[index].result()
+            futures[index] = None
+
+
+class BatchTranscriber:
+    """Transcribes many files with one loaded model."""
+
+    def __init__(self, transcriber: Transcriber, batch_size: int = 8, window_seconds: float = 30.0):
+        """Initialize batch transcriber.
+
+        Args:
+            transcriber: Loaded transcriber
+            batch_size: Windows decoded per forward pass
+            window_seconds: Longest window for backends without long-form support
+        """
+        self.transcriber = transcriber
+        self.batch_size = batch_size
+        self.window_seconds = window_seconds
+        self.vad = EnergyVAD()
+
+    def run(self, paths: list[Path]) -> Iterator[FileResult]:
+        """Transcribe files in order.
+
+        Yields:
+            One result per file, in input order
+        """
+        pending: list[tuple[FileResult, float]] = []
+        batch: list[tuple[FileResult, int, np.ndarray]] = []
+
+        for path, audio in decode_files(paths):
+            if isinstance(audio, Exception):
+                pending.append((FileResult(str(path), 0.0, error=str(audio)), time.perf_counter()))
+                yield from self._completed(pending)
+                continue
+
+            started = time.perf_counter()
+            result = FileResult(str(path), round(len(audio) / SAMPLE_RATE, 3))
+            segments = self.transcriber.transcribe_segments(audio, SAMPLE_RATE, self.batch_size)
+            if segments is not None:
+                result.segments = segments
+                result.seconds = round(time.perf_counter() - started, 3)
+                pending.append((result, started))
+                yield from self._completed(pending)
+                continue
+
+            ranges = split_windows(audio, self.window_seconds, self.vad)
+            result.segments = [None] * len(ranges)
+            pending.append((result, started))
+            for index, (start, end) in enumerate(ranges):
+                batch.append((result, index, audio[start:end]))
+                result.segments[index] = (start / SAMPLE_RATE, end / SAMPLE_RATE, None)
+                if len(batch) >= self.batch_size:
+                    self._flush(batch)
+            yield from self._completed(pending)
+
+        self._flush(batch)
+        yield from self._completed(pending)
+
+    def _flush(self, batch: list) -> None:
+        """Decode the collected windows in one batch."""
+        if not batch:
+            return
+        texts = self.transcriber.transcribe_batch([audio for _, _, audio in batch], SAMPLE_RATE)
+        for (result, index, _), text in zip(batch, texts):
+            start, end, _ = result.segments[index]
+            result.segments[index] = (start, end, text)
+        batch.clear()
+
+    @staticmethod
+    def _completed(pending: list) -> Iterator[FileResult]:
+        """Yield finished results from the front of the queue."""
+        while pending and all(s is not None and s[2] is not None for s in pending[0][0].segments):
+            result, started = pending.pop(0)
+            if result.error is None:
+                result.seconds = round(time.perf_counter() - started, 3)
+            yield result
+
+
+# Per-process state for the process pool
+_worker: Optional[BatchTranscriber] = None
+
+
+def _init_worker(config_path: Optional[Path], batch_size: int, window_seconds: float) -> None:
+    """Load the model once in each worker process."""
+    global _worker
+    config = Config(config_path)
+    config.model.warmup = False
+    _worker = BatchTranscriber(Transcriber(config), batch_size, window_seconds)
+
+
+def _transcribe_in_worker(path: Path) -> FileResult:
+    """Transcribe one file in a worker process."""
+    return next(_worker.run([path]))
+
+
+def transcribe_files(args: argparse.Namespace) -> Iterator[FileResult]:
+    """Transcribe the files named on the command line.
+
+    Yields:
+        One result per file, in input order
+    """
+    paths = find_audio_files(args.inputs)
+    logger.info(f"Transcribing {len(paths)} files")
+    if args.workers > 1:
+        # Spawned workers each load their own model, so CPU-only machines
+        # can use all cores; results keep the input order
+        with ProcessPoolExecutor(
+            max_workers=args.workers,
+            mp_context=get_context('spawn'),
+            initializer=_init_worker,
+            initargs=(args.config, args.batch_size, args.window_seconds)
+        ) as pool:
+            yield from pool.map(_transcribe_in_worker, paths)
+        return
+
+    config = Config(args.config)
+    config.model.warmup = False
+    yield from BatchTranscriber(Transcriber(config), args.batch_size, args.window_seconds).run(paths)
+
+
+def add_arguments(parser: argparse.ArgumentParser) -> None:
+    """Register the ``transcribe`` subcommand's arguments."""
+    parser.add_argument('inputs', nargs='+', type=Path, help="audio files or directories")
+    parser.add_argument('--output', '-o', type=Path, help="JSONL output file (default: stdout)")
+    parser.add_argument('--srt-dir', type=Path, help="also write one .srt file per input here")
+    parser.add_argument('--batch-size', type=int, default=8, help="windows per forward pass")
+    parser.add_argument('--window-seconds', type=float, default=30.0,
+                        help="longest window when the backend has no long-form API")
+    parser.add_argument('--workers', type=int, default=1,
+                        help="worker processes, each with its own model (CPU-only machines)")
+
+
+def run_cli(args: argparse.Namespace) -> None:
+    """Run batch transcription and write JSONL/SRT output."""
+    logging.basicConfig(
+        level=logging.WARNING,
+        stream=sys.stderr,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    output = open(args.output, 'w', encoding='utf-8') if args.output else sys.stdout
+    if args.srt_dir:
+        args.srt_dir.mkdir(parents=True, exist_ok=True)
+
+    failures = 0
+    try:
+        for result in transcribe_files(args):
+            output.write(result.to_json() + "\n")
+            output.flush()
+            if result.error:
+                failures += 1
+                print(f"{result.path}: {result.error}", file=sys.stderr)
+            elif args.srt_dir:
+                srt_path = args.srt_dir / (Path(result.path).stem + ".srt")
+                srt_path.write_text(format_srt(result), encoding='utf-8')
+    finally:
+        if args.output:
+            output.close()
+    if failures:
+        sys.exit(1)
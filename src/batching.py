@@ -0,0 +1,251 @@
+"""Micro-batching of concurrent transcription requests.
+
+Requests that arrive within a short window are grouped by similar length
+and decoded in one batched forward pass, so padding stays small and
+throughput grows with load instead of serialising single utterances.
+"""
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .cancellation import CancelToken, TranscriptionCancelled
+from .metrics import REGISTRY
+from .resampler import resample_like
+
+
+logger = logging.getLogger(__name__)
+
+BATCHES = REGISTRY.counter(
+    "wispr_batches_total", "Batched forward passes dispatched by the micro-batcher"
+)
+BATCHED_REQUESTS = REGISTRY.counter(
+    "wispr_batched_requests_total", "Requests decoded by the micro-batcher"
+)
+
+
+@dataclass
+class _Request:
+    """A clip waiting to be batched."""
+    audio: np.ndarray
+    token: Optional[CancelToken] = None
+    future: Future = field(default_factory=Future)
+    arrived: float = field(default_factory=time.monotonic)
+
+
+def select_bucket(requests: list, max_batch_size: int, bucket_ratio: float) -> list:
+    """Pick the requests to decode together.
+
+    Starts from the oldest request and adds the closest lengths around it
+    while the longest clip stays within ``bucket_ratio`` of the shortest.
+
+    Args:
+        requests: Pending requests, oldest first
+        max_batch_size: Most clips per batch
+        bucket_ratio: Longest/shortest length allowed in one batch
+
+    Returns:
+        Requests for the next batch
+    """
+    anchor = requests[0]
+    by_distance = sorted(requests[1:], key=lambda r: abs(len(r.audio) - len(anchor.audio)))
+    batch = [anchor]
+    shortest = longest = max(len(anchor.audio), 1)
+    for request in by_distance:
+        if len(batch) >= max_batch_size:
+            break
+        length = max(len(request.audio), 1)
+        if max(longest, length) <= bucket_ratio * min(shortest, length):
+            batch.append(request)
+            shortest, longest = min(shortest, length), max(longest, length)
+    return batch
+
+
+class MicroBatcher:
+    """Transcriber front-end that batches concurrent requests.
+
+    Has the same ``transcribe`` interface as ``Transcriber``; calls block
+    until their batch has been decoded.
+    """
+
+    def __init__(
+        self,
+        transcriber,
+        max_batch_size: int = 8,
+        max_wait: float = 0.01,
+        bucket_ratio: float = 1.5
+    ):
+        """Initialize micro-batcher.
+
+        Args:
+            transcriber: Transcriber with ``transcribe_batch(clips, rate, token=None)``
+            max_batch_size: Most clips decoded in one forward pass
+            max_wait: Seconds the oldest request may wait for companions
+            bucket_ratio: Longest/shortest clip length allowed in one batch
+        """
+        self.transcriber = transcriber
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.bucket_ratio = bucket_ratio
+        self._pending: list[_Request] = []
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the dispatch thread."""
+        self._stopping = False
+        self._worker = threading.Thread(target=self._run, name="micro-batcher", daemon=True)
+        self._worker.start()
+
+    def stop(self) -> None:
+        """Decode what is pending, then stop the dispatch thread."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def submit(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> Future:
+        """Queue a clip for the next suitable batch.
+
+        Args:
+            audio_data: Audio (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate of the audio
+            token: Cancellation token; cancelled clips are left out of batches
+
+        Returns:
+            Future resolving to the transcribed text
+        """
+        if sample_rate != 16000:
+            audio_data = resample_like(audio_data, sample_rate, 16000)
+        request = _Request(audio_data, token)
+        if len(audio_data) == 0:
+            request.future.set_result("")
+            return request.future
+        with self._cond:
+            if self._worker is None:
+                raise RuntimeError("MicroBatcher is not running")
+            self._pending.append(request)
+            self._cond.notify()
+        return request.future
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe a clip, batched with concurrent requests."""
+        if token is not None:
+            token.check()
+        return self.submit(audio_data, sample_rate, token).result()
+
+    @property
+    def has_draft(self) -> bool:
+        """Whether the underlying transcriber has a draft model."""
+        return getattr(self.transcriber, 'has_draft', False)
+
+    def transcribe_draft(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe a clip with the draft model (drafts are not batched)."""
+        return self.transcriber.transcribe_draft(audio_data, sample_rate, token=token)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the underlying model to load."""
+        return self.transcriber.wait_until_ready(timeout)
+
+    def is_ready(self) -> bool:
+        """Check if the underlying model is ready."""
+        return self.transcriber.is_ready()
+
+    def _next_batch(self) -> Optional[list[_Request]]:
+        """Wait for a full batch or for the oldest request's deadline."""
+        with self._cond:
+            while True:
+                if self._pending:
+                    deadline = self._pending[0].arrived + self.max_wait
+                    remaining = deadline - time.monotonic()
+                    if len(self._pending) >= self.max_batch_size or remaining <= 0 or self._stopping:
+                        batch = select_bucket(self._pending, self.max_batch_size, self.bucket_ratio)
+                        chosen = {id(r) for r in batch}
+                        self._pending = [r for r in self._pending if id(r) not in chosen]
+                        return batch
+                    self._cond.wait(remaining)
+                elif self._stopping:
+                    return None
+                else:
+                    self._cond.wait()
+
+    @staticmethod
+    def _batch_token(batch: list[_Request]) -> Optional[CancelToken]:
+        """Token carrying the tightest deadline of the batch (None if none has one).
+
+        The batch is decoded in one pass, so it has to finish by the earliest
+        deadline; the backend also caps its decode length by it.
+        """
+        deadlines = [
+            r.token.deadline for r in batch if r.token is not None and r.token.deadline is not None
+        ]
+        if not deadlines:
+            return None
+        token = CancelToken()
+        token.deadline = min(deadlines)
+        return token
+
+    @staticmethod
+    def _drop_cancelled(batch: list[_Request]) -> list[_Request]:
+        """Fail cancelled requests instead of decoding them."""
+        live = []
+        for request in batch:
+            if request.token is not None and request.token.cancelled:
+                request.future.set_exception(TranscriptionCancelled(request.token.reason))
+            else:
+                live.append(request)
+        return live
+
+    def _run(self) -> None:
+        """Dispatch loop."""
+        while True:
+            batch = self._next_batch()
+            if batch is None:
+                return
+            batch = self._drop_cancelled(batch)
+            if not batch:
+                continue
+            try:
+                texts = self.transcriber.transcribe_batch(
+                    [r.audio for r in batch], 16000, token=self._batch_token(batch)
+                )
+            except TranscriptionCancelled as e:
+                logger.info(f"Batched transcription of {len(batch)} clips cancelled: {e}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+            except Exception as e:
+                logger.error(f"Batched transcription of {len(batch)} clips failed: {e}")
+                for request in batch:
+                    request.future.set_exception(e)
+                continue
+
+            BATCHES.inc()
+            BATCHED_REQUESTS.inc(len(batch))
+            if len(batch) > 1:
+                logger.debug(f"Decoded {len(batch)} clips in one batch")
+            for request, text in zip(batch, texts):
+                request.future.set_result(text)
@@ -0,0 +1,151 @@
+"""Content-addressed cache of transcripts.
+
+Keys hash the model-rate PCM together with everything that affects the
+output (model type, size, language, decoding settings), so identical audio
+decoded with identical settings is only transcribed once. Entries live in
+an in-memory LRU and, optionally, in a size-bounded directory on disk.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+CACHE_LOOKUPS = REGISTRY.counter(
+    "wispr_cache_lookups_total", "Transcript cache lookups by result (memory, disk, miss)"
+)
+
+# Disk usage is trimmed to this fraction of the limit when it overflows
+DISK_TRIM_RATIO = 0.9
+
+
+def audio_fingerprint(audio: np.ndarray, params: str) -> str:
+    """Hash audio samples together with the settings that shape the transcript.
+
+    Args:
+        audio: Audio at the model sample rate
+        params: Model and decoding settings
+
+    Returns:
+        Hex digest
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(params.encode())
+    digest.update(str(audio.dtype).encode())
+    digest.update(np.ascontiguousarray(audio).tobytes())
+    return digest.hexdigest()
+
+
+class TranscriptCache:
+    """Two-tier (memory LRU + optional disk) transcript cache."""
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        disk_dir: Optional[Path] = None,
+        disk_max_mb: float = 50.0
+    ):
+        """Initialize cache.
+
+        Args:
+            max_entries: Transcripts kept in memory
+            disk_dir: Directory for the disk tier (None disables it)
+            disk_max_mb: Disk tier size limit in megabytes
+        """
+        self.max_entries = max_entries
+        self.disk_dir = Path(os.path.expanduser(disk_dir)) if disk_dir else None
+        self.disk_max_bytes = int(disk_max_mb * 1024 * 1024)
+        self._memory: OrderedDict[str, str] = OrderedDict()
+        self._disk_bytes = 0
+        self._lock = threading.Lock()
+
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+            self._disk_bytes = sum(f.stat().st_size for f in self.disk_dir.glob('*/*.txt'))
+
+    def _path(self, key: str) -> Path:
+        """Disk location of an entry."""
+        return self.disk_dir / key[:2] / f"{key}.txt"
+
+    def get(self, key: str) -> Optional[str]:
+        """Look up a transcript.
+
+        Returns:
+            Cached text, or None on a miss
+        """
+        with self._lock:
+            if key in self._memory:
+                self._memory.move_to_end(key)
+                CACHE_LOOKUPS.inc(result='memory')
+                return self._memory[key]
+
+        if self.disk_dir is not None:
+            path = self._path(key)
+            try:
+                text = path.read_text(encoding='utf-8')
+                os.utime(path)  # Recently used entries survive eviction
+            except OSError:
+                pass
+            else:
+                self._remember(key, text)
+                CACHE_LOOKUPS.inc(result='disk')
+                return text
+
+        CACHE_LOOKUPS.inc(result='miss')
+        return None
+
+    def put(self, key: str, text: str) -> None:
+        """Store a transcript in both tiers."""
+        self._remember(key, text)
+        if self.disk_dir is None:
+            return
+        path = self._path(key)
+        try:
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(text, encoding='utf-8')
+            with self._lock:
+                # Rewriting an entry replaces its bytes rather than adding to them
+                try:
+                    replaced = path.stat().st_size
+                except FileNotFoundError:
+                    replaced = 0
+                tmp.replace(path)
+                self._disk_bytes += path.stat().st_size - replaced
+                if self._disk_bytes > self.disk_max_bytes:
+                    self._evict_disk()
+        except OSError as e:
+            logger.warning(f"Failed to write transcript cache entry: {e}")
+
+    def _remember(self, key: str, text: str) -> None:
+        """Insert into the memory LRU."""
+        with self._lock:
+            self._memory[key] = text
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_entries:
+                self._memory.popitem(last=False)
+
+    def _evict_disk(self) -> None:
+        """Delete least recently used disk entries until under the limit."""
+        entries = sorted(
+            (f.stat().st_mtime, f.stat().st_size, f) for f in self.disk_dir.glob('*/*.txt')
+        )
+        total = sum(size for _, size, _ in entries)
+        target = self.disk_max_bytes * DISK_TRIM_RATIO
+        for _, size, path in entries:
+            if total <= target:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+        self._disk_bytes = total
+        logger.debug(f"Transcript cache trimmed to {total / 1024:.0f} KB")
@@ -0,0 +1,59 @@
+"""Cancellation tokens for in-flight transcriptions.
+
+A token travels with a dictation through the pipeline. Whoever wants the
+work stopped (a newer recording, shutdown) cancels it; the work checks it
+at safe points (before inference, between decoded segments, before
+injection) and stops with ``TranscriptionCancelled``. A token can also carry
+a deadline, which aborts runaway decodes such as repetition loops.
+"""
+
+import threading
+import time
+from typing import Optional
+
+
+class TranscriptionCancelled(Exception):
+    """The transcription was cancelled or ran past its deadline."""
+
+
+class CancelToken:
+    """Cooperative cancellation flag with an optional deadline."""
+
+    def __init__(self):
+        """Initialize an uncancelled token without a deadline."""
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+        self.deadline: Optional[float] = None  # time.monotonic() value
+
+    def cancel(self, reason: str = "cancelled") -> None:
+        """Request cancellation.
+
+        Args:
+            reason: Why the work is no longer wanted (for logs)
+        """
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def set_deadline(self, seconds: float) -> None:
+        """Allow the work to run for at most ``seconds`` from now."""
+        self.deadline = time.monotonic() + seconds
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the work should stop (cancelled or past its deadline)."""
+        if self._event.is_set():
+            return True
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.cancel("deadline exceeded")
+            return True
+        return False
+
+    def check(self) -> None:
+        """Raise if the work should stop.
+
+        Raises:
+            TranscriptionCancelled: If cancelled or past the deadline
+        """
+        if self.cancelled:
+            raise TranscriptionCancelled(self.reason)
@@ -0,0 +1,221 @@
+"""Client for the transcription daemon, usable as a library or CLI.
+
+Usage:
+    python -m src.client status
+    python -m src.client transcribe recording.wav
+    python -m src.client start        # start capturing from the microphone
+    python -m src.client stop         # stop capturing and print the text
+    python -m src.client reload
+    python -m src.client shutdown
+"""
+
+import argparse
+import json
+import logging
+import socket
+import sys
+import threading
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .cancellation import CancelToken
+from .ipc import default_socket_path, encode_audio, read_message, write_message
+
+
+logger = logging.getLogger(__name__)
+
+
+class DaemonError(RuntimeError):
+    """The daemon could not be reached or rejected a request."""
+
+
+class DaemonClient:
+    """Sends requests to the daemon over one reused socket connection."""
+
+    def __init__(self, socket_path: Optional[Path] = None, timeout: float = 30.0):
+        """Initialize client (connects on first request).
+
+        Args:
+            socket_path: Daemon socket, defaults to the per-user path
+            timeout: Seconds to wait for a response
+        """
+        self.socket_path = Path(socket_path or default_socket_path())
+        self.timeout = timeout
+        self._socket: Optional[socket.socket] = None
+        self._stream = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> None:
+        """Open the connection."""
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        try:
+            sock.connect(str(self.socket_path))
+        except OSError as e:
+            sock.close()
+            raise DaemonError(f"Daemon not reachable at {self.socket_path}: {e}")
+        self._socket = sock
+        self._stream = sock.makefile('rwb')
+
+    def request(self, cmd: str, **params) -> dict:
+        """Send a command and wait for its response.
+
+        Args:
+            cmd: Command name
+            **params: Command parameters
+
+        Returns:
+            Response fields
+
+        Raises:
+            DaemonError: If the daemon is unreachable, timed out or the
+                request failed
+        """
+        with self._lock:
+            # A stale connection (daemon restarted) is reset or closed without
+            # a response and retried once. A timeout or malformed response is
+            # not retried: the daemon may still be working on the request.
+            for attempt in range(2):
+                if self._socket is None:
+                    self._connect()
+                try:
+                    write_message(self._stream, {'cmd': cmd, **params})
+                    response = read_message(self._stream)
+                except ConnectionError as e:
+                    logger.debug(f"Daemon connection failed: {e}")
+                    response = None
+                except (OSError, ValueError) as e:
+                    self.close()
+                    raise DaemonError(f"Daemon request {cmd!r} failed: {e}")
+                if response is not None:
+                    break
+                self.close()
+            else:
+                raise DaemonError("Daemon closed the connection")
+
+        if not response.get('ok'):
+            raise DaemonError(response.get('error', 'request failed'))
+        return response
+
+    def is_available(self) -> bool:
+        """Check whether a daemon answers on the socket."""
+        try:
+            self.request('status')
+            return True
+        except DaemonError:
+            return False
+
+    def transcribe(self, audio: np.ndarray, sample_rate: int) -> str:
+        """Transcribe an audio buffer with the daemon's model."""
+        return self.request('transcribe', **encode_audio(audio, sample_rate))['text']
+
+    def transcribe_draft(self, audio: np.ndarray, sample_rate: int) -> str:
+        """Transcribe an audio buffer with the daemon's draft model."""
+        return self.request('transcribe_draft', **encode_audio(audio, sample_rate))['text']
+
+    def close(self) -> None:
+        """Close the connection."""
+        if self._socket is not None:
+            try:
+                self._stream.close()
+                self._socket.close()
+            except OSError:
+                pass
+            self._socket = None
+            self._stream = None
+
+
+class RemoteTranscriber:
+    """Transcriber interface backed by the daemon's resident model."""
+
+    def __init__(self, client: DaemonClient, status: Optional[dict] = None):
+        """Initialize remote transcriber.
+
+        Args:
+            client: Connected daemon client
+            status: Daemon status already fetched by the caller (requested if None)
+        """
+        self.client = client
+        self.model_key: Optional[str] = None
+        self.has_draft = False
+        if status is None:
+            try:
+                status = client.request('status')
+            except DaemonError:
+                status = {}
+        self._update(status)
+
+    def _update(self, status: dict) -> None:
+        """Cache the daemon's model fingerprint and draft support."""
+        model_key = status.get('model_key')
+        if self.model_key is not None and model_key != self.model_key:
+            logger.warning("Model daemon now runs a different model configuration")
+        self.model_key = model_key
+        self.has_draft = bool(status.get('draft'))
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe audio in the daemon (a cancelled token skips the request)."""
+        if token is not None:
+            token.check()
+        return self.client.transcribe(audio_data, sample_rate)
+
+    def transcribe_draft(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe audio with the daemon's draft model."""
+        if token is not None:
+            token.check()
+        return self.client.transcribe_draft(audio_data, sample_rate)
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """The daemon queues requests until its model is ready."""
+        return True
+
+    def is_ready(self) -> bool:
+        """Check whether the daemon's model is loaded."""
+        try:
+            status = self.client.request('status')
+        except DaemonError:
+            return False
+        self._update(status)
+        return bool(status['ready'])
+
+
+def main() -> None:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Wispr-Flow daemon client")
+    parser.add_argument('--socket', type=Path, default=None, help="daemon socket path")
+    parser.add_argument('command', choices=('status', 'transcribe', 'start', 'stop', 'reload', 'shutdown'))
+    parser.add_argument('files', nargs='*', type=Path, help="audio files to transcribe")
+    args = parser.parse_args()
+
+    client = DaemonClient(args.socket, timeout=600)
+    try:
+        if args.command == 'status':
+            print(json.dumps(client.request('status'), indent=2))
+        elif args.command == 'transcribe':
+            for path in args.files:
+                print(client.request('transcribe', path=str(path.resolve()))['text'])
+        elif args.command == 'start':
+            client.request('start_capture')
+        elif args.command == 'stop':
+            print(client.request('stop_capture')['text'])
+        else:
+            print(json.dumps(client.request(args.command)))
+    except DaemonError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Building the application's components from the configuration."""
+
+from typing import Optional
+
+from .batching import MicroBatcher
+from .config import Config
+from .text_injector import TextInjector
+from .vad import EnergyVAD
+
+
+def create_vad(config: Config) -> Optional[EnergyVAD]:
+    """Create the voice activity detector if enabled.
+
+    Returns:
+        Configured EnergyVAD, or None when VAD trimming is disabled
+    """
+    vad = config.vad
+    if not vad.enabled:
+        return None
+    return EnergyVAD(
+        threshold_db=vad.threshold_db,
+        noise_margin_db=vad.noise_margin_db,
+        frame_ms=vad.frame_ms,
+        padding_ms=vad.padding_ms,
+        min_speech_seconds=config.app.min_audio_length,
+        max_adaptive_threshold_db=vad.max_adaptive_threshold_db
+    )
+
+
+def endpointer_options(config: Config) -> dict:
+    """Keyword arguments for the hands-free VADEndpointer."""
+    return dict(
+        threshold_db=config.vad.threshold_db,
+        max_adaptive_threshold_db=config.vad.max_adaptive_threshold_db,
+        noise_margin_db=config.vad.noise_margin_db,
+        frame_ms=config.vad.frame_ms,
+        padding_ms=config.vad.padding_ms,
+        silence_ms=config.continuous.silence_ms,
+        min_speech_ms=config.continuous.min_speech_ms,
+        max_segment_seconds=config.continuous.max_segment_seconds
+    )
+
+
+def create_batcher(config: Config, transcriber) -> Optional[MicroBatcher]:
+    """Wrap a transcriber in a micro-batcher if batching is enabled.
+
+    Returns:
+        MicroBatcher (not started), or None when batching is disabled
+    """
+    batching = config.batching
+    if not batching.enabled:
+        return None
+    return MicroBatcher(
+        transcriber,
+        max_batch_size=batching.max_batch_size,
+        max_wait=batching.max_wait_ms / 1000,
+        bucket_ratio=batching.bucket_ratio
+    )
+
+
+def create_audio_recorder(config: Config):
+    """Create the microphone recorder with all configured audio options."""
+    # Imported here so headless users (daemon, batch CLI) don't need PyAudio
+    from .audio_recorder import AudioRecorder
+
+    audio = config.audio
+    return AudioRecorder(
+        sample_rate=audio.sample_rate,
+        channels=audio.channels,
+        chunk_size=audio.chunk_size,
+        device_index=audio.device_index,
+        max_duration=audio.max_duration,
+        persistent_stream=audio.persistent_stream,
+        preroll_ms=audio.preroll_ms,
+        device_check_interval=audio.device_check_interval,
+        preprocess=audio.preprocess_in_callback
+    )
+
+
+def create_text_injector(config: Config) -> TextInjector:
+    """Create the text injector with the configured strategies."""
+    injection = config.injection
+    return TextInjector(
+        strategy=injection.strategy,
+        typing_delay=injection.typing_delay_ms,
+        paste_min_length=injection.paste_min_length,
+        restore_clipboard=injection.restore_clipboard,
+        restore_delay=injection.restore_delay,
+        terminal_classes=injection.terminal_classes,
+        window_strategies=injection.window_strategies
+    )
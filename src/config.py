@@ -4,41 +4,12 @@ import os
 import yaml
 from pathlib import Path
 from typing import Any, Dict, Optional
-from dataclasses import dataclass, field
 
-
-@dataclass
-class ModelConfig:
-    """Model configuration."""
-    type: str = "whisper"
-    size: str = "base"
-    device: str = "cpu"
-    language: str = "en"
-
-
-@dataclass
-class HotkeyConfig:
-    """Hotkey configuration."""
-    modifiers: list[str] = field(default_factory=lambda: ["ctrl", "alt"])
-    key: str = ""
-
-
-@dataclass
-class AudioConfig:
-    """Audio recording configuration."""
-    sample_rate: int = 16000
-    channels: int = 1
-    chunk_size: int = 1024
-    format: str = "int16"
-    device_index: Optional[int] = None
-
-
-@dataclass
-class AppConfig:
-    """Application configuration."""
-    debug: bool = False
-    min_audio_length: float = 0.3
-    show_notifications: bool = False
+from .config_types import (
+    ModelConfig, WhisperConfig, RefineConfig, RouterConfig, HotkeyConfig, AudioConfig,
+    StreamingConfig, VADConfig, InjectionConfig, ContinuousConfig, PipelineConfig, InferenceConfig,
+    BatchingConfig, CacheConfig, MetricsConfig, DaemonConfig, AppConfig,
+)
 
 
 class Config:
@@ -62,8 +33,21 @@ class Config:
         
         # Initialize sub-configs
         self.model = self._init_model_config()
+        self.whisper = self._init_whisper_config()
+        self.refine = self._init_refine_config()
+        self.router = self._init_router_config()
         self.hotkey = self._init_hotkey_config()
         self.audio = self._init_audio_config()
+        self.streaming = self._init_streaming_config()
+        self.pipeline = self._init_pipeline_config()
+        self.continuous = self._init_continuous_config()
+        self.inference = self._init_inference_config()
+        self.batching = self._init_batching_config()
+        self.cache = self._init_cache_config()
+        self.injection = self._init_injection_config()
+        self.vad = self._init_vad_config()
+        self.metrics = self._init_metrics_config()
+        self.daemon = self._init_daemon_config()
         self.app = self._init_app_config()
     
     def _load_config(self) -> None:
@@ -81,7 +65,48 @@ class Config:
             type=model_data.get('type', 'whisper'),
             size=model_data.get('size', 'base'),
             device=model_data.get('device', 'cpu'),
-            language=model_data.get('language', 'en')
+            language=model_data.get('language', 'en'),
+            warmup=model_data.get('warmup', True),
+            warmup_seconds=model_data.get('warmup_seconds', [1.0, 4.0, 8.0])
+        )
+    
+    def _init_whisper_config(self) -> WhisperConfig:
+        """Initialize Whisper decoding configuration."""
+        whisper_data = self._config_data.get('whisper', {})
+        return WhisperConfig(
+            profile=whisper_data.get('profile', 'accurate'),
+            adaptive_threshold_seconds=whisper_data.get('adaptive_threshold_seconds', 5.0),
+            profiles=whisper_data.get('profiles') or {},
+            compute_type=whisper_data.get('compute_type', 'auto'),
+            cpu_threads=whisper_data.get('cpu_threads', 0),
+            num_workers=whisper_data.get('num_workers', 1)
+        )
+    
+    def _init_refine_config(self) -> RefineConfig:
+        """Initialize two-pass decoding configuration."""
+        refine_data = self._config_data.get('refine', {})
+        return RefineConfig(
+            enabled=refine_data.get('enabled', False),
+            draft_type=refine_data.get('draft_type', 'whisper'),
+            draft_size=refine_data.get('draft_size', 'tiny'),
+            draft_device=refine_data.get('draft_device', 'cpu'),
+            draft_profile=refine_data.get('draft_profile', 'fast'),
+            max_delay=refine_data.get('max_delay', 10.0),
+            max_change_ratio=refine_data.get('max_change_ratio', 1.0)
+        )
+    
+    def _init_router_config(self) -> RouterConfig:
+        """Initialize model routing configuration."""
+        router_data = self._config_data.get('router', {})
+        return RouterConfig(
+            enabled=router_data.get('enabled', False),
+            backends=router_data.get('backends') or [],
+            latency_budget=router_data.get('latency_budget', 1.0),
+            short_clip_seconds=router_data.get('short_clip_seconds', 2.0),
+            ewma_alpha=router_data.get('ewma_alpha', 0.3),
+            default_rtf=router_data.get('default_rtf', 0.5),
+            rtf_decay=router_data.get('rtf_decay', 0.05),
+            decision_log=router_data.get('decision_log', '')
         )
     
     def _init_hotkey_config(self) -> HotkeyConfig:
@@ -89,7 +114,11 @@ class Config:
         hotkey_data = self._config_data.get('hotkey', {})
         return HotkeyConfig(
             modifiers=hotkey_data.get('modifiers', ['ctrl', 'alt']),
-            key=hotkey_data.get('key', '')
+            key=hotkey_data.get('key', ''),
+            reinject_modifiers=hotkey_data.get('reinject_modifiers', ['super', 'alt']),
+            reinject_key=hotkey_data.get('reinject_key', ''),
+            continuous_modifiers=hotkey_data.get('continuous_modifiers', ['super', 'alt']),
+            continuous_key=hotkey_data.get('continuous_key', '')
         )
     
     def _init_audio_config(self) -> AudioConfig:
@@ -100,7 +129,118 @@ class Config:
             channels=audio_data.get('channels', 1),
             chunk_size=audio_data.get('chunk_size', 1024),
             format=audio_data.get('format', 'int16'),
-            device_index=audio_data.get('device_index')
+            device_index=audio_data.get('device_index'),
+            max_duration=audio_data.get('max_duration', 300.0),
+            persistent_stream=audio_data.get('persistent_stream', False),
+            preroll_ms=audio_data.get('preroll_ms', 300),
+            device_check_interval=audio_data.get('device_check_interval', 2.0),
+            preprocess_in_callback=audio_data.get('preprocess_in_callback', True)
+        )
+    
+    def _init_streaming_config(self) -> StreamingConfig:
+        """Initialize streaming configuration."""
+        streaming_data = self._config_data.get('streaming', {})
+        return StreamingConfig(
+            enabled=streaming_data.get('enabled', False),
+            window_seconds=streaming_data.get('window_seconds', 8.0),
+            step_seconds=streaming_data.get('step_seconds', 1.0),
+            overlap_seconds=streaming_data.get('overlap_seconds', 1.0),
+            live_injection=streaming_data.get('live_injection', False),
+            live_min_interval=streaming_data.get('live_min_interval', 0.15),
+            live_tentative=streaming_data.get('live_tentative', True)
+        )
+    
+    def _init_pipeline_config(self) -> PipelineConfig:
+        """Initialize pipeline configuration."""
+        pipeline_data = self._config_data.get('pipeline', {})
+        return PipelineConfig(
+            max_queue_size=pipeline_data.get('max_queue_size', 4),
+            preempt=pipeline_data.get('preempt', 'off'),
+            preempt_window=pipeline_data.get('preempt_window', 2.0),
+            deadline_seconds=pipeline_data.get('deadline_seconds', 30.0),
+            deadline_per_audio_second=pipeline_data.get('deadline_per_audio_second', 3.0)
+        )
+    
+    def _init_continuous_config(self) -> ContinuousConfig:
+        """Initialize continuous dictation configuration."""
+        continuous_data = self._config_data.get('continuous', {})
+        return ContinuousConfig(
+            silence_ms=continuous_data.get('silence_ms', 700),
+            min_speech_ms=continuous_data.get('min_speech_ms', 300),
+            max_segment_seconds=continuous_data.get('max_segment_seconds', 20.0)
+        )
+    
+    def _init_inference_config(self) -> InferenceConfig:
+        """Initialize inference process configuration."""
+        inference_data = self._config_data.get('inference', {})
+        return InferenceConfig(
+            separate_process=inference_data.get('separate_process', False),
+            buffer_seconds=inference_data.get('buffer_seconds', 30.0),
+            respawn_delay=inference_data.get('respawn_delay', 1.0)
+        )
+    
+    def _init_batching_config(self) -> BatchingConfig:
+        """Initialize micro-batching configuration."""
+        batching_data = self._config_data.get('batching', {})
+        return BatchingConfig(
+            enabled=batching_data.get('enabled', False),
+            max_batch_size=batching_data.get('max_batch_size', 8),
+            max_wait_ms=batching_data.get('max_wait_ms', 10.0),
+            bucket_ratio=batching_data.get('bucket_ratio', 1.5)
+        )
+    
+    def _init_cache_config(self) -> CacheConfig:
+        """Initialize transcript cache configuration."""
+        cache_data = self._config_data.get('cache', {})
+        return CacheConfig(
+            enabled=cache_data.get('enabled', True),
+            max_entries=cache_data.get('max_entries', 256),
+            disk=cache_data.get('disk', False),
+            disk_dir=cache_data.get('disk_dir', '~/.cache/wispr-flow/transcripts'),
+            disk_max_mb=cache_data.get('disk_max_mb', 50.0)
+        )
+    
+    def _init_injection_config(self) -> InjectionConfig:
+        """Initialize text injection configuration."""
+        injection_data = self._config_data.get('injection', {})
+        return InjectionConfig(
+            strategy=injection_data.get('strategy', 'auto'),
+            paste_min_length=injection_data.get('paste_min_length', 20),
+            typing_delay_ms=injection_data.get('typing_delay_ms', 12),
+            restore_clipboard=injection_data.get('restore_clipboard', True),
+            restore_delay=injection_data.get('restore_delay', 0.3),
+            terminal_classes=injection_data.get('terminal_classes'),
+            window_strategies=injection_data.get('window_strategies') or {}
+        )
+    
+    def _init_vad_config(self) -> VADConfig:
+        """Initialize VAD configuration."""
+        vad_data = self._config_data.get('vad', {})
+        return VADConfig(
+            enabled=vad_data.get('enabled', True),
+            threshold_db=vad_data.get('threshold_db', -45.0),
+            max_adaptive_threshold_db=vad_data.get('max_adaptive_threshold_db', -30.0),
+            noise_margin_db=vad_data.get('noise_margin_db', 10.0),
+            frame_ms=vad_data.get('frame_ms', 30),
+            padding_ms=vad_data.get('padding_ms', 200)
+        )
+    
+    def _init_metrics_config(self) -> MetricsConfig:
+        """Initialize metrics configuration."""
+        metrics_data = self._config_data.get('metrics', {})
+        return MetricsConfig(
+            enabled=metrics_data.get('enabled', False),
+            host=metrics_data.get('host', '127.0.0.1'),
+            port=metrics_data.get('port', 9464)
+        )
+    
+    def _init_daemon_config(self) -> DaemonConfig:
+        """Initialize daemon configuration."""
+        daemon_data = self._config_data.get('daemon', {})
+        return DaemonConfig(
+            use_daemon=daemon_data.get('use_daemon', False),
+            socket_path=daemon_data.get('socket_path') or "",
+            timeout=daemon_data.get('timeout', 30.0)
         )
     
     def _init_app_config(self) -> AppConfig:
@@ -0,0 +1,181 @@
+"""Configuration sections, as loaded by Config."""
+
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+
+
+@dataclass
+class ModelConfig:
+    """Model configuration."""
+    type: str = "whisper"
+    size: str = "base"
+    device: str = "cpu"
+    language: str = "en"
+    warmup: bool = True
+    warmup_seconds: list[float] = field(default_factory=lambda: [1.0, 4.0, 8.0])
+
+
+@dataclass
+class WhisperConfig:
+    """Whisper decoding and runtime configuration."""
+    profile: str = "accurate"
+    adaptive_threshold_seconds: float = 5.0
+    profiles: dict = field(default_factory=dict)
+    compute_type: str = "auto"
+    cpu_threads: int = 0
+    num_workers: int = 1
+
+
+@dataclass
+class RefineConfig:
+    """Two-pass draft/refine decoding configuration."""
+    enabled: bool = False
+    draft_type: str = "whisper"
+    draft_size: str = "tiny"
+    draft_device: str = "cpu"
+    draft_profile: str = "fast"
+    max_delay: float = 10.0
+    max_change_ratio: float = 1.0
+
+
+@dataclass
+class RouterConfig:
+    """Multi-backend model routing configuration."""
+    enabled: bool = False
+    backends: list[dict] = field(default_factory=list)
+    latency_budget: float = 1.0
+    short_clip_seconds: float = 2.0
+    ewma_alpha: float = 0.3
+    default_rtf: float = 0.5
+    rtf_decay: float = 0.05
+    decision_log: str = ""
+
+
+@dataclass
+class HotkeyConfig:
+    """Hotkey configuration."""
+    modifiers: list[str] = field(default_factory=lambda: ["ctrl", "alt"])
+    key: str = ""
+    reinject_modifiers: list[str] = field(default_factory=lambda: ["super", "alt"])
+    reinject_key: str = ""
+    continuous_modifiers: list[str] = field(default_factory=lambda: ["super", "alt"])
+    continuous_key: str = ""
+
+
+@dataclass
+class AudioConfig:
+    """Audio recording configuration."""
+    sample_rate: int = 16000
+    channels: int = 1
+    chunk_size: int = 1024
+    format: str = "int16"
+    device_index: Optional[int] = None
+    max_duration: float = 300.0
+    persistent_stream: bool = False
+    preroll_ms: int = 300
+    device_check_interval: float = 2.0
+    preprocess_in_callback: bool = True
+
+
+@dataclass
+class StreamingConfig:
+    """Streaming transcription configuration."""
+    enabled: bool = False
+    window_seconds: float = 8.0
+    step_seconds: float = 1.0
+    overlap_seconds: float = 1.0
+    live_injection: bool = False
+    live_min_interval: float = 0.15
+    live_tentative: bool = True
+
+
+@dataclass
+class VADConfig:
+    """Voice activity detection (silence trimming) configuration."""
+    enabled: bool = True
+    threshold_db: float = -45.0
+    max_adaptive_threshold_db: float = -30.0
+    noise_margin_db: float = 10.0
+    frame_ms: int = 30
+    padding_ms: int = 200
+
+
+@dataclass
+class InjectionConfig:
+    """Text injection configuration."""
+    strategy: str = "auto"
+    paste_min_length: int = 20
+    typing_delay_ms: int = 12
+    restore_clipboard: bool = True
+    restore_delay: float = 0.3
+    terminal_classes: Optional[list[str]] = None
+    window_strategies: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class ContinuousConfig:
+    """Hands-free continuous dictation configuration."""
+    silence_ms: int = 700
+    min_speech_ms: int = 300
+    max_segment_seconds: float = 20.0
+
+
+@dataclass
+class PipelineConfig:
+    """Transcription/injection worker pipeline configuration."""
+    max_queue_size: int = 4
+    preempt: str = "off"
+    preempt_window: float = 2.0
+    deadline_seconds: float = 30.0
+    deadline_per_audio_second: float = 3.0
+
+
+@dataclass
+class InferenceConfig:
+    """Inference process isolation configuration."""
+    separate_process: bool = False
+    buffer_seconds: float = 30.0
+    respawn_delay: float = 1.0
+
+
+@dataclass
+class BatchingConfig:
+    """Micro-batching of concurrent transcription requests."""
+    enabled: bool = False
+    max_batch_size: int = 8
+    max_wait_ms: float = 10.0
+    bucket_ratio: float = 1.5
+
+
+@dataclass
+class CacheConfig:
+    """Transcript cache configuration."""
+    enabled: bool = True
+    max_entries: int = 256
+    disk: bool = False
+    disk_dir: str = "~/.cache/wispr-flow/transcripts"
+    disk_max_mb: float = 50.0
+
+
+@dataclass
+class MetricsConfig:
+    """Latency metrics endpoint configuration."""
+    enabled: bool = False
+    host: str = "127.0.0.1"
+    port: int = 9464
+
+
+@dataclass
+class DaemonConfig:
+    """Resident model daemon configuration."""
+    use_daemon: bool = False
+    socket_path: str = ""
+    timeout: float = 30.0
+
+
+@dataclass
+class AppConfig:
+    """Application configuration."""
+    debug: bool = False
+    min_audio_length: float = 0.3
+    show_notifications: bool = False
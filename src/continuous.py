@@ -0,0 +1,254 @@
+"""Hands-free continuous dictation.
+
+While the mode is on, the microphone stays open and an energy endpointer
+cuts the audio into utterances at pauses. Each utterance is submitted to
+the dictation pipeline as soon as it ends, so it is transcribed and typed
+while the next one is still being spoken. Only the utterance in progress is
+held in memory; finished ones belong to the pipeline, which releases them
+after transcription.
+"""
+
+import logging
+import queue
+import threading
+from collections import deque
+from typing import Optional
+
+import numpy as np
+
+from .pipeline import DictationJob
+from .vad import MAX_ADAPTIVE_THRESHOLD_DB, speech_threshold
+
+
+logger = logging.getLogger(__name__)
+
+# Per-frame smoothing of the noise floor estimate when the level is below
+# it (follow quickly) and above it (speech should barely move it)
+NOISE_FALL_RATE = 0.5
+NOISE_RISE_RATE = 0.002
+
+
+class VADEndpointer:
+    """Splits a live audio stream into utterances at pauses."""
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        threshold_db: float = -45.0,
+        noise_margin_db: float = 10.0,
+        frame_ms: int = 30,
+        padding_ms: int = 200,
+        silence_ms: int = 700,
+        min_speech_ms: int = 300,
+        max_segment_seconds: float = 20.0,
+        max_adaptive_threshold_db: float = MAX_ADAPTIVE_THRESHOLD_DB
+    ):
+        """Initialize endpointer.
+
+        Args:
+            sample_rate: Sample rate of the fed audio
+            threshold_db: Minimum frame level (dBFS) that can count as speech
+            noise_margin_db: Required level above the running noise floor
+            frame_ms: Analysis frame length in milliseconds
+            padding_ms: Audio kept before and after each utterance
+            silence_ms: Pause that ends an utterance
+            min_speech_ms: Utterances with less speech are discarded
+            max_segment_seconds: Longer utterances are cut here, bounding
+                per-segment latency and memory
+            max_adaptive_threshold_db: Highest level (dBFS) the noise-floor
+                threshold may rise to
+        """
+        self.sample_rate = sample_rate
+        self.threshold_db = threshold_db
+        self.max_adaptive_threshold_db = max_adaptive_threshold_db
+        self.noise_margin_db = noise_margin_db
+        self.frame = max(int(sample_rate * frame_ms / 1000), 1)
+        self.padding_frames = padding_ms // frame_ms
+        self.silence_frames = max(silence_ms // frame_ms, 1)
+        self.min_speech_frames = min_speech_ms // frame_ms
+        self.max_segment_frames = int(max_segment_seconds * 1000) // frame_ms
+
+        self._remainder: Optional[np.ndarray] = None
+        self._preroll: deque = deque(maxlen=self.padding_frames or None)
+        self._segment: list[np.ndarray] = []
+        self._speech_frames = 0
+        self._silence_run = 0
+        self._noise_floor: Optional[float] = None
+
+    def _is_speech(self, frame: np.ndarray) -> bool:
+        """Classify one frame against the running noise floor."""
+        samples = frame.astype(np.float32)
+        if frame.dtype == np.int16:
+            samples /= 32768.0
+        level = 10 * np.log10(max(float(np.mean(samples * samples)), 1e-12))
+
+        if self._noise_floor is None:
+            self._noise_floor = level
+        rate = NOISE_FALL_RATE if level < self._noise_floor else NOISE_RISE_RATE
+        self._noise_floor += rate * (level - self._noise_floor)
+
+        return level > speech_threshold(
+            self._noise_floor, self.noise_margin_db, self.threshold_db, self.max_adaptive_threshold_db
+        )
+
+    def feed(self, chunk: np.ndarray) -> list[np.ndarray]:
+        """Process a chunk of audio.
+
+        Args:
+            chunk: Mono audio (int16, or float32 in [-1, 1])
+
+        Returns:
+            Utterances that ended within this chunk
+        """
+        if self._remainder is not None and len(self._remainder):
+            chunk = np.concatenate((self._remainder, chunk))
+        count = len(chunk) // self.frame
+        self._remainder = chunk[count * self.frame:].copy()
+
+        finished = []
+        for index in range(count):
+            frame = chunk[index * self.frame:(index + 1) * self.frame]
+            speech = self._is_speech(frame)
+            if not self._segment:
+                if speech:
+                    self._segment = list(self._preroll)
+                    self._preroll.clear()
+                    self._segment.append(frame.copy())
+                    self._speech_frames = 1
+                    self._silence_run = 0
+                elif self.padding_frames:
+                    self._preroll.append(frame.copy())
+                continue
+
+            self._segment.append(frame.copy())
+            if speech:
+                self._speech_frames += 1
+                self._silence_run = 0
+            else:
+                self._silence_run += 1
+
+            if self._silence_run >= self.silence_frames or len(self._segment) >= self.max_segment_frames:
+                segment = self._end_segment()
+                if segment is not None:
+                    finished.append(segment)
+        return finished
+
+    def flush(self) -> Optional[np.ndarray]:
+        """End the utterance in progress (e.g. when the mode is switched off)."""
+        segment = self._end_segment() if self._segment else None
+        self._remainder = None
+        self._preroll.clear()
+        return segment
+
+    def _end_segment(self) -> Optional[np.ndarray]:
+        """Close the current utterance, dropping trailing silence past the padding."""
+        frames = self._segment
+        keep = len(frames) - max(self._silence_run - self.padding_frames, 0)
+        enough_speech = self._speech_frames >= self.min_speech_frames
+        self._segment = []
+        self._speech_frames = 0
+        self._silence_run = 0
+        if not enough_speech:
+            return None
+        return np.concatenate(frames[:keep])
+
+
+class ContinuousDictation:
+    """Toggleable hands-free mode feeding endpointed utterances to the pipeline."""
+
+    def __init__(self, recorder, pipeline, endpointer_options: Optional[dict] = None):
+        """Initialize continuous dictation.
+
+        Args:
+            recorder: AudioRecorder to capture from
+            pipeline: DictationPipeline that transcribes and injects utterances
+            endpointer_options: Keyword arguments for VADEndpointer
+        """
+        self.recorder = recorder
+        self.pipeline = pipeline
+        self.endpointer_options = endpointer_options or {}
+        self._chunks: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: Optional[threading.Thread] = None
+        self._toggle_lock = threading.Lock()
+        self._segments = 0
+
+    @property
+    def active(self) -> bool:
+        """Whether hands-free capture is running."""
+        return self._worker is not None
+
+    def toggle(self) -> None:
+        """Switch the mode on or off."""
+        with self._toggle_lock:
+            if self.active:
+                self._stop()
+            else:
+                self._start()
+
+    def stop(self) -> None:
+        """Switch the mode off if it is on."""
+        with self._toggle_lock:
+            if self.active:
+                self._stop()
+
+    def _start(self) -> None:
+        """Open capture and start endpointing."""
+        if self.recorder.is_recording:
+            logger.warning("Recording in progress, not starting continuous dictation")
+            return
+        self._segments = 0
+        self._worker = threading.Thread(target=self._run, name="endpointer", daemon=True)
+        self._worker.start()
+        self.recorder.add_chunk_listener(self._on_chunk)
+        try:
+            # Utterances are buffered by the endpointer, not the recorder
+            self.recorder.start_recording(buffer_audio=False)
+        except Exception:
+            self.recorder.remove_chunk_listener(self._on_chunk)
+            self._chunks.put(None)
+            self._worker.join()
+            self._worker = None
+            raise
+        logger.info("Continuous dictation on")
+
+    def _stop(self) -> None:
+        """Stop capture and submit the utterance in progress."""
+        self.recorder.remove_chunk_listener(self._on_chunk)
+        self.recorder.stop_recording()
+        self._chunks.put(None)
+        self._worker.join()
+        self._worker = None
+        logger.info(f"Continuous dictation off ({self._segments} segments)")
+
+    def _on_chunk(self, chunk: np.ndarray, sample_rate: int) -> None:
+        """Hand a chunk to the endpointer thread (runs on the audio callback)."""
+        self._chunks.put((chunk, sample_rate))
+
+    def _run(self) -> None:
+        """Endpoint the stream and submit each finished utterance."""
+        endpointer: Optional[VADEndpointer] = None
+        sample_rate = 16000
+        while True:
+            item = self._chunks.get()
+            if item is None:
+                break
+            chunk, sample_rate = item
+            if endpointer is None:
+                endpointer = VADEndpointer(sample_rate, **self.endpointer_options)
+            for segment in endpointer.feed(chunk):
+                self._submit(segment, sample_rate)
+
+        if endpointer is not None:
+            segment = endpointer.flush()
+            if segment is not None:
+                self._submit(segment, sample_rate)
+
+    def _submit(self, segment: np.ndarray, sample_rate: int) -> None:
+        """Queue an utterance; later ones continue the previous text."""
+        logger.info(f"Utterance ended: {len(segment) / sample_rate:.2f}s")
+        self.pipeline.submit(DictationJob(
+            audio_data=segment,
+            sample_rate=sample_rate,
+            join_previous=self._segments > 0
+        ))
+        self._segments += 1
@@ -0,0 +1,262 @@
+"""Resident transcription daemon serving a local Unix socket.
+
+The daemon loads the model once and keeps it hot; the hotkey frontend,
+scripts and batch jobs connect to it instead of loading their own copy.
+
+Commands (``{"cmd": ...}``, one JSON object per line):
+    status          model, readiness, settings fingerprint, uptime and
+                    request counts
+    transcribe      ``audio`` (see :mod:`src.ipc`) or ``path`` to an audio file
+    start_capture   start recording from the daemon's microphone
+    stop_capture    stop recording and return the transcript
+    reload          re-read config.yaml; a changed model is loaded in the
+                    background and swapped in once ready
+    shutdown        stop the daemon
+"""
+
+import hashlib
+import logging
+import os
+import socketserver
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+from .audio_io import load_audio
+from .client import DaemonClient
+from .batching import MicroBatcher
+from .components import create_batcher, create_vad
+from .config import Config
+from .ipc import decode_audio, read_message, resolve_socket_path, write_message
+from .transcriber import Transcriber
+
+
+logger = logging.getLogger(__name__)
+
+
+def _model_key(config: Config) -> tuple:
+    """Settings the transcriber is built from; changing them requires a reload."""
+    model = config.model
+    return (
+        model.type, model.size, model.device, model.language,
+        config.whisper, config.refine, config.cache, config.router
+    )
+
+
+def model_fingerprint(config: Config) -> str:
+    """Digest of the transcriber settings, compared by clients before using a daemon."""
+    return hashlib.blake2b(repr(_model_key(config)).encode(), digest_size=8).hexdigest()
+
+
+class TranscriptionDaemon:
+    """Owns the loaded model and answers requests on a Unix socket."""
+
+    def __init__(self, config_path: Optional[Path] = None):
+        """Initialize daemon and start loading the model.
+
+        Args:
+            config_path: Path to configuration file
+        """
+        self.config_path = config_path
+        self.config = Config(config_path)
+        self.socket_path = resolve_socket_path(self.config.daemon.socket_path)
+        self.transcriber = Transcriber(self.config, load_in_background=True)
+        self.fingerprint = model_fingerprint(self.config)
+        # Concurrent client requests are decoded together when enabled
+        self.batcher: Optional[MicroBatcher] = create_batcher(self.config, self.transcriber)
+        self.vad = create_vad(self.config)
+        self.recorder = None
+        self.started_at = time.monotonic()
+        self.requests = 0
+        self._server: Optional[socketserver.ThreadingUnixStreamServer] = None
+        self._lock = threading.Lock()
+
+    def serve_forever(self) -> None:
+        """Serve requests until ``shutdown`` is received or interrupted."""
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                while True:
+                    try:
+                        message = read_message(self.rfile)
+                    except ValueError as e:
+                        write_message(self.wfile, {'ok': False, 'error': str(e)})
+                        return
+                    if message is None:
+                        return
+                    write_message(self.wfile, daemon.handle(message))
+
+        if self.socket_path.exists():
+            if DaemonClient(self.socket_path).is_available():
+                raise RuntimeError(f"A daemon is already listening on {self.socket_path}")
+            self.socket_path.unlink()
+        # Only the current user may connect
+        umask = os.umask(0o177)
+        try:
+            self._server = socketserver.ThreadingUnixStreamServer(str(self.socket_path), Handler)
+        finally:
+            os.umask(umask)
+        self._server.daemon_threads = True
+        logger.info(f"Daemon listening on {self.socket_path}")
+        if self.batcher is not None:
+            self.batcher.start()
+        try:
+            self._server.serve_forever()
+        finally:
+            if self.batcher is not None:
+                self.batcher.stop()
+            self._server.server_close()
+            self.socket_path.unlink(missing_ok=True)
+            if self.recorder is not None:
+                self.recorder.close()
+            logger.info("Daemon stopped")
+
+    def handle(self, message: dict) -> dict:
+        """Dispatch one request.
+
+        Args:
+            message: Request with a ``cmd`` field
+
+        Returns:
+            Response with ``ok`` and either results or ``error``
+        """
+        command = message.get('cmd')
+        handler = getattr(self, f"_cmd_{command}", None) if isinstance(command, str) else None
+        if handler is None:
+            return {'ok': False, 'error': f"Unknown command: {command}"}
+
+        with self._lock:
+            self.requests += 1
+        try:
+            return {'ok': True, **handler(message)}
+        except Exception as e:
+            logger.error(f"Request {command} failed: {e}")
+            return {'ok': False, 'error': str(e)}
+
+    def _cmd_status(self, message: dict) -> dict:
+        """Report model and daemon state."""
+        return {
+            'model': self.config.model.type,
+            'size': self.config.model.size,
+            'device': self.config.model.device,
+            'ready': self.transcriber.is_ready(),
+            'model_key': self.fingerprint,
+            'draft': self.transcriber.has_draft,
+            'capturing': self.recorder is not None and self.recorder.is_recording,
+            'uptime_s': round(time.monotonic() - self.started_at, 1),
+            'requests': self.requests,
+            'pid': os.getpid(),
+        }
+
+    def _cmd_transcribe(self, message: dict) -> dict:
+        """Transcribe an audio buffer or an audio file."""
+        if 'path' in message:
+            audio, sample_rate = load_audio(Path(message['path'])), 16000
+        else:
+            audio, sample_rate = decode_audio(message)
+
+        start = time.perf_counter()
+        text = self._transcribe(audio, sample_rate) if len(audio) else ""
+        return {'text': text, 'seconds': round(time.perf_counter() - start, 4)}
+
+    def _cmd_transcribe_draft(self, message: dict) -> dict:
+        """Transcribe an audio buffer with the draft model (two-pass decoding)."""
+        if not self.transcriber.has_draft:
+            raise RuntimeError("No draft model loaded (refine.enabled is off)")
+        audio, sample_rate = decode_audio(message)
+        start = time.perf_counter()
+        text = self.transcriber.transcribe_draft(audio, sample_rate) if len(audio) else ""
+        return {'text': text, 'seconds': round(time.perf_counter() - start, 4)}
+
+    def _cmd_start_capture(self, message: dict) -> dict:
+        """Start recording from the microphone."""
+        if self.recorder is None:
+            # Imported here so headless daemons don't need PyAudio
+            from .audio_recorder import AudioRecorder
+            audio = self.config.audio
+            self.recorder = AudioRecorder(
+                sample_rate=audio.sample_rate,
+                channels=audio.channels,
+                chunk_size=audio.chunk_size,
+                device_index=audio.device_index,
+                max_duration=audio.max_duration,
+                preprocess=audio.preprocess_in_callback
+            )
+        self.recorder.start_recording()
+        return {}
+
+    def _cmd_stop_capture(self, message: dict) -> dict:
+        """Stop recording and transcribe what was captured."""
+        if self.recorder is None or not self.recorder.is_recording:
+            raise RuntimeError("Not capturing")
+        audio = self.recorder.stop_recording()
+        if audio is None:
+            return {'text': ""}
+
+        sample_rate = self.recorder.output_sample_rate
+        if self.vad is not None:
+            result = self.vad.trim(audio, sample_rate)
+            if result.audio is None:
+                logger.info(
+                    f"VAD found only {result.speech_seconds:.2f}s of speech in "
+                    f"{len(audio) / sample_rate:.2f}s capture, discarding it"
+                )
+                return {'text': ""}
+            audio = result.audio
+        return {'text': self._transcribe(audio, sample_rate)}
+
+    def _transcribe(self, audio, sample_rate: int) -> str:
+        """Transcribe through the micro-batcher if enabled."""
+        return (self.batcher or self.transcriber).transcribe(audio, sample_rate)
+
+    def _cmd_reload(self, message: dict) -> dict:
+        """Re-read the configuration, reloading the model if it changed."""
+        config = Config(self.config_path)
+        reload_model = _model_key(config) != _model_key(self.config)
+        self.config = config
+        self.vad = create_vad(config)
+        if reload_model:
+            threading.Thread(
+                target=self._swap_model, args=(config,), name="model-reload", daemon=True
+            ).start()
+        return {'model_reloading': reload_model}
+
+    def _swap_model(self, config: Config) -> None:
+        """Load a new model and replace the current one once it is ready."""
+        logger.info(f"Loading {config.model.type} ({config.model.size}) for reload")
+        try:
+            transcriber = Transcriber(config)
+        except Exception as e:
+            logger.error(f"Model reload failed, keeping the current model: {e}")
+            return
+        self.transcriber = transcriber
+        self.fingerprint = model_fingerprint(config)
+        if self.batcher is not None:
+            self.batcher.transcriber = transcriber
+        logger.info("Reloaded model is now serving requests")
+
+    def _cmd_shutdown(self, message: dict) -> dict:
+        """Stop serving after this response."""
+        threading.Thread(target=self._server.shutdown, daemon=True).start()
+        return {}
+
+
+def run_daemon(config_path: Optional[Path] = None) -> None:
+    """Run the daemon in the foreground.
+
+    Args:
+        config_path: Path to configuration file
+    """
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+    daemon = TranscriptionDaemon(config_path)
+    if daemon.config.app.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+    try:
+        daemon.serve_forever()
+    except KeyboardInterrupt:
+        logger.info("Interrupted by user")
@@ -0,0 +1,118 @@
+"""Hot-plug and default-device monitoring for a warm input stream."""
+
+import logging
+import shutil
+import subprocess
+import threading
+from typing import Callable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def get_default_source() -> Optional[str]:
+    """Get the name of the system default input (PulseAudio/PipeWire).
+
+    Returns:
+        Default source name, or None if it cannot be determined
+    """
+    try:
+        result = subprocess.run(
+            ['pactl', 'info'],
+            check=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            timeout=2
+        )
+    except Exception:
+        return None
+
+    for line in result.stdout.splitlines():
+        if line.startswith('Default Source:'):
+            return line.split(':', 1)[1].strip()
+    return None
+
+
+class DeviceMonitor:
+    """Periodically checks that a warm stream is alive and on the right device."""
+
+    def __init__(
+        self,
+        is_stalled: Callable[[], bool],
+        on_change: Callable[[str], bool],
+        follow_default: bool = True,
+        interval: float = 2.0
+    ):
+        """Initialize device monitor.
+
+        Args:
+            is_stalled: Returns True when the stream stopped delivering audio
+            on_change: Called with a reason when the stream should be reopened;
+                returns False if reopening has to be retried later
+            follow_default: Also watch for system default input changes
+            interval: Seconds between checks
+        """
+        self.is_stalled = is_stalled
+        self.on_change = on_change
+        self.interval = interval
+        # Default-device tracking needs pactl; without it only stalls are detected
+        self.follow_default = follow_default and shutil.which('pactl') is not None
+
+        self._default_source = get_default_source() if self.follow_default else None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start monitoring in a background thread."""
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="device-monitor", daemon=True
+        )
+        self._thread.start()
+        logger.debug(
+            f"Device monitor started (follow default: {self.follow_default})"
+        )
+
+    def stop(self) -> None:
+        """Stop monitoring."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(self.interval + 1)
+            self._thread = None
+
+    def _run(self) -> None:
+        """Check the stream and default device until stopped."""
+        while not self._stop.wait(self.interval):
+            previous = self._default_source
+            reason = self._check()
+            if reason is None:
+                continue
+            try:
+                handled = self.on_change(reason)
+            except Exception as e:
+                logger.error(f"Failed to reopen audio stream: {e}")
+                handled = False
+            if not handled:
+                # Detect the change again on the next check
+                self._default_source = previous
+
+    def _check(self) -> Optional[str]:
+        """Determine whether the stream needs reopening.
+
+        Returns:
+            Reason for reopening, or None if the stream is healthy
+        """
+        if self.is_stalled():
+            return "stream stopped delivering audio"
+
+        if self.follow_default:
+            source = get_default_source()
+            if source is not None and source != self._default_source:
+                previous = self._default_source
+                self._default_source = source
+                return f"default input changed from {previous} to {source}"
+
+        return None
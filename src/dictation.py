@@ -0,0 +1,198 @@
+"""Dictation jobs and their bookkeeping in the worker pipeline."""
+
+import itertools
+import logging
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from .cancellation import CancelToken, TranscriptionCancelled
+from .incremental_injector import IncrementalInjector
+from .metrics import REGISTRY, span
+from .streaming import StreamingSession
+from .vad import EnergyVAD
+
+
+logger = logging.getLogger(__name__)
+
+_job_ids = itertools.count(1)
+
+DICTATIONS = REGISTRY.counter(
+    "wispr_dictations_total", "Dictations by outcome"
+)
+SILENCE_TRIMMED = REGISTRY.counter(
+    "wispr_silence_trimmed_seconds_total", "Silence removed by VAD before inference"
+)
+QUEUE_WAIT = REGISTRY.histogram(
+    "wispr_queue_wait_seconds", "Time dictations waited for a pipeline worker"
+)
+OUTCOMES = ('submitted', 'dropped', 'completed', 'failed', 'silent', 'cancelled')
+
+
+@dataclass
+class DictationJob:
+    """A finished recording waiting to be transcribed and injected."""
+    audio_data: Optional[np.ndarray]
+    sample_rate: int
+    session: Optional[StreamingSession] = None
+    # Typed the streaming transcript while recording; finishes it on injection
+    live_injector: Optional[IncrementalInjector] = None
+    # Continues the previous dictation's text (hands-free segments): a space is typed first
+    join_previous: bool = False
+    # Cancelled when a newer recording supersedes this one or its deadline passes
+    token: CancelToken = field(default_factory=CancelToken)
+    job_id: int = field(default_factory=lambda: next(_job_ids))
+    # Hotkey release time (monotonic); queue waits and end-to-end latency start here
+    created_at: float = field(default_factory=time.monotonic)
+
+
+class ActiveJobs:
+    """Dictations submitted but not yet injected or discarded."""
+
+    def __init__(self):
+        """Initialize an empty set of jobs."""
+        self._jobs: dict[int, DictationJob] = {}
+        self._lock = threading.Lock()
+
+    def add(self, job: DictationJob) -> None:
+        """Track a submitted dictation."""
+        with self._lock:
+            self._jobs[job.job_id] = job
+
+    def pop(self, job_id: int) -> Optional[DictationJob]:
+        """Stop tracking a dictation.
+
+        Returns:
+            The job, or None if it was already discarded
+        """
+        with self._lock:
+            return self._jobs.pop(job_id, None)
+
+    def preempt(self, window: Optional[float] = None) -> int:
+        """Cancel dictations superseded by a new recording.
+
+        Queued dictations are skipped, a running decode stops at its next
+        cancellation check, and nothing more is typed for them.
+
+        Args:
+            window: Only cancel dictations released at most this many seconds
+                ago (a quick re-record); None cancels all of them
+
+        Returns:
+            Number of dictations cancelled
+        """
+        now = time.monotonic()
+        with self._lock:
+            jobs = list(self._jobs.values())
+        cancelled = 0
+        for job in jobs:
+            age = now - job.created_at
+            if window is None or age <= window:
+                job.token.cancel("superseded by a new recording")
+                logger.warning(
+                    f"New recording cancelled dictation {job.job_id} "
+                    f"(released {age:.1f}s ago); nothing more is typed for it"
+                )
+                cancelled += 1
+        return cancelled
+
+    def discard(self, job: DictationJob, outcome: Optional[str] = None) -> None:
+        """Release a dictation that will not be injected.
+
+        Its audio is left alone: the worker decoding it may still hold it,
+        and frees it itself.
+
+        Args:
+            job: Dictation to release
+            outcome: Outcome to count, if not counted already
+        """
+        if outcome is not None:
+            DICTATIONS.inc(outcome=outcome)
+        if job.session is not None:
+            job.session.cancel()
+        if job.live_injector is not None:
+            job.live_injector.cancel()
+        self.pop(job.job_id)
+
+
+def trim_silence(job: DictationJob, vad: Optional[EnergyVAD], min_audio_length: float) -> bool:
+    """Trim silence from a dictation before it reaches the model.
+
+    Args:
+        job: Dictation to check; its audio is replaced by the trimmed view
+        vad: Voice activity detector (None to only check the length)
+        min_audio_length: Shortest recording transcribed without VAD
+
+    Returns:
+        False if the recording should be skipped
+    """
+    duration = len(job.audio_data) / job.sample_rate
+
+    if vad is None:
+        if duration < min_audio_length:
+            DICTATIONS.inc(outcome='silent')
+            logger.info(
+                f"Audio too short ({duration:.2f}s < "
+                f"{min_audio_length}s), ignoring"
+            )
+            return False
+        return True
+
+    with span('vad'):
+        result = vad.trim(job.audio_data, job.sample_rate)
+    SILENCE_TRIMMED.inc(result.trimmed_seconds)
+    if result.audio is None:
+        DICTATIONS.inc(outcome='silent')
+        logger.info(
+            f"VAD found only {result.speech_seconds:.2f}s of speech in dictation "
+            f"{job.job_id} ({duration:.2f}s), discarding it (see vad.max_adaptive_threshold_db)"
+        )
+        return False
+
+    logger.info(
+        f"Dictation {job.job_id}: {result.speech_seconds:.2f}s speech, "
+        f"trimmed {result.trimmed_seconds:.2f}s of silence"
+    )
+    if job.session is None:
+        job.audio_data = result.audio
+    return True
+
+
+def transcribe_job(transcriber, job: DictationJob, jobs: ActiveJobs) -> Optional[str]:
+    """Decode a dictation, releasing its audio afterwards.
+
+    Args:
+        transcriber: Transcriber to decode with
+        job: Dictation whose silence has been trimmed
+        jobs: Active dictations, from which a failed job is discarded
+
+    Returns:
+        The transcript, or None if there is nothing to inject
+    """
+    try:
+        job.token.check()
+        if job.session is not None:
+            # Only the final window is left to decode
+            text = job.session.finish()
+        else:
+            text = transcriber.transcribe(job.audio_data, job.sample_rate, token=job.token)
+    except TranscriptionCancelled as e:
+        logger.info(f"Dictation {job.job_id} cancelled: {e}")
+        jobs.discard(job, 'cancelled')
+        return None
+    except Exception as e:
+        logger.error(f"Error transcribing dictation {job.job_id}: {e}", exc_info=True)
+        jobs.discard(job, 'failed')
+        return None
+    finally:
+        # Release the audio as soon as it has been transcribed
+        job.audio_data = None
+
+    if not text:
+        logger.warning("Transcription returned empty text")
+        jobs.discard(job, 'completed')
+        return None
+    return text
@@ -4,9 +4,19 @@ import logging
 from typing import Callable, Optional
 from pynput import keyboard
 
+from .injectors.synthetic_keys import SyntheticKeys
+
 
 logger = logging.getLogger(__name__)
 
+# pynput key names of the modifiers, by the name injectors announce them with
+MODIFIER_KEY_NAMES = {
+    'ctrl': ('ctrl', 'ctrl_l', 'ctrl_r'),
+    'alt': ('alt', 'alt_l', 'alt_r', 'alt_gr'),
+    'shift': ('shift', 'shift_l', 'shift_r'),
+    'super': ('cmd', 'cmd_l', 'cmd_r'),
+}
+
 
 class HotkeyListener:
     """Listens for global hotkey combinations."""
@@ -16,7 +26,8 @@ class HotkeyListener:
         modifiers: list[str],
         key: str = "",
         on_press: Optional[Callable] = None,
-        on_release: Optional[Callable] = None
+        on_release: Optional[Callable] = None,
+        synthetic: Optional[SyntheticKeys] = None
     ):
         """Initialize hotkey listener.
         
@@ -25,11 +36,21 @@ class HotkeyListener:
             key: Optional main key (empty for modifier-only hotkey)
             on_press: Callback when hotkey is pressed
             on_release: Callback when hotkey is released
+            synthetic: Key events announced by the text injector; these are
+                skipped, so releasing and re-pressing the held modifiers
+                around injected text doesn't end the hold
         """
         self.modifiers = set(self._normalize_modifier(m) for m in modifiers)
         self.key = key.lower() if key else None
         self.on_press_callback = on_press
         self.on_release_callback = on_release
+        self.synthetic = synthetic
+        self._modifier_names = {
+            getattr(keyboard.Key, key_name): name
+            for name, key_names in MODIFIER_KEY_NAMES.items()
+            for key_name in key_names
+            if hasattr(keyboard.Key, key_name)
+        }
         
         self.current_keys = set()
         self.hotkey_active = False
@@ -77,6 +98,16 @@ class HotkeyListener:
         # Check if main key is also pressed
         return modifiers_pressed and self.key in self.current_keys
     
+    def _is_synthetic(self, key, pressed: bool) -> bool:
+        """Check whether a key event was sent by the text injector."""
+        if self.synthetic is None:
+            return False
+        if hasattr(key, 'char') and key.char:
+            name = key.char.lower()
+        else:
+            name = self._modifier_names.get(key) or getattr(key, 'name', None)
+        return bool(name) and self.synthetic.consume(name, pressed)
+    
     def _on_press(self, key) -> None:
         """Handle key press event.
         
@@ -84,6 +115,9 @@ class HotkeyListener:
             key: Key that was pressed
         """
         try:
+            if self._is_synthetic(key, pressed=True):
+                return
+            
             # Add key to current set
             if hasattr(key, 'char') and key.char:
                 self.current_keys.add(key.char.lower())
@@ -107,6 +141,9 @@ class HotkeyListener:
             key: Key that was released
         """
         try:
+            if self._is_synthetic(key, pressed=False):
+                return
+            
             # Remove key from current set
             if hasattr(key, 'char') and key.char:
                 self.current_keys.discard(key.char.lower())
@@ -0,0 +1,164 @@
+"""Live injection of streaming transcripts while the hotkey is held."""
+
+import logging
+import threading
+import time
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+def plan_edit(current: str, target: str) -> tuple[int, str]:
+    """Plan the keystrokes that turn the typed text into the target text.
+
+    The cursor sits at the end of the typed text, so the cheapest edit is to
+    keep the longest common prefix, erase the rest and type the new tail.
+
+    Args:
+        current: Text already typed
+        target: Text that should be on screen
+
+    Returns:
+        (number of backspaces, text to type)
+    """
+    limit = min(len(current), len(target))
+    prefix = 0
+    while prefix < limit and current[prefix] == target[prefix]:
+        prefix += 1
+    return len(current) - prefix, target[prefix:]
+
+
+class IncrementalInjector:
+    """Keeps the focused window in sync with a streaming transcript.
+
+    Updates from the streaming decoder only record the latest text; a worker
+    thread applies it as a minimal backspace/retype edit at most once per
+    ``min_interval``, so intermediate hypotheses are coalesced instead of
+    flooding the target window. Edits stop if focus moves to another
+    window, and the final transcript is then injected in full.
+    """
+
+    def __init__(self, text_injector, min_interval: float = 0.15, inject_tentative: bool = True):
+        """Initialize incremental injector.
+
+        Args:
+            text_injector: TextInjector used to type and erase text
+            min_interval: Minimum seconds between edits
+            inject_tentative: Also show the not yet committed tail (it may be
+                corrected later); otherwise only committed words are typed
+        """
+        self.text_injector = text_injector
+        self.min_interval = min_interval
+        self.inject_tentative = inject_tentative
+
+        self._typed = ""
+        self._target = ""
+        self._window: Optional[int] = None
+        self._detached = False
+        self._keystrokes = 0
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        """Start the edit worker."""
+        self._worker = threading.Thread(
+            target=self._run, name="incremental-injector", daemon=True
+        )
+        self._worker.start()
+
+    def update(self, committed: str, tentative: str) -> None:
+        """Record the latest transcript. Used as the streaming update callback.
+
+        Args:
+            committed: Text that will not change anymore
+            tentative: Text that may still be revised
+        """
+        target = " ".join(part for part in (committed, tentative if self.inject_tentative else "") if part)
+        with self._cond:
+            self._target = target
+            self._cond.notify()
+
+    def finish(self, text: str) -> bool:
+        """Stop live updates and make the final transcript appear.
+
+        Args:
+            text: Final transcript (empty to erase anything typed)
+
+        Returns:
+            True if the final text is on screen
+        """
+        self._stop_worker()
+        if self._detached:
+            logger.warning("Focus changed during dictation, injecting full transcript")
+            return self.text_injector.inject_text(text) if text else True
+
+        success = self._apply(text)
+        logger.info(
+            f"Incremental injection finished: {len(text)} characters, "
+            f"{self._keystrokes} keystrokes"
+        )
+        return success
+
+    def cancel(self) -> None:
+        """Stop live updates and erase the text typed so far."""
+        self._stop_worker()
+        if not self._detached and self._typed:
+            self._apply("")
+
+    def _stop_worker(self) -> None:
+        """Signal the worker to stop and wait for the edit in progress."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def _run(self) -> None:
+        """Worker loop: apply the latest target, then rest for the interval."""
+        while True:
+            with self._cond:
+                while not self._stopping and self._target == self._typed:
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                target = self._target
+
+            if not self._apply(target):
+                return
+            time.sleep(self.min_interval)
+
+    def _focus_unchanged(self) -> bool:
+        """Check that the window being typed into still has focus."""
+        # Compare ids: titles change as the user types (modified markers etc.)
+        window = self.text_injector.get_active_window_id()
+        if self._window is None:
+            self._window = window
+        elif window != self._window:
+            self._detached = True
+            logger.warning(
+                f"Focus moved from window {self._window} to {window}, pausing live text"
+            )
+        return not self._detached
+
+    def _apply(self, target: str) -> bool:
+        """Edit the typed text into ``target``.
+
+        Returns:
+            False if the edit failed or focus moved away
+        """
+        if self._detached or not self._focus_unchanged():
+            return False
+
+        backspaces, insert = plan_edit(self._typed, target)
+        if backspaces and not self.text_injector.press_keys('BackSpace', backspaces):
+            return False
+        self._typed = self._typed[:len(self._typed) - backspaces]
+        if insert:
+            if not self.text_injector.inject_text(insert):
+                return False
+            self._typed += insert
+        self._keystrokes += backspaces + len(insert)
+        return True
@@ -0,0 +1,100 @@
+"""Entry point of the inference worker process (see InferenceProcess)."""
+
+import logging
+import signal
+import sys
+from multiprocessing import resource_tracker
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional
+
+import numpy as np
+
+from .cancellation import CancelToken, TranscriptionCancelled
+
+
+def attach_segment(name: str, current: Optional[SharedMemory]) -> SharedMemory:
+    """Attach to the named segment, reusing the current one if unchanged."""
+    if current is not None and current.name == name:
+        return current
+    if current is not None:
+        current.close()
+    if sys.version_info >= (3, 13):
+        return SharedMemory(name=name, track=False)
+
+    # Attaching registers the segment with a resource tracker, which
+    # unlinks what is still registered when it exits. The frontend owns the
+    # segment: unregister it from a tracker of this worker's own, but not
+    # from the frontend's tracker that spawn passes on, where the name is
+    # the frontend's registration.
+    own_tracker = resource_tracker._resource_tracker._fd is None
+    shm = SharedMemory(name=name)
+    if own_tracker:
+        resource_tracker.unregister(shm._name, 'shared_memory')
+    return shm
+
+
+def worker_main(config_path: Optional[str], conn, log_level: int) -> None:
+    """Worker process entry point: load the model, then serve requests.
+
+    The startup message is ``('ok', {'has_draft': bool})`` or
+    ``('error', message)``. Requests are
+    ``(shm_name, clips, sample_rate, mode, time_limit)`` where ``clips``
+    lists ``(byte offset, samples, dtype)``, ``mode`` is ``'text'``,
+    ``'batch'`` or ``'draft'`` and ``time_limit`` is the seconds left before
+    the caller's deadline (or None); replies are ``('ok', result)``,
+    ``('cancelled', reason)`` or ``('error', message)``. ``None`` asks the
+    worker to exit.
+    """
+    # The frontend handles Ctrl+C and shuts the worker down itself
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    logging.basicConfig(
+        level=log_level,
+        format='%(asctime)s - %(name)s[worker] - %(levelname)s - %(message)s'
+    )
+
+    from .config import Config
+    from .transcriber import Transcriber
+
+    try:
+        transcriber = Transcriber(Config(config_path))
+    except Exception as e:
+        conn.send(('error', str(e)))
+        return
+    conn.send(('ok', {'has_draft': transcriber.has_draft}))
+
+    shm: Optional[SharedMemory] = None
+    try:
+        while True:
+            try:
+                request = conn.recv()
+            except EOFError:
+                return
+            if request is None:
+                return
+            shm_name, clips, sample_rate, mode, time_limit = request
+            try:
+                shm = attach_segment(shm_name, shm)
+                # Views into the segment; the frontend doesn't reuse it until we reply
+                audio = [
+                    np.ndarray((samples,), dtype=dtype, buffer=shm.buf, offset=offset)
+                    for offset, samples, dtype in clips
+                ]
+                token = None
+                if time_limit is not None:
+                    token = CancelToken()
+                    token.set_deadline(time_limit)
+                if mode == 'batch':
+                    result = transcriber.transcribe_batch(audio, sample_rate, token=token)
+                elif mode == 'draft':
+                    result = transcriber.transcribe_draft(audio[0], sample_rate, token=token)
+                else:
+                    result = transcriber.transcribe(audio[0], sample_rate, token=token)
+                del audio
+                conn.send(('ok', result))
+            except TranscriptionCancelled as e:
+                conn.send(('cancelled', str(e)))
+            except Exception as e:
+                conn.send(('error', str(e)))
+    finally:
+        if shm is not None:
+            shm.close()
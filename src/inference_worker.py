@@ -0,0 +1,272 @@
+"""Model inference in a separate worker process.
+
+The worker owns the model, so heavy Python-side work in NeMo or
+faster-whisper no longer competes for the GIL with the PortAudio callback
+and the hotkey listener. Audio is handed over through a shared memory
+segment (only offsets and dtypes cross the pipe), text comes back over the
+pipe, and a worker that crashes is replaced automatically.
+"""
+
+import logging
+import threading
+import time
+from multiprocessing import get_context
+from multiprocessing.shared_memory import SharedMemory
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from .cancellation import CancelToken, TranscriptionCancelled
+from .inference_server import worker_main
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+WORKER_RESTARTS = REGISTRY.counter(
+    "wispr_inference_worker_restarts_total", "Inference worker processes respawned after a crash"
+)
+
+# Seconds between liveness checks while waiting for a reply
+POLL_INTERVAL = 0.5
+
+# Longest wait before respawning a worker that keeps crashing
+MAX_RESPAWN_DELAY = 60.0
+
+
+class InferenceProcess:
+    """Transcriber interface backed by a worker process that owns the model."""
+
+    def __init__(
+        self,
+        config_path: Optional[Path] = None,
+        buffer_seconds: float = 30.0,
+        respawn_delay: float = 1.0
+    ):
+        """Start the worker (the model loads in the background).
+
+        Args:
+            config_path: Configuration file the worker loads its model from
+            buffer_seconds: Initial shared buffer size in seconds of 48kHz
+                float32 audio (grows when a larger request arrives)
+            respawn_delay: Seconds before restarting a crashed worker;
+                doubles while the worker keeps failing to start
+        """
+        self.config_path = str(config_path) if config_path else None
+        self.respawn_delay = respawn_delay
+        self._context = get_context('spawn')
+        self._shm = SharedMemory(create=True, size=max(int(buffer_seconds * 48000 * 4), 4096))
+        # One request in flight at a time; also guards respawns
+        self._lock = threading.Lock()
+        self._ready = threading.Event()
+        self._load_error: Optional[str] = None
+        self._has_draft = False
+        self._closed = False
+        self._failures = 0
+        self._process = None
+        self._conn = None
+        self._spawn()
+
+    def _spawn(self) -> None:
+        """Start a worker process and wait for its model on a background thread."""
+        self._ready.clear()
+        self._load_error = None
+        parent_conn, child_conn = self._context.Pipe()
+        self._process = self._context.Process(
+            target=worker_main,
+            args=(self.config_path, child_conn, logging.getLogger().getEffectiveLevel()),
+            name="inference-worker",
+            daemon=True
+        )
+        self._process.start()
+        child_conn.close()
+        self._conn = parent_conn
+        threading.Thread(
+            target=self._await_ready, args=(parent_conn,), name="inference-worker-start", daemon=True
+        ).start()
+        logger.info(f"Started inference worker (pid {self._process.pid})")
+
+    def _await_ready(self, conn) -> None:
+        """Wait for the worker's startup message."""
+        try:
+            status, message = conn.recv()
+        except (EOFError, OSError):
+            # Crashed while loading (e.g. a native fault); try again later
+            self._process.join(1.0)
+            self._respawn()
+            return
+        if status == 'ok':
+            self._failures = 0
+            self._has_draft = message['has_draft']
+            logger.info("Inference worker ready")
+        else:
+            self._load_error = message
+            logger.error(f"Inference worker failed to start: {message}")
+        self._ready.set()
+
+    def _respawn(self) -> None:
+        """Replace a dead worker, backing off while it keeps failing."""
+        if self._closed:
+            return
+        self._failures += 1
+        WORKER_RESTARTS.inc()
+        delay = min(self.respawn_delay * 2 ** (self._failures - 1), MAX_RESPAWN_DELAY)
+        logger.warning(f"Inference worker died (exit code {self._process.exitcode}), respawning in {delay:.1f}s")
+        self._conn.close()
+        self._ready.clear()
+        timer = threading.Timer(delay, self._spawn_if_open)
+        timer.daemon = True
+        timer.start()
+
+    def _spawn_if_open(self) -> None:
+        """Respawn unless the frontend has shut down meanwhile."""
+        with self._lock:
+            if not self._closed:
+                self._spawn()
+
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the worker's model is loaded.
+
+        Raises:
+            RuntimeError: If the worker failed to load the model
+        """
+        if not self._ready.wait(timeout):
+            return False
+        if self._load_error is not None:
+            raise RuntimeError(f"Transcription model failed to load: {self._load_error}")
+        return True
+
+    def is_ready(self) -> bool:
+        """Check if a worker with a loaded model is running."""
+        return self._ready.is_set() and self._load_error is None and self._process.is_alive()
+
+    @property
+    def has_draft(self) -> bool:
+        """Whether the worker loaded a draft model for two-pass decoding."""
+        return self._has_draft
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe audio in the worker process.
+
+        A cancelled token skips the request; the token's deadline is passed
+        on so the worker stops runaway decodes itself.
+        """
+        return self._request([audio_data], sample_rate, 'text', self._time_limit(token))
+
+    def transcribe_draft(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe audio with the worker's draft model."""
+        return self._request([audio_data], sample_rate, 'draft', self._time_limit(token))
+
+    def transcribe_batch(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> list[str]:
+        """Transcribe several clips in one worker round trip."""
+        return self._request(audio_list, sample_rate, 'batch', self._time_limit(token))
+
+    @staticmethod
+    def _time_limit(token: Optional[CancelToken]) -> Optional[float]:
+        """Check the token and get the seconds left before its deadline."""
+        if token is None:
+            return None
+        token.check()
+        if token.deadline is None:
+            return None
+        return token.deadline - time.monotonic()
+
+    def _request(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int,
+        mode: str,
+        time_limit: Optional[float] = None
+    ):
+        """Send clips to the worker and wait for its reply.
+
+        Raises:
+            TranscriptionCancelled: If the worker hit the deadline
+            RuntimeError: If the worker failed or crashed (it is respawned)
+        """
+        while True:
+            self.wait_until_ready()
+            with self._lock:
+                # A crash may have replaced the worker while we waited for the lock
+                if self._ready.is_set():
+                    status, result = self._exchange(audio_list, sample_rate, mode, time_limit)
+                    break
+        if status == 'cancelled':
+            raise TranscriptionCancelled(result)
+        if status != 'ok':
+            raise RuntimeError(f"Transcription failed in worker: {result}")
+        return result
+
+    def _exchange(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int,
+        mode: str,
+        time_limit: Optional[float]
+    ) -> tuple:
+        """Copy clips into shared memory, send the request and read the reply."""
+        clips = []
+        offset = 0
+        for audio in audio_list:
+            audio = np.ascontiguousarray(audio)
+            offset = -(-offset // 8) * 8  # Keep every clip aligned
+            clips.append((offset, audio))
+            offset += audio.nbytes
+        self._ensure_capacity(offset)
+        for start, audio in clips:
+            np.ndarray(audio.shape, dtype=audio.dtype, buffer=self._shm.buf, offset=start)[:] = audio
+
+        layout = [(start, len(audio), audio.dtype.str) for start, audio in clips]
+        try:
+            self._conn.send((self._shm.name, layout, sample_rate, mode, time_limit))
+            while not self._conn.poll(POLL_INTERVAL):
+                if not self._process.is_alive():
+                    raise EOFError
+            return self._conn.recv()
+        except (EOFError, OSError):
+            self._process.join(1.0)
+            self._respawn()
+            raise RuntimeError("Inference worker crashed during transcription")
+
+    def _ensure_capacity(self, size: int) -> None:
+        """Replace the shared segment with a larger one if needed."""
+        if size <= self._shm.size:
+            return
+        old = self._shm
+        self._shm = SharedMemory(create=True, size=max(size, 2 * old.size))
+        old.close()
+        old.unlink()
+        logger.debug(f"Grew inference buffer to {self._shm.size / 1e6:.1f} MB")
+
+    def close(self, timeout: float = 5.0) -> None:
+        """Stop the worker and release the shared buffer."""
+        with self._lock:
+            self._closed = True
+            if self._process is not None and self._process.is_alive():
+                try:
+                    self._conn.send(None)
+                except OSError:
+                    pass
+                self._process.join(timeout)
+                if self._process.is_alive():
+                    self._process.terminate()
+            self._conn.close()
+            self._shm.close()
+            self._shm.unlink()
+        logger.info("Inference worker stopped")
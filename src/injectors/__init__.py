@@ -0,0 +1 @@
+"""Text injection strategies."""
@@ -0,0 +1,134 @@
+"""Text injection by pasting from the clipboard."""
+
+import logging
+import shutil
+import subprocess
+import threading
+from typing import Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Targets tried, in order, when saving the previous clipboard contents
+TEXT_TARGETS = ('UTF8_STRING', 'text/plain;charset=utf-8', 'STRING', 'TEXT')
+
+
+class ClipboardInjector:
+    """Puts text on the clipboard, sends the paste shortcut, then restores.
+
+    Pasting is a single key combination regardless of text length. The
+    previous clipboard contents (text or the first MIME target, e.g. an
+    image) are saved and put back shortly after the paste, once the target
+    application has had time to read the selection.
+    """
+
+    name = "clipboard"
+
+    def __init__(self, key_sender, restore: bool = True, restore_delay: float = 0.3):
+        """Initialize clipboard injector.
+
+        Args:
+            key_sender: Object with ``send_keys(combo)`` used to press paste
+            restore: Restore the previous clipboard contents after pasting
+            restore_delay: Seconds to wait before restoring
+        """
+        self.key_sender = key_sender
+        self.restore = restore
+        self.restore_delay = restore_delay
+        self._saved: Optional[tuple[str, bytes]] = None
+        self._restore_timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def is_available(self) -> bool:
+        """Check if xclip is installed."""
+        return shutil.which('xclip') is not None
+
+    def _read(self, target: str) -> Optional[bytes]:
+        """Read the clipboard as the given target."""
+        result = subprocess.run(
+            ['xclip', '-selection', 'clipboard', '-t', target, '-o'],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            timeout=1
+        )
+        return result.stdout if result.returncode == 0 else None
+
+    def _write(self, data: bytes, target: str = 'UTF8_STRING') -> None:
+        """Take ownership of the clipboard with the given contents."""
+        # xclip forks to serve the selection; its output must not be piped
+        # or run() would wait for the background process
+        subprocess.run(
+            ['xclip', '-selection', 'clipboard', '-t', target, '-i'],
+            input=data,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+            timeout=1
+        )
+
+    def _save(self) -> Optional[tuple[str, bytes]]:
+        """Capture the current clipboard contents, if any."""
+        targets = self._read('TARGETS')
+        if not targets:
+            return None
+        available = targets.decode(errors='replace').split()
+        for target in TEXT_TARGETS + tuple(t for t in available if '/' in t):
+            if target in available:
+                data = self._read(target)
+                return (target, data) if data is not None else None
+        return None
+
+    def _restore_saved(self) -> None:
+        """Put the saved clipboard contents back."""
+        with self._lock:
+            saved, self._saved = self._saved, None
+            self._restore_timer = None
+            if saved is None:
+                return
+            try:
+                self._write(saved[1], saved[0])
+            except Exception as e:
+                logger.warning(f"Failed to restore clipboard: {e}")
+
+    def inject_text(self, text: str, paste_keys: str = 'ctrl+v') -> bool:
+        """Paste text at the current cursor position.
+
+        Args:
+            text: Text to inject
+            paste_keys: Paste shortcut (terminals use ``ctrl+shift+v``)
+
+        Returns:
+            True if successful, False otherwise
+        """
+        with self._lock:
+            # A restore still pending means the clipboard holds our previous
+            # paste; keep the contents saved before that one
+            if self._restore_timer is not None:
+                self._restore_timer.cancel()
+                self._restore_timer = None
+            try:
+                if self.restore and self._saved is None:
+                    self._saved = self._save()
+                self._write(text.encode())
+            except Exception as e:
+                logger.error(f"Failed to set clipboard: {e}")
+                return False
+
+        if not self.key_sender.send_keys(paste_keys):
+            self._restore_saved()
+            return False
+
+        if self.restore:
+            with self._lock:
+                self._restore_timer = threading.Timer(self.restore_delay, self._restore_saved)
+                self._restore_timer.daemon = True
+                self._restore_timer.start()
+        return True
+
+    def close(self) -> None:
+        """Restore the clipboard immediately if a restore is pending."""
+        with self._lock:
+            timer, self._restore_timer = self._restore_timer, None
+        if timer is not None:
+            timer.cancel()
+            self._restore_saved()
@@ -0,0 +1,122 @@
+"""Bookkeeping of the key events injection synthesizes."""
+
+import threading
+import time
+from collections import deque
+from typing import Iterable, Optional
+
+
+# Seconds an announced event may take to reach the hotkey listener (it
+# receives events asynchronously, after the X server processed them)
+SYNTHETIC_EVENT_GRACE = 1.0
+
+# Keysym name prefix -> modifier name used by the hotkey configuration
+MODIFIER_PREFIXES = {
+    'Control': 'ctrl',
+    'Shift': 'shift',
+    'Alt': 'alt',
+    'Meta': 'alt',
+    'Super': 'super',
+    'Hyper': 'super',
+}
+
+# Characters and keysyms whose listener key name differs from the text
+KEY_NAMES = {
+    ' ': 'space',
+    '\n': 'enter',
+    '\t': 'tab',
+    'return': 'enter',
+}
+
+
+def modifier_name(keysym_name: Optional[str]) -> Optional[str]:
+    """Map a keysym name such as ``Control_L`` to ``ctrl`` (None if not a modifier)."""
+    if not keysym_name:
+        return None
+    return MODIFIER_PREFIXES.get(keysym_name.split('_')[0])
+
+
+def key_name(key: str) -> str:
+    """Normalize a typed character or keysym name for matching."""
+    modifier = modifier_name(key)
+    if modifier:
+        return modifier
+    return KEY_NAMES.get(key.lower(), key.lower())
+
+
+class SyntheticKeys:
+    """Key events an injector is about to send.
+
+    Injection releases the held hotkey modifiers, types and presses them
+    again (pasting also taps Ctrl). Global listeners see these events like
+    real ones, so injectors announce them here first and the hotkey listener
+    skips each announced event once, while real key presses during an
+    injection are still handled immediately.
+    """
+
+    def __init__(self, grace: float = SYNTHETIC_EVENT_GRACE):
+        """Initialize ledger.
+
+        Args:
+            grace: Seconds after the expected send time an event is kept
+        """
+        self.grace = grace
+        self._expected: deque = deque()
+        self._lock = threading.Lock()
+
+    def expect(self, events: Iterable[tuple[str, bool]], duration: float = 0.0) -> None:
+        """Announce events about to be synthesized.
+
+        Args:
+            events: (key name, pressed) pairs; key names are typed characters,
+                keysym names or modifier names
+            duration: Seconds the injection will take to send them
+        """
+        expires = time.monotonic() + duration + self.grace
+        with self._lock:
+            self._expected.extend((key_name(name), pressed, expires) for name, pressed in events)
+
+    def expect_text(self, text: str, held: Iterable[str] = (), duration: float = 0.0) -> None:
+        """Announce typing text with the given modifiers released around it."""
+        held = list(held)
+        events = [(name, False) for name in held]
+        for char in text:
+            events += [(char, True), (char, False)]
+        events += [(name, True) for name in held]
+        self.expect(events, duration)
+
+    def expect_combo(self, combo: str, repeat: int = 1, held: Iterable[str] = (), duration: float = 0.0) -> None:
+        """Announce pressing a ``+``-joined key combination with held modifiers released."""
+        held = list(held)
+        keys = combo.split('+')
+        events = [(name, False) for name in held]
+        for _ in range(repeat):
+            events += [(name, True) for name in keys]
+            events += [(name, False) for name in reversed(keys)]
+        events += [(name, True) for name in held]
+        self.expect(events, duration)
+
+    def consume(self, name: str, pressed: bool) -> bool:
+        """Check whether an observed event was announced, and forget it if so.
+
+        Args:
+            name: Key name as normalized by key_name()
+            pressed: True for a press, False for a release
+
+        Returns:
+            True if the event is synthetic and should be ignored
+        """
+        now = time.monotonic()
+        with self._lock:
+            while self._expected and self._expected[0][2] < now:
+                self._expected.popleft()
+            for index, (expected, expected_pressed, expires) in enumerate(self._expected):
+                if expected == name and expected_pressed == pressed and expires >= now:
+                    del self._expected[index]
+                    return True
+        return False
+
+    def clear(self) -> None:
+        """Forget all announced events."""
+        with self._lock:
+            self._expected.clear()
@@ -0,0 +1,188 @@
+"""Shared, long-lived connection to the X server."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+from .synthetic_keys import modifier_name
+
+
+logger = logging.getLogger(__name__)
+
+# Minimum seconds between reconnect attempts after the server went away
+RECONNECT_INTERVAL = 1.0
+
+
+class XConnection:
+    """One python-xlib display connection reused for every injection.
+
+    Opening a connection (or forking xdotool, which opens its own) costs
+    milliseconds per call. This keeps a single connection, checks it with a
+    cheap round trip before each use and reopens it when the server went
+    away. Access is serialized because Xlib connections aren't thread-safe.
+    """
+
+    def __init__(self, display_name: Optional[str] = None):
+        """Initialize connection (opened lazily).
+
+        Args:
+            display_name: X display, defaults to $DISPLAY
+        """
+        self.display_name = display_name
+        self._display = None
+        self._X = None
+        self._last_failure = 0.0
+        self._lock = threading.RLock()
+
+    def is_available(self) -> bool:
+        """Check if python-xlib is installed and the display can be opened."""
+        try:
+            with self.session():
+                return True
+        except Exception as e:
+            logger.debug(f"X connection unavailable: {e}")
+            return False
+
+    @property
+    def X(self):
+        """The ``Xlib.X`` constants module."""
+        if self._X is None:
+            from Xlib import X
+            self._X = X
+        return self._X
+
+    def _open(self) -> None:
+        """Open the display connection."""
+        if time.monotonic() - self._last_failure < RECONNECT_INTERVAL:
+            raise RuntimeError("X server unavailable, waiting before reconnecting")
+
+        from Xlib import display
+        try:
+            self._display = display.Display(self.display_name)
+        except Exception:
+            self._last_failure = time.monotonic()
+            raise
+        logger.info(f"Connected to X display {self._display.get_display_name()}")
+
+    def _healthy(self) -> bool:
+        """Round-trip to the server and apply pending keyboard mapping changes."""
+        try:
+            self._display.get_input_focus()
+            while self._display.pending_events():
+                event = self._display.next_event()
+                if event.type == self.X.MappingNotify:
+                    self._display.refresh_keyboard_mapping(event)
+            return True
+        except Exception as e:
+            logger.warning(f"X connection lost: {e}")
+            return False
+
+    @contextmanager
+    def session(self) -> Iterator[object]:
+        """Hold the connection for a sequence of requests.
+
+        Yields:
+            A healthy ``Xlib.display.Display``
+
+        Raises:
+            Exception: If the server can't be reached; errors inside the
+                block drop the connection so the next session reconnects
+        """
+        with self._lock:
+            if self._display is not None and not self._healthy():
+                self.close()
+            if self._display is None:
+                self._open()
+            try:
+                yield self._display
+            except Exception:
+                self.close()
+                raise
+
+    def held_modifiers(self, display) -> list[tuple[int, Optional[str]]]:
+        """Get the modifier keys currently held down.
+
+        Returns:
+            (keycode, modifier name) pairs; the name is None for modifiers
+            the hotkey configuration has no name for (e.g. Mode_switch)
+        """
+        from Xlib import XK
+
+        keymap = display.query_keymap()
+        held = []
+        for keycodes in display.get_modifier_mapping():
+            for keycode in keycodes:
+                if keycode and keymap[keycode // 8] & (1 << (keycode % 8)) and keycode not in dict(held):
+                    keysym = display.keycode_to_keysym(keycode, 0)
+                    held.append((keycode, modifier_name(XK.keysym_to_string(keysym))))
+        return held
+
+    def held_modifier_names(self) -> list[str]:
+        """Get the names of the modifier keys currently held down."""
+        try:
+            with self.session() as display:
+                return [name for _, name in self.held_modifiers(display) if name]
+        except Exception as e:
+            logger.debug(f"Failed to query held modifiers: {e}")
+            return []
+
+    def active_window(self, display) -> Optional[object]:
+        """Get the focused top-level window (``_NET_ACTIVE_WINDOW``)."""
+        root = display.screen().root
+        active = root.get_full_property(
+            display.intern_atom('_NET_ACTIVE_WINDOW'), self.X.AnyPropertyType
+        )
+        if not active or not active.value[0]:
+            return None
+        return display.create_resource_object('window', active.value[0])
+
+    def active_window_id(self) -> Optional[int]:
+        """Get the X id of the focused window (stable while its title changes)."""
+        try:
+            with self.session() as display:
+                window = self.active_window(display)
+                return window.id if window else None
+        except Exception as e:
+            logger.debug(f"Failed to get active window id: {e}")
+            return None
+
+    def active_window_class(self) -> Optional[str]:
+        """Get the WM_CLASS class name of the focused window."""
+        try:
+            with self.session() as display:
+                window = self.active_window(display)
+                wm_class = window.get_wm_class() if window else None
+                return wm_class[1] if wm_class else None
+        except Exception as e:
+            logger.debug(f"Failed to get active window class: {e}")
+            return None
+
+    def active_window_name(self) -> Optional[str]:
+        """Get the title of the focused window."""
+        try:
+            with self.session() as display:
+                window = self.active_window(display)
+                if window is None:
+                    return None
+                name = window.get_full_property(
+                    display.intern_atom('_NET_WM_NAME'), display.intern_atom('UTF8_STRING')
+                )
+                if name is not None:
+                    value = name.value
+                    return value.decode(errors='replace') if isinstance(value, bytes) else value
+                return window.get_wm_name()
+        except Exception as e:
+            logger.debug(f"Failed to get active window name: {e}")
+            return None
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        with self._lock:
+            if self._display is not None:
+                try:
+                    self._display.close()
+                except Exception:
+                    pass
+                self._display = None
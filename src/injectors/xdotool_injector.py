@@ -0,0 +1,103 @@
+"""Text injection by typing through xdotool."""
+
+import logging
+import shutil
+import subprocess
+from typing import Callable, Optional
+
+from .synthetic_keys import SyntheticKeys
+
+
+logger = logging.getLogger(__name__)
+
+
+class XdotoolInjector:
+    """Types text one keystroke at a time with ``xdotool type``.
+
+    Slow for long text, but works with any X11 application and handles
+    arbitrary Unicode, so it is the fallback for the other strategies.
+    """
+
+    name = "xdotool"
+
+    def __init__(
+        self,
+        delay: int = 12,
+        synthetic: Optional[SyntheticKeys] = None,
+        held_modifiers: Optional[Callable[[], list[str]]] = None
+    ):
+        """Initialize xdotool injector.
+
+        Args:
+            delay: Delay between keystrokes in milliseconds
+            synthetic: Ledger the sent key events are announced in
+            held_modifiers: Returns the modifiers held down, which
+                ``--clearmodifiers`` releases and presses again
+        """
+        self.delay = delay
+        self.synthetic = synthetic
+        self.held_modifiers = held_modifiers
+
+    def _held(self) -> list[str]:
+        """Modifiers that --clearmodifiers will cycle, if known."""
+        return self.held_modifiers() if self.held_modifiers is not None else []
+
+    def is_available(self) -> bool:
+        """Check if xdotool is installed."""
+        return shutil.which('xdotool') is not None
+
+    def inject_text(self, text: str) -> bool:
+        """Type text at the current cursor position.
+
+        Args:
+            text: Text to inject
+
+        Returns:
+            True if successful, False otherwise
+        """
+        # Scale the timeout with the text so long dictations aren't cut off
+        timeout = 5 + len(text) * self.delay / 1000 * 2
+        if self.synthetic is not None:
+            self.synthetic.expect_text(text, self._held(), duration=len(text) * self.delay / 1000)
+        try:
+            # The dictation hotkey may still be held (live injection)
+            subprocess.run(
+                ['xdotool', 'type', '--clearmodifiers', '--delay', str(self.delay), '--', text],
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=timeout
+            )
+            return True
+        except subprocess.TimeoutExpired:
+            logger.error("xdotool typing timeout")
+            return False
+        except (subprocess.CalledProcessError, OSError) as e:
+            logger.error(f"xdotool typing failed: {e}")
+            return False
+
+    def send_keys(self, combo: str, repeat: int = 1) -> bool:
+        """Press a key combination such as ``ctrl+v``.
+
+        Args:
+            combo: Key combination in xdotool syntax
+            repeat: Number of presses
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if self.synthetic is not None:
+            self.synthetic.expect_combo(combo, repeat, self._held(), duration=repeat * self.delay / 1000)
+        try:
+            subprocess.run(
+                ['xdotool', 'key', '--clearmodifiers', '--repeat', str(repeat),
+                 '--delay', str(self.delay), combo],
+                check=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                timeout=2 + repeat * self.delay / 1000 * 2
+            )
+            return True
+        except (subprocess.SubprocessError, OSError) as e:
+            logger.error(f"xdotool key {combo} failed: {e}")
+            return False
@@ -0,0 +1,206 @@
+"""Text injection through the XTest extension (python-xlib)."""
+
+import logging
+from typing import Optional
+
+from .synthetic_keys import SyntheticKeys
+from .x_connection import XConnection
+
+
+logger = logging.getLogger(__name__)
+
+# Keysyms for characters that don't map to their code point
+SPECIAL_KEYSYMS = {
+    '\n': 0xff0d,  # Return
+    '\t': 0xff09,  # Tab
+}
+
+MODIFIER_KEYSYMS = {
+    'ctrl': 'Control_L',
+    'shift': 'Shift_L',
+    'alt': 'Alt_L',
+    'super': 'Super_L',
+}
+
+
+def char_to_keysym(char: str) -> int:
+    """Map a character to its X keysym.
+
+    Latin-1 characters share their code point with the keysym; everything
+    else uses the Unicode keysym range.
+    """
+    if char in SPECIAL_KEYSYMS:
+        return SPECIAL_KEYSYMS[char]
+    code = ord(char)
+    if 0x20 <= code <= 0x7e or 0xa0 <= code <= 0xff:
+        return code
+    return 0x01000000 + code
+
+
+class XTestInjector:
+    """Sends synthetic key events over the shared X connection.
+
+    All events of a dictation are queued and flushed with a single round
+    trip, so typing is bounded by the X server rather than a per-key delay.
+    Characters missing from the keyboard map are typed by temporarily
+    binding them to a spare keycode.
+    """
+
+    name = "xtest"
+
+    def __init__(self, connection: XConnection, synthetic: Optional[SyntheticKeys] = None):
+        """Initialize XTest injector.
+
+        Args:
+            connection: Shared X connection
+            synthetic: Ledger the sent key events are announced in
+        """
+        self.connection = connection
+        self.synthetic = synthetic
+        self._xtest = None
+        self._XK = None
+        self._spare_keycode: Optional[int] = None
+        self._prepared_display = None
+
+    def is_available(self) -> bool:
+        """Check if the X server can be reached and supports XTEST."""
+        try:
+            with self.connection.session() as display:
+                self._prepare(display)
+            return True
+        except Exception as e:
+            logger.debug(f"XTest unavailable: {e}")
+            return False
+
+    def _prepare(self, display) -> None:
+        """Load the extension and find a spare keycode for this connection."""
+        if self._prepared_display is display:
+            return
+        from Xlib import XK
+        from Xlib.ext import xtest
+
+        if not display.has_extension('XTEST'):
+            raise RuntimeError("X server has no XTEST extension")
+        self._XK, self._xtest = XK, xtest
+        self._spare_keycode = self._find_spare_keycode(display)
+        self._prepared_display = display
+
+    def _find_spare_keycode(self, display) -> Optional[int]:
+        """Find a keycode without keysyms to bind unmapped characters to."""
+        info = display.display.info
+        first, count = info.min_keycode, info.max_keycode - info.min_keycode + 1
+        mapping = display.get_keyboard_mapping(first, count)
+        for offset in range(count - 1, -1, -1):
+            if not any(mapping[offset]):
+                return first + offset
+        return None
+
+    def _fake(self, display, keycode: int, pressed: bool, name: Optional[str]) -> None:
+        """Queue a key event, announcing it to the synthetic event ledger."""
+        if self.synthetic is not None and name:
+            self.synthetic.expect([(name, pressed)])
+        X = self.connection.X
+        self._xtest.fake_input(display, X.KeyPress if pressed else X.KeyRelease, keycode)
+
+    def _tap(self, display, keycode: int, name: str, shift: bool = False) -> None:
+        """Queue a key press and release, optionally with Shift held."""
+        shift_code = display.keysym_to_keycode(self._XK.string_to_keysym('Shift_L'))
+        if shift:
+            self._fake(display, shift_code, True, 'shift')
+        self._fake(display, keycode, True, name)
+        self._fake(display, keycode, False, name)
+        if shift:
+            self._fake(display, shift_code, False, 'shift')
+
+    def _release_modifiers(self, display) -> list[tuple[int, Optional[str]]]:
+        """Release the modifier keys currently held down.
+
+        The dictation hotkey is usually still held while live text is typed;
+        without this every synthetic key would arrive as Ctrl+Alt+<key>.
+
+        Returns:
+            (keycode, name) of the released modifiers, to press again afterwards
+        """
+        held = self.connection.held_modifiers(display)
+        for keycode, name in held:
+            self._fake(display, keycode, False, name)
+        return held
+
+    def _restore_modifiers(self, display, held: list[tuple[int, Optional[str]]]) -> None:
+        """Press modifiers released by _release_modifiers again."""
+        for keycode, name in held:
+            self._fake(display, keycode, True, name)
+
+    def _type_unmapped(self, display, keysym: int, name: str) -> bool:
+        """Type a keysym missing from the keyboard map via the spare keycode."""
+        if self._spare_keycode is None:
+            return False
+        display.change_keyboard_mapping(self._spare_keycode, [(keysym, keysym)])
+        display.sync()
+        self._tap(display, self._spare_keycode, name)
+        display.sync()
+        display.change_keyboard_mapping(self._spare_keycode, [(0, 0)])
+        return True
+
+    def inject_text(self, text: str) -> bool:
+        """Type text at the current cursor position.
+
+        Args:
+            text: Text to inject
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.connection.session() as display:
+                self._prepare(display)
+                held = self._release_modifiers(display)
+                for char in text:
+                    keysym = char_to_keysym(char)
+                    # Index 0 is the plain keysym, 1 the shifted one
+                    for keycode, index in display.keysym_to_keycodes(keysym):
+                        if index in (0, 1):
+                            self._tap(display, keycode, char, shift=index == 1)
+                            break
+                    else:
+                        if not self._type_unmapped(display, keysym, char):
+                            logger.warning(f"No keycode for {char!r}, skipping it")
+                self._restore_modifiers(display, held)
+                display.sync()
+                return True
+        except Exception as e:
+            logger.error(f"XTest injection failed: {e}")
+            return False
+
+    def send_keys(self, combo: str, repeat: int = 1) -> bool:
+        """Press a key combination such as ``ctrl+v``.
+
+        Args:
+            combo: Key names joined by ``+``
+            repeat: Number of presses, sent in one batch
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            with self.connection.session() as display:
+                self._prepare(display)
+                keys = []
+                for name in combo.split('+'):
+                    keysym = self._XK.string_to_keysym(MODIFIER_KEYSYMS.get(name, name))
+                    keycode = display.keysym_to_keycode(keysym)
+                    if not keycode:
+                        raise ValueError(f"unknown key {name!r}")
+                    keys.append((keycode, name))
+                held = self._release_modifiers(display)
+                for _ in range(repeat):
+                    for keycode, name in keys:
+                        self._fake(display, keycode, True, name)
+                    for keycode, name in reversed(keys):
+                        self._fake(display, keycode, False, name)
+                self._restore_modifiers(display, held)
+                display.sync()
+                return True
+        except Exception as e:
+            logger.error(f"XTest key {combo} failed: {e}")
+            return False
@@ -0,0 +1,155 @@
+"""PyAudio input stream of one capture device."""
+
+import logging
+import time
+from typing import Callable, Optional
+
+import numpy as np
+import pyaudio
+
+
+logger = logging.getLogger(__name__)
+
+# Seconds without callbacks after which a warm stream is considered dead
+STALL_TIMEOUT = 2.0
+
+
+class InputStream:
+    """Opens, closes and re-detects an int16 input stream at the device's native rate."""
+
+    def __init__(
+        self,
+        on_chunk: Callable[[np.ndarray], None],
+        channels: int = 1,
+        chunk_size: int = 1024,
+        device_index: Optional[int] = None,
+        fallback_rate: int = 16000
+    ):
+        """Initialize PortAudio and detect the device.
+
+        Args:
+            on_chunk: Called on the audio callback thread with each int16 chunk
+            channels: Number of audio channels
+            chunk_size: Frames per chunk
+            device_index: Microphone device index (None for default)
+            fallback_rate: Sample rate used when the device can't be queried
+        """
+        self.on_chunk = on_chunk
+        self.channels = channels
+        self.chunk_size = chunk_size
+        self.device_index = device_index
+        self.fallback_rate = fallback_rate
+        self.audio = pyaudio.PyAudio()
+        self.stream: Optional[pyaudio.Stream] = None
+        self.sample_rate = fallback_rate  # Native rate of the device
+        self.last_callback = 0.0
+        self.detect_device()
+
+    @property
+    def is_open(self) -> bool:
+        """Whether the stream is open."""
+        return self.stream is not None
+
+    def detect_device(self) -> int:
+        """Look up the device's native sample rate.
+
+        Returns:
+            Rate the stream records at
+        """
+        try:
+            if self.device_index is None:
+                device_info = self.audio.get_default_input_device_info()
+                label = "system default input device"
+            else:
+                device_info = self.audio.get_device_info_by_index(self.device_index)
+                label = f"device {self.device_index}"
+            self.sample_rate = int(device_info['defaultSampleRate'])
+            logger.info(
+                f"Using {label}: {device_info['name']} "
+                f"(native rate: {self.sample_rate}Hz)"
+            )
+        except Exception as e:
+            logger.warning(f"Could not get device info: {e}")
+            self.sample_rate = self.fallback_rate
+        return self.sample_rate
+
+    def open(self) -> None:
+        """Open and start the stream."""
+        # Use actual device sample rate to avoid resampling issues in PyAudio
+        self.stream = self.audio.open(
+            format=pyaudio.paInt16,
+            channels=self.channels,
+            rate=self.sample_rate,
+            input=True,
+            input_device_index=self.device_index,
+            frames_per_buffer=self.chunk_size,
+            stream_callback=self._callback
+        )
+        self.last_callback = time.monotonic()
+        self.stream.start_stream()
+
+    def close(self) -> None:
+        """Stop and close the stream."""
+        if self.stream:
+            try:
+                self.stream.stop_stream()
+                self.stream.close()
+            except Exception as e:
+                logger.error(f"Error stopping stream: {e}")
+            finally:
+                self.stream = None
+
+    def is_stalled(self) -> bool:
+        """Check whether the stream stopped delivering audio."""
+        if self.stream is None:
+            return True
+        try:
+            if not self.stream.is_active():
+                return True
+        except Exception:
+            return True
+        return time.monotonic() - self.last_callback > STALL_TIMEOUT
+
+    def reinitialize(self) -> None:
+        """Close the stream and restart PortAudio, then detect the device again."""
+        self.close()
+        # PortAudio only sees newly plugged devices after re-initialization
+        self.audio.terminate()
+        self.audio = pyaudio.PyAudio()
+        self.detect_device()
+
+    def _callback(self, in_data, frame_count, time_info, status):
+        """PyAudio stream callback."""
+        if status:
+            logger.warning(f"Audio callback status: {status}")
+        self.last_callback = time.monotonic()
+        self.on_chunk(np.frombuffer(in_data, dtype=np.int16))
+        return (in_data, pyaudio.paContinue)
+
+    def list_devices(self) -> list[dict]:
+        """List available audio input devices.
+
+        Returns:
+            List of device information dictionaries
+        """
+        devices = []
+        for i in range(self.audio.get_device_count()):
+            try:
+                info = self.audio.get_device_info_by_index(i)
+                if info['maxInputChannels'] > 0:
+                    devices.append({
+                        'index': i,
+                        'name': info['name'],
+                        'channels': info['maxInputChannels'],
+                        'sample_rate': int(info['defaultSampleRate'])
+                    })
+            except Exception as e:
+                logger.warning(f"Error getting device {i} info: {e}")
+
+        return devices
+
+    def terminate(self) -> None:
+        """Close the stream and release PortAudio."""
+        self.close()
+        if self.audio:
+            self.audio.terminate()
@@ -0,0 +1,93 @@
+"""JSON-lines protocol shared by the daemon and its clients.
+
+Each request and response is one JSON object on its own line. Audio travels
+base64-encoded with its dtype and sample rate.
+"""
+
+import base64
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+
+# Largest accepted message (about 10 minutes of float32 audio at 16kHz)
+MAX_MESSAGE_BYTES = 64 * 1024 * 1024
+
+AUDIO_DTYPES = {'int16': np.int16, 'float32': np.float32}
+
+
+def default_socket_path() -> Path:
+    """Per-user socket path, preferring ``$XDG_RUNTIME_DIR``."""
+    runtime_dir = os.environ.get('XDG_RUNTIME_DIR')
+    if runtime_dir:
+        return Path(runtime_dir) / "wispr-flow.sock"
+    return Path(f"/tmp/wispr-flow-{os.getuid()}.sock")
+
+
+def resolve_socket_path(configured: Optional[str]) -> Path:
+    """Use the configured socket path, or the default if empty."""
+    return Path(os.path.expanduser(configured)) if configured else default_socket_path()
+
+
+def encode_audio(audio: np.ndarray, sample_rate: int) -> dict:
+    """Pack audio into message fields.
+
+    Args:
+        audio: Mono int16 or float32 audio
+        sample_rate: Sample rate in Hz
+
+    Returns:
+        ``audio``, ``dtype`` and ``sample_rate`` fields
+    """
+    dtype = 'int16' if audio.dtype == np.int16 else 'float32'
+    data = np.ascontiguousarray(audio, dtype=AUDIO_DTYPES[dtype])
+    return {
+        'audio': base64.b64encode(data.tobytes()).decode('ascii'),
+        'dtype': dtype,
+        'sample_rate': sample_rate,
+    }
+
+
+def decode_audio(message: dict) -> tuple[np.ndarray, int]:
+    """Unpack audio fields written by :func:`encode_audio`.
+
+    Returns:
+        (audio, sample_rate)
+
+    Raises:
+        ValueError: If the dtype is not supported
+    """
+    dtype = message.get('dtype', 'int16')
+    if dtype not in AUDIO_DTYPES:
+        raise ValueError(f"Unsupported audio dtype: {dtype}")
+    audio = np.frombuffer(base64.b64decode(message['audio']), dtype=AUDIO_DTYPES[dtype])
+    return audio, int(message.get('sample_rate', 16000))
+
+
+def write_message(stream, message: dict) -> None:
+    """Write one message to a binary file-like stream."""
+    stream.write(json.dumps(message).encode() + b"\n")
+    stream.flush()
+
+
+def read_message(stream) -> Optional[dict]:
+    """Read one message from a binary file-like stream.
+
+    Returns:
+        Decoded message, or None at end of stream
+
+    Raises:
+        ValueError: If the message is too long or not a JSON object
+    """
+    line = stream.readline(MAX_MESSAGE_BYTES + 1)
+    if not line:
+        return None
+    if len(line) > MAX_MESSAGE_BYTES:
+        raise ValueError("Message too long")
+    message = json.loads(line)
+    if not isinstance(message, dict):
+        raise ValueError("Message must be a JSON object")
+    return message
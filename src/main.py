@@ -1,15 +1,29 @@
 """Main application orchestrator for Wispr-Flow Clone."""
 
+import argparse
 import logging
 import sys
 import signal
+import time
 from pathlib import Path
+from typing import Optional
 
 from .config import Config
 from .hotkey_listener import HotkeyListener
-from .audio_recorder import AudioRecorder
 from .transcriber import Transcriber
-from .text_injector import TextInjector
+from .inference_worker import InferenceProcess
+from .batching import MicroBatcher
+from .client import DaemonClient, DaemonError, RemoteTranscriber
+from .components import (
+    create_audio_recorder, create_batcher, create_text_injector, create_vad, endpointer_options
+)
+from .daemon import model_fingerprint
+from .ipc import resolve_socket_path
+from .batch import add_arguments as add_batch_arguments, run_cli as run_batch
+from .pipeline import DictationPipeline
+from .push_to_talk import PushToTalk
+from .continuous import ContinuousDictation
+from .metrics import MetricsServer
 
 
 class WisprFlowApp:
@@ -31,27 +45,75 @@ class WisprFlowApp:
         self.logger.info("Starting Wispr-Flow Clone")
         
         # Initialize components
-        self.audio_recorder = AudioRecorder(
-            sample_rate=self.config.audio.sample_rate,
-            channels=self.config.audio.channels,
-            chunk_size=self.config.audio.chunk_size,
-            device_index=self.config.audio.device_index
-        )
+        self.audio_recorder = create_audio_recorder(self.config)
+        self.text_injector = create_text_injector(self.config)
+        
+        self.batcher: Optional[MicroBatcher] = None
+        self.inference_process: Optional[InferenceProcess] = None
+        self.transcriber = self._create_transcriber()
         
-        self.text_injector = TextInjector()
+        self.vad = create_vad(self.config)
+        self.pipeline = DictationPipeline(
+            self.transcriber,
+            self.text_injector,
+            max_queue_size=self.config.pipeline.max_queue_size,
+            vad=self.vad,
+            min_audio_length=self.config.app.min_audio_length,
+            deadline_seconds=self.config.pipeline.deadline_seconds,
+            deadline_per_audio_second=self.config.pipeline.deadline_per_audio_second,
+            refine_max_delay=self.config.refine.max_delay,
+            refine_max_change_ratio=self.config.refine.max_change_ratio
+        )
         
-        # Initialize transcriber (may take time to load model)
-        self.logger.info("Loading transcription model...")
-        self.transcriber = Transcriber(self.config)
-        self.logger.info("Transcription model loaded")
+        self.push_to_talk = PushToTalk(
+            self.config,
+            self.audio_recorder,
+            self.pipeline,
+            self.transcriber,
+            self.text_injector,
+            self.vad
+        )
         
         # Initialize hotkey listener
         self.hotkey_listener = HotkeyListener(
             modifiers=self.config.hotkey.modifiers,
             key=self.config.hotkey.key,
             on_press=self._on_hotkey_press,
-            on_release=self._on_hotkey_release
+            on_release=self._on_hotkey_release,
+            synthetic=self.text_injector.synthetic
+        )
+        
+        # Optional second hotkey that types the last transcript again
+        self.reinject_listener: Optional[HotkeyListener] = None
+        if self.config.hotkey.reinject_key:
+            self.reinject_listener = HotkeyListener(
+                modifiers=self.config.hotkey.reinject_modifiers,
+                key=self.config.hotkey.reinject_key,
+                on_press=self.pipeline.reinject_last,
+                synthetic=self.text_injector.synthetic
+            )
+        
+        # Optional toggle for hands-free dictation
+        self.continuous = ContinuousDictation(
+            self.audio_recorder,
+            self.pipeline,
+            endpointer_options=endpointer_options(self.config)
         )
+        self.continuous_listener: Optional[HotkeyListener] = None
+        if self.config.hotkey.continuous_key:
+            self.continuous_listener = HotkeyListener(
+                modifiers=self.config.hotkey.continuous_modifiers,
+                key=self.config.hotkey.continuous_key,
+                on_press=self._on_continuous_toggle,
+                synthetic=self.text_injector.synthetic
+            )
+        
+        self.metrics_server: Optional[MetricsServer] = None
+        if self.config.metrics.enabled:
+            self.metrics_server = MetricsServer(
+                host=self.config.metrics.host,
+                port=self.config.metrics.port
+            )
         
         # Setup signal handlers for graceful shutdown
         signal.signal(signal.SIGINT, self._signal_handler)
@@ -71,61 +133,64 @@ class WisprFlowApp:
             ]
         )
     
-    def _on_hotkey_press(self) -> None:
-        """Handle hotkey press event."""
-        self.logger.info("Hotkey pressed - Starting recording")
+    def _create_transcriber(self):
+        """Use the resident daemon's model if configured, running and built
+        from the same model settings as this config.
+        
+        Otherwise the model loads (and warms up) in the background; dictations
+        made meanwhile wait in the pipeline queue until it is ready.
+        """
+        daemon = self.config.daemon
+        if daemon.use_daemon:
+            client = DaemonClient(resolve_socket_path(daemon.socket_path), daemon.timeout)
+            try:
+                status = client.request('status')
+            except DaemonError:
+                self.logger.warning("Model daemon not running, loading the model in-process")
+            else:
+                if status.get('model_key') == model_fingerprint(self.config):
+                    self.logger.info(f"Using resident model daemon at {client.socket_path}")
+                    return RemoteTranscriber(client, status)
+                client.close()
+                self.logger.warning(
+                    "Model daemon was started with different model, whisper, refine, "
+                    "cache or router settings, loading the model in-process "
+                    "(run 'python -m src.client reload' to update the daemon)"
+                )
+        
+        self.logger.info("Loading transcription model in the background...")
+        inference = self.config.inference
+        if inference.separate_process:
+            self.inference_process = InferenceProcess(
+                self.config.config_path,
+                buffer_seconds=inference.buffer_seconds,
+                respawn_delay=inference.respawn_delay
+            )
+            transcriber = self.inference_process
+        else:
+            transcriber = Transcriber(self.config, load_in_background=True)
+            if transcriber.router is not None:
+                # Dictations waiting behind a clip count toward its latency budget
+                transcriber.router.load_probe = lambda: self.pipeline.queue_depth()
+        self.batcher = create_batcher(self.config, transcriber)
+        return self.batcher or transcriber
+    
+    def _on_continuous_toggle(self) -> None:
+        """Switch hands-free dictation on or off."""
         try:
-            self.audio_recorder.start_recording()
+            self.continuous.toggle()
         except Exception as e:
-            self.logger.error(f"Failed to start recording: {e}")
+            self.logger.error(f"Failed to toggle continuous dictation: {e}")
+    
+    def _on_hotkey_press(self) -> None:
+        """Handle hotkey press event."""
+        if not self.continuous.active:
+            self.push_to_talk.press()
     
     def _on_hotkey_release(self) -> None:
         """Handle hotkey release event."""
-        self.logger.info("Hotkey released - Stopping recording")
-        
-        try:
-            # Stop recording and get audio data
-            audio_data = self.audio_recorder.stop_recording()
-            
-            if audio_data is None:
-                self.logger.warning("No audio data to transcribe")
-                return
-            
-            # Check minimum duration
-            duration = self.audio_recorder.get_audio_duration(audio_data)
-            self.logger.info(f"Recorded audio duration: {duration:.2f}s")
-            
-            if duration < self.config.app.min_audio_length:
-                self.logger.info(
-                    f"Audio too short ({duration:.2f}s < "
-                    f"{self.config.app.min_audio_length}s), ignoring"
-                )
-                return
-            
-            # Transcribe (pass actual recorded sample rate for proper resampling)
-            self.logger.info("Transcribing audio...")
-            text = self.transcriber.transcribe(
-                audio_data,
-                self.audio_recorder.actual_sample_rate
-            )
-            
-            if not text:
-                self.logger.warning("Transcription returned empty text")
-                return
-            
-            self.logger.info(f"Transcription: {text}")
-            
-            # Inject text
-            self.logger.info("Injecting text...")
-            success = self.text_injector.inject_text(text)
-            
-            if success:
-                self.logger.info("Text injected successfully")
-            else:
-                self.logger.error("Failed to inject text")
-        
-        except Exception as e:
-            self.logger.error(f"Error processing recording: {e}", exc_info=True)
+        if not self.continuous.active:
+            self.push_to_talk.release()
     
     def _signal_handler(self, signum, frame) -> None:
         """Handle shutdown signals.
@@ -147,12 +212,20 @@ class WisprFlowApp:
         )
         
         self.is_running = True
+        if self.metrics_server is not None:
+            self.metrics_server.start()
+        if self.batcher is not None:
+            self.batcher.start()
+        self.pipeline.start()
         self.hotkey_listener.start()
+        if self.reinject_listener is not None:
+            self.reinject_listener.start()
+        if self.continuous_listener is not None:
+            self.continuous_listener.start()
         
         # Keep main thread alive
         try:
             while self.is_running:
-                import time
                 time.sleep(0.1)
         except KeyboardInterrupt:
             self.logger.info("Interrupted by user")
@@ -165,15 +238,44 @@ class WisprFlowApp:
         
         # Stop components
         self.hotkey_listener.stop()
+        if self.reinject_listener is not None:
+            self.reinject_listener.stop()
+        if self.continuous_listener is not None:
+            self.continuous_listener.stop()
+        self.continuous.stop()
         self.audio_recorder.close()
+        self.pipeline.stop()
+        if self.batcher is not None:
+            self.batcher.stop()
+        if self.inference_process is not None:
+            self.inference_process.close()
+        self.text_injector.close()
+        if self.metrics_server is not None:
+            self.metrics_server.stop()
         
         self.logger.info("Application stopped")
 
 
 def main():
     """Main entry point."""
+    parser = argparse.ArgumentParser(description="Wispr-Flow Clone voice dictation")
+    parser.add_argument('--config', type=Path, default=None, help="config.yaml path")
+    subcommands = parser.add_subparsers(dest='command')
+    subcommands.add_parser('daemon', help="keep the model loaded and serve it on a Unix socket")
+    add_batch_arguments(
+        subcommands.add_parser('transcribe', help="transcribe audio files to JSONL/SRT")
+    )
+    args = parser.parse_args()
+    
     try:
-        app = WisprFlowApp()
+        if args.command == 'transcribe':
+            run_batch(args)
+            return
+        if args.command == 'daemon':
+            from .daemon import run_daemon
+            run_daemon(args.config)
+            return
+        app = WisprFlowApp(args.config)
         app.start()
     except Exception as e:
         logging.error(f"Fatal error: {e}", exc_info=True)
@@ -0,0 +1,255 @@
+"""In-process metrics registry with a Prometheus-style text endpoint."""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Iterator, Optional
+
+
+logger = logging.getLogger(__name__)
+
+# Latency buckets in seconds, from sub-millisecond callback work to long decodes
+DEFAULT_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1,
+    0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0
+)
+
+
+def _label_key(labels: dict) -> tuple:
+    """Turn label keyword arguments into a hashable, ordered key."""
+    return tuple(sorted(labels.items()))
+
+
+def _format_labels(key: tuple, extra: Optional[tuple] = None) -> str:
+    """Render a label key as ``{name="value",...}``."""
+    pairs = list(key) + ([extra] if extra else [])
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{name}="{value}"' for name, value in pairs) + "}"
+
+
+class Counter:
+    """Monotonically increasing value per label set."""
+
+    kind = "counter"
+
+    def __init__(self, name: str, help_text: str):
+        """Initialize counter."""
+        self.name = name
+        self.help = help_text
+        self._values: dict = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount: float = 1, **labels: str) -> None:
+        """Increase the counter for a label set."""
+        key = _label_key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels: str) -> float:
+        """Get the current value for a label set."""
+        return self._values.get(_label_key(labels), 0)
+
+    def render(self) -> list[str]:
+        """Render samples in text exposition format."""
+        with self._lock:
+            return [f"{self.name}{_format_labels(k)} {v}" for k, v in sorted(self._values.items())]
+
+
+class Gauge:
+    """Current value read from a callback at scrape time."""
+
+    kind = "gauge"
+
+    def __init__(self, name: str, help_text: str, read: Callable[[], float]):
+        """Initialize gauge."""
+        self.name = name
+        self.help = help_text
+        self.read = read
+
+    def render(self) -> list[str]:
+        """Render the current value."""
+        try:
+            return [f"{self.name} {self.read()}"]
+        except Exception as e:
+            logger.debug(f"Gauge {self.name} unavailable: {e}")
+            return []
+
+
+class Histogram:
+    """Bucketed distribution of observed values per label set."""
+
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, buckets: tuple = DEFAULT_BUCKETS):
+        """Initialize histogram."""
+        self.name = name
+        self.help = help_text
+        self.buckets = buckets
+        self._series: dict = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, **labels: str) -> None:
+        """Record one observation for a label set."""
+        key = _label_key(labels)
+        with self._lock:
+            series = self._series.setdefault(key, [[0] * len(self.buckets), 0.0, 0])
+            for index, bound in enumerate(self.buckets):
+                if value <= bound:
+                    series[0][index] += 1
+                    break
+            series[1] += value
+            series[2] += 1
+
+    def render(self) -> list[str]:
+        """Render cumulative buckets, sum and count."""
+        lines = []
+        with self._lock:
+            for key, (counts, total, count) in sorted(self._series.items()):
+                cumulative = 0
+                for bound, bucket_count in zip(self.buckets, counts):
+                    cumulative += bucket_count
+                    lines.append(f"{self.name}_bucket{_format_labels(key, ('le', bound))} {cumulative}")
+                lines.append(f"{self.name}_bucket{_format_labels(key, ('le', '+Inf'))} {count}")
+                lines.append(f"{self.name}_sum{_format_labels(key)} {total}")
+                lines.append(f"{self.name}_count{_format_labels(key)} {count}")
+        return lines
+
+
+class MetricsRegistry:
+    """Collection of named metrics rendered together."""
+
+    def __init__(self):
+        """Initialize registry."""
+        self._metrics: dict = {}
+        self._lock = threading.Lock()
+
+    def _get_or_create(self, name: str, factory: Callable):
+        """Return the metric registered under ``name``, creating it if needed."""
+        with self._lock:
+            if name not in self._metrics:
+                self._metrics[name] = factory()
+            return self._metrics[name]
+
+    def counter(self, name: str, help_text: str = "") -> Counter:
+        """Get or create a counter."""
+        return self._get_or_create(name, lambda: Counter(name, help_text))
+
+    def histogram(self, name: str, help_text: str = "") -> Histogram:
+        """Get or create a histogram."""
+        return self._get_or_create(name, lambda: Histogram(name, help_text))
+
+    def gauge(self, name: str, help_text: str, read: Callable[[], float]) -> Gauge:
+        """Register a gauge, replacing any previous one with the same name."""
+        gauge = Gauge(name, help_text, read)
+        with self._lock:
+            self._metrics[name] = gauge
+        return gauge
+
+    def render(self) -> str:
+        """Render all metrics in Prometheus text exposition format."""
+        with self._lock:
+            metrics = list(self._metrics.values())
+        lines = []
+        for metric in metrics:
+            lines.append(f"# HELP {metric.name} {metric.help}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = MetricsRegistry()
+
+STAGE_SECONDS = REGISTRY.histogram(
+    "wispr_stage_seconds", "Time spent in each dictation stage"
+)
+
+# Per-thread stage renames set by stage_alias()
+_aliases = threading.local()
+
+
+@contextmanager
+def span(stage: str) -> Iterator[None]:
+    """Time a block of code as a dictation stage.
+
+    Args:
+        stage: Stage name (e.g. stream_stop, resample, inference, injection)
+    """
+    stage = getattr(_aliases, 'stages', {}).get(stage, stage)
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        if stage is not None:
+            STAGE_SECONDS.observe(time.perf_counter() - start, stage=stage)
+
+
+@contextmanager
+def stage_alias(stage: str, alias: Optional[str]) -> Iterator[None]:
+    """Record spans of ``stage`` started in this thread inside the block as ``alias``.
+
+    Lets callers of shared code keep its timings apart, e.g. streaming
+    window decodes from the final ``inference`` of a dictation.
+
+    Args:
+        stage: Stage name used by the code called inside the block
+        alias: Name to record it under instead (None to not record it)
+    """
+    previous = getattr(_aliases, 'stages', {})
+    _aliases.stages = {**previous, stage: alias}
+    try:
+        yield
+    finally:
+        _aliases.stages = previous
+
+
+class MetricsServer:
+    """Serves the registry on a localhost HTTP endpoint (``/metrics``)."""
+
+    def __init__(self, registry: MetricsRegistry = REGISTRY, host: str = "127.0.0.1", port: int = 9464):
+        """Initialize metrics server.
+
+        Args:
+            registry: Registry to expose
+            host: Interface to bind (keep it local)
+            port: TCP port
+        """
+        self.registry = registry
+        self.host = host
+        self.port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+
+    def start(self) -> None:
+        """Start serving in a background thread."""
+        registry = self.registry
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self) -> None:
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry.render().encode()
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args) -> None:
+                pass
+
+        self._server = ThreadingHTTPServer((self.host, self.port), Handler)
+        self._server.daemon_threads = True
+        threading.Thread(
+            target=self._server.serve_forever, name="metrics-server", daemon=True
+        ).start()
+        logger.info(f"Metrics available at http://{self.host}:{self.port}/metrics")
+
+    def stop(self) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
@@ -32,6 +32,8 @@ class ParakeetTranscriber:
         self.device = device
         self.language = language
         self.model: Optional[any] = None
+        self._torch = None
+        self._torch_device = None
         
         logger.info(
             f"Initializing Parakeet model: {model_name}, "
@@ -44,6 +46,7 @@ class ParakeetTranscriber:
         try:
             # Import NeMo (lazy import)
             try:
+                import torch
                 import nemo.collections.asr as nemo_asr
             except ImportError:
                 raise ImportError(
@@ -63,6 +66,8 @@ class ParakeetTranscriber:
                 self.model = self.model.cpu()
             
             self.model.eval()
+            self._torch = torch
+            self._torch_device = next(self.model.parameters()).device
             logger.info("Parakeet model loaded successfully")
         
         except Exception as e:
@@ -81,7 +86,7 @@ class ParakeetTranscriber:
         """Transcribe audio data.
         
         Args:
-            audio_data: Audio data as numpy array (int16)
+            audio_data: Audio data as numpy array (int16, or float32 in [-1, 1])
             sample_rate: Sample rate of audio data
             
         Returns:
@@ -95,35 +100,84 @@ class ParakeetTranscriber:
             return ""
         
         try:
-            # Convert int16 to float32 normalized to [-1, 1]
-            audio_float = audio_data.astype(np.float32) / 32768.0
-            
-            # NeMo expects a list of file paths or audio arrays
-            # We'll use the transcribe method with numpy array
-            import tempfile
-            import soundfile as sf
-            
-            # Save to temporary file (NeMo typically works with files)
-            with tempfile.NamedTemporaryFile(suffix='.wav', delete=True) as tmp:
-                sf.write(tmp.name, audio_float, sample_rate)
-                
-                # Transcribe
-                transcription = self.model.transcribe([tmp.name])
-            
-            if transcription and len(transcription) > 0:
-                # Handle both Hypothesis object (with .text attribute) and string
-                result = transcription[0]
-                text = result.text.strip() if hasattr(result, 'text') else str(result).strip()
-                logger.info(f"Transcription complete: {len(text)} characters")
-                return text
-            else:
-                logger.warning("No transcription returned")
-                return ""
+            text = self.transcribe_batch([audio_data], sample_rate)[0]
+            logger.info(f"Transcription complete: {len(text)} characters")
+            return text
         
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
     
+    def transcribe_batch(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int = 16000
+    ) -> list[str]:
+        """Transcribe several clips in one forward pass.
+        
+        Audio is handed to the model's preprocessor and encoder as a padded
+        tensor with per-clip lengths, so nothing is written to disk.
+        
+        Args:
+            audio_list: Audio clips as numpy arrays (int16 or float32)
+            sample_rate: Sample rate of the clips (must match the model, 16kHz)
+            
+        Returns:
+            Transcribed text for each clip
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        
+        if sample_rate != 16000:
+            raise ValueError(f"Parakeet expects 16000Hz audio, got {sample_rate}Hz")
+        
+        texts = [""] * len(audio_list)
+        indices = [i for i, audio in enumerate(audio_list) if len(audio) > 0]
+        if not indices:
+            return texts
+        
+        torch = self._torch
+        lengths = [len(audio_list[i]) for i in indices]
+        batch = np.zeros((len(indices), max(lengths)), dtype=np.float32)
+        for row, i in enumerate(indices):
+            batch[row, :lengths[row]] = self._to_float(audio_list[i])
+        
+        signal = torch.from_numpy(batch).to(self._torch_device)
+        signal_length = torch.tensor(lengths, dtype=torch.long, device=self._torch_device)
+        
+        with torch.inference_mode():
+            encoded, encoded_length = self.model.forward(
+                input_signal=signal,
+                input_signal_length=signal_length
+            )
+            hypotheses = self.model.decoding.rnnt_decoder_predictions_tensor(
+                encoder_output=encoded,
+                encoded_lengths=encoded_length,
+                return_hypotheses=False
+            )
+        
+        # Older NeMo versions return (best_hypotheses, all_hypotheses)
+        if isinstance(hypotheses, tuple):
+            hypotheses = hypotheses[0]
+        
+        for i, hypothesis in zip(indices, hypotheses):
+            texts[i] = self._hypothesis_text(hypothesis)
+        return texts
+    
+    @staticmethod
+    def _to_float(audio_data: np.ndarray) -> np.ndarray:
+        """Convert audio to float32 normalized to [-1, 1]."""
+        if audio_data.dtype == np.int16:
+            return audio_data.astype(np.float32) / 32768.0
+        return audio_data.astype(np.float32, copy=False)
+    
+    @staticmethod
+    def _hypothesis_text(hypothesis) -> str:
+        """Extract text from a Hypothesis object or plain string."""
+        if hasattr(hypothesis, 'text'):
+            return hypothesis.text.strip()
+        return str(hypothesis).strip()
+    
     def is_ready(self) -> bool:
         """Check if model is ready.
         
@@ -3,20 +3,58 @@
 import logging
 import numpy as np
 from typing import Optional
-from faster_whisper import WhisperModel
+
+from ..cancellation import CancelToken, TranscriptionCancelled
 
 
 logger = logging.getLogger(__name__)
 
+# Built-in decoding profiles; config can override them or add new ones
+DECODING_PROFILES = {
+    'accurate': {
+        'beam_size': 5,
+        'vad_filter': True,
+        'min_silence_duration_ms': 500,
+    },
+    'fast': {
+        'beam_size': 1,
+        'best_of': 1,
+        'vad_filter': True,
+        'min_silence_duration_ms': 500,
+        'condition_on_previous_text': False,
+        'without_timestamps': True,
+    },
+}
+
+# Options the batched long-form pipeline accepts from a profile
+BATCHED_OPTIONS = ('beam_size', 'best_of', 'patience', 'temperature')
+
+# Per-segment token cap for dictations with a deadline: generous for speech
+# (about 5 tokens per second), but it stops a decoder stuck repeating itself
+# within one segment, where the deadline is only checked between segments
+MAX_TOKENS_PER_SECOND = 12
+MIN_NEW_TOKENS = 32
+# Half of Whisper's 448-token context goes to the previous-text prompt
+MAX_NEW_TOKENS = 220
+
 
 class WhisperTranscriber:
     """Transcriber using faster-whisper."""
     
+    # transcribe() accepts a CancelToken and stops between decoded segments
+    cancellable = True
+    
     def __init__(
         self,
         model_size: str = "base",
         device: str = "cpu",
-        language: str = "en"
+        language: str = "en",
+        profile: str = "accurate",
+        profiles: Optional[dict] = None,
+        adaptive_threshold: float = 5.0,
+        compute_type: str = "auto",
+        cpu_threads: int = 0,
+        num_workers: int = 1
     ):
         """Initialize Whisper transcriber.
         
@@ -24,52 +62,103 @@ class WhisperTranscriber:
             model_size: Model size (tiny, base, small, medium, large-v2, large-v3)
             device: Device to use (cpu, cuda)
             language: Language code (en, es, fr, etc.) or 'auto' for detection
+            profile: Decoding profile name, or 'adaptive'
+            profiles: Profile definitions merged over the built-in ones
+            adaptive_threshold: Clips shorter than this (seconds) use the
+                fast profile in adaptive mode, longer ones the accurate one
+            compute_type: CTranslate2 compute type ('auto' picks by device)
+            cpu_threads: CPU threads per decode (0 for the library default)
+            num_workers: Decodes that may run in parallel
         """
         self.model_size = model_size
         self.device = device
         self.language = None if language == "auto" else language
-        self.model: Optional[WhisperModel] = None
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+        self.num_workers = num_workers
+        self.adaptive_threshold = adaptive_threshold
+        self.profiles = {name: dict(options) for name, options in DECODING_PROFILES.items()}
+        for name, options in (profiles or {}).items():
+            self.profiles.setdefault(name, {}).update(options)
+        if profile != 'adaptive' and profile not in self.profiles:
+            raise ValueError(
+                f"Unknown decoding profile: {profile}. "
+                f"Available: adaptive, {', '.join(sorted(self.profiles))}"
+            )
+        self.profile = profile
+        self.model: Optional[any] = None
+        self._batched = None  # BatchedInferencePipeline, created on first use
         
         logger.info(
             f"Initializing Whisper model: size={model_size}, "
-            f"device={device}, language={language}"
+            f"device={device}, language={language}, profile={profile}"
         )
         self._load_model()
     
     def _load_model(self) -> None:
         """Load the Whisper model."""
         try:
+            # Imported here so the app starts without paying for it up front
+            from faster_whisper import WhisperModel
+            
             # Determine compute type based on device
-            if self.device == "cuda":
-                compute_type = "float16"
-            else:
-                compute_type = "int8"
+            compute_type = self.compute_type
+            if compute_type == "auto":
+                compute_type = "float16" if self.device == "cuda" else "int8"
             
             self.model = WhisperModel(
                 self.model_size,
                 device=self.device,
                 compute_type=compute_type,
+                cpu_threads=self.cpu_threads,
+                num_workers=self.num_workers,
                 download_root=None  # Use default cache
             )
-            logger.info("Whisper model loaded successfully")
+            logger.info(f"Whisper model loaded successfully ({compute_type})")
         
         except Exception as e:
             logger.error(f"Failed to load Whisper model: {e}")
             raise
     
+    def decoding_options(self, duration: float) -> dict:
+        """Get faster-whisper decoding arguments for a clip.
+        
+        Args:
+            duration: Clip length in seconds
+            
+        Returns:
+            Keyword arguments for ``WhisperModel.transcribe``
+        """
+        name = self.profile
+        if name == 'adaptive':
+            # Short dictations are dominated by decoder overhead; beam search
+            # pays off on longer ones where context errors compound
+            name = 'fast' if duration < self.adaptive_threshold else 'accurate'
+        options = dict(self.profiles[name])
+        min_silence = options.pop('min_silence_duration_ms', None)
+        if min_silence is not None and options.get('vad_filter'):
+            options['vad_parameters'] = dict(min_silence_duration_ms=min_silence)
+        return options
+    
     def transcribe(
         self,
         audio_data: np.ndarray,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
     ) -> str:
         """Transcribe audio data.
         
         Args:
-            audio_data: Audio data as numpy array (int16)
+            audio_data: Audio data as numpy array (int16, or float32 in [-1, 1])
             sample_rate: Sample rate of audio data
+            token: Checked between segments; decoding stops once it is
+                cancelled. With a deadline, tokens per segment are capped too
             
         Returns:
             Transcribed text
+            
+        Raises:
+            TranscriptionCancelled: If the token was cancelled
         """
         if self.model is None:
             raise RuntimeError("Model not loaded")
@@ -80,22 +169,31 @@ class WhisperTranscriber:
         
         try:
             # Convert int16 to float32 normalized to [-1, 1]
-            audio_float = audio_data.astype(np.float32) / 32768.0
+            if audio_data.dtype == np.int16:
+                audio_float = audio_data.astype(np.float32) / 32768.0
+            else:
+                audio_float = audio_data.astype(np.float32, copy=False)
+            
+            duration = len(audio_float) / sample_rate
+            options = self.decoding_options(duration)
+            if token is not None and token.deadline is not None:
+                # Segments span at most 30 seconds
+                tokens = MIN_NEW_TOKENS + int(min(duration, 30.0) * MAX_TOKENS_PER_SECOND)
+                options.setdefault('max_new_tokens', min(tokens, MAX_NEW_TOKENS))
             
             # Transcribe
             segments, info = self.model.transcribe(
                 audio_float,
                 language=self.language,
-                beam_size=5,
-                vad_filter=True,  # Voice activity detection
-                vad_parameters=dict(
-                    min_silence_duration_ms=500
-                )
+                **options
             )
             
-            # Collect all segments
+            # Collect all segments; the generator decodes lazily, so
+            # stopping here skips the remaining audio
             text_parts = []
             for segment in segments:
+                if token is not None:
+                    token.check()
                 text_parts.append(segment.text)
             
             full_text = " ".join(text_parts).strip()
@@ -107,10 +205,79 @@ class WhisperTranscriber:
             logger.info(f"Transcription complete: {len(full_text)} characters")
             return full_text
         
+        except TranscriptionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Transcription failed: {e}")
             raise
     
+    def transcribe_batch(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> list[str]:
+        """Transcribe several clips.
+        
+        CTranslate2 batches the windows of one recording (see
+        ``transcribe_segments``) but not separate clips, so they are
+        decoded one after another.
+        
+        Args:
+            audio_list: Audio clips as numpy arrays (int16 or float32)
+            sample_rate: Sample rate of the clips
+            token: As for ``transcribe``, shared by all clips
+            
+        Returns:
+            Transcribed text for each clip
+        """
+        return [self.transcribe(audio, sample_rate, token) if len(audio) else "" for audio in audio_list]
+    
+    def transcribe_segments(
+        self,
+        audio_data: np.ndarray,
+        batch_size: int = 8
+    ) -> list[tuple[float, float, str]]:
+        """Transcribe a long 16kHz recording with timestamps.
+        
+        Uses faster-whisper's batched pipeline, which splits the audio at
+        speech boundaries and decodes up to ``batch_size`` windows per
+        forward pass (falls back to sequential decoding on older versions).
+        
+        Args:
+            audio_data: Audio data (int16, or float32 in [-1, 1]) at 16kHz
+            batch_size: Windows decoded together
+            
+        Returns:
+            (start seconds, end seconds, text) per segment
+        """
+        if self.model is None:
+            raise RuntimeError("Model not loaded")
+        
+        if audio_data.dtype == np.int16:
+            audio_float = audio_data.astype(np.float32) / 32768.0
+        else:
+            audio_float = audio_data.astype(np.float32, copy=False)
+        
+        options = self.decoding_options(len(audio_float) / 16000)
+        # Segment timestamps are the point of long-form output
+        options.pop('without_timestamps', None)
+        try:
+            from faster_whisper import BatchedInferencePipeline
+        except ImportError:
+            logger.warning("faster-whisper without BatchedInferencePipeline, decoding sequentially")
+            segments, _ = self.model.transcribe(audio_float, language=self.language, **options)
+        else:
+            if self._batched is None:
+                self._batched = BatchedInferencePipeline(model=self.model)
+            segments, _ = self._batched.transcribe(
+                audio_float,
+                language=self.language,
+                batch_size=batch_size,
+                **{k: v for k, v in options.items() if k in BATCHED_OPTIONS}
+            )
+        return [(segment.start, segment.end, segment.text.strip()) for segment in segments]
+    
     def is_ready(self) -> bool:
         """Check if model is ready.
         
@@ -0,0 +1,299 @@
+"""Worker pipeline that transcribes and injects dictations off the listener thread."""
+
+import logging
+import queue
+import threading
+import time
+from typing import Optional
+
+from .dictation import (
+    DICTATIONS, OUTCOMES, QUEUE_WAIT, SILENCE_TRIMMED, ActiveJobs, DictationJob, transcribe_job, trim_silence
+)
+from .metrics import REGISTRY, STAGE_SECONDS, span
+from .refine import DraftRefiner
+from .vad import EnergyVAD
+
+
+logger = logging.getLogger(__name__)
+
+__all__ = ['DictationJob', 'DictationPipeline']
+
+
+class DictationPipeline:
+    """Bounded job queue with a transcription worker and an injection worker."""
+
+    def __init__(
+        self,
+        transcriber,
+        text_injector,
+        max_queue_size: int = 4,
+        vad: Optional[EnergyVAD] = None,
+        min_audio_length: float = 0.3,
+        deadline_seconds: float = 0.0,
+        deadline_per_audio_second: float = 1.0,
+        refine_max_delay: float = 10.0,
+        refine_max_change_ratio: float = 1.0
+    ):
+        """Initialize pipeline.
+
+        Args:
+            transcriber: Transcriber used by the transcription worker
+            text_injector: TextInjector used by the injection worker
+            max_queue_size: Maximum dictations waiting for transcription
+            vad: Voice activity detector used to trim silence (None to disable)
+            min_audio_length: Shortest recording transcribed when VAD is disabled
+            deadline_seconds: Base time a transcription may take before it is
+                aborted (0 disables deadlines)
+            deadline_per_audio_second: Extra time allowed per second of audio
+            refine_max_delay: With a draft model, seconds after the draft was
+                typed during which the refined transcript may replace it
+            refine_max_change_ratio: Largest fraction of the draft's text a
+                refinement may change (0 to 1, by character similarity)
+        """
+        self.transcriber = transcriber
+        self.text_injector = text_injector
+        self.vad = vad
+        self.min_audio_length = min_audio_length
+        self.deadline_seconds = deadline_seconds
+        self.deadline_per_audio_second = deadline_per_audio_second
+
+        self._transcription_queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._injection_queue: queue.Queue = queue.Queue()
+        self._threads: list[threading.Thread] = []
+        self.jobs = ActiveJobs()
+        self.refiner = DraftRefiner(
+            transcriber,
+            text_injector,
+            self.jobs,
+            self._injection_queue,
+            max_delay=refine_max_delay,
+            max_change_ratio=refine_max_change_ratio
+        )
+        # Most recent transcript, for re-injecting it without decoding again
+        self.last_text: Optional[str] = None
+
+        REGISTRY.gauge(
+            "wispr_transcription_queue_depth",
+            "Dictations waiting for transcription",
+            self.queue_depth
+        )
+        REGISTRY.gauge(
+            "wispr_injection_queue_depth",
+            "Transcripts waiting for injection",
+            self._injection_queue.qsize
+        )
+
+    def start(self) -> None:
+        """Start the worker threads."""
+        if self._threads:
+            logger.warning("Pipeline already running")
+            return
+
+        workers = {
+            "transcription-worker": self._transcription_loop,
+            "refine-worker": self.refiner.run,
+            "injection-worker": self._injection_loop,
+        }
+        self._threads = [
+            threading.Thread(target=target, name=name, daemon=True)
+            for name, target in workers.items()
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info("Dictation pipeline started")
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the workers after the jobs already queued.
+
+        Jobs that can't be queued ahead of the stop signal within the
+        timeout (a stuck worker with a full queue) are dropped, and workers
+        still busy when it expires are left behind (they are daemon
+        threads), so shutdown never hangs.
+
+        Args:
+            timeout: Seconds to wait in total
+        """
+        if not self._threads:
+            return
+
+        deadline = time.monotonic() + timeout
+        try:
+            self._transcription_queue.put(None, timeout=timeout)
+        except queue.Full:
+            self._drop_pending()
+        for thread in self._threads:
+            thread.join(max(deadline - time.monotonic(), 0))
+            if thread.is_alive():
+                logger.warning(f"Pipeline worker {thread.name} did not stop within {timeout}s")
+        self._threads = []
+        logger.info(f"Dictation pipeline stopped: {self.metrics()}")
+
+    def _drop_pending(self) -> None:
+        """Discard waiting dictations to make room for the stop signal."""
+        while True:
+            try:
+                job = self._transcription_queue.get_nowait()
+            except queue.Empty:
+                break
+            if job is not None:
+                logger.warning(f"Dropping dictation {job.job_id} on shutdown")
+                self.jobs.discard(job, 'dropped')
+        try:
+            self._transcription_queue.put_nowait(None)
+        except queue.Full:
+            # Refilled by a concurrent submit; the workers are abandoned
+            logger.error("Could not signal the transcription worker to stop")
+
+    def submit(self, job: DictationJob) -> bool:
+        """Queue a dictation without blocking the caller.
+
+        Args:
+            job: Dictation to transcribe
+
+        Returns:
+            True if queued, False if the queue is full
+        """
+        self.jobs.add(job)
+        try:
+            self._transcription_queue.put_nowait(job)
+        except queue.Full:
+            logger.error(f"Pipeline queue full, dropping dictation {job.job_id}")
+            self.jobs.discard(job, 'dropped')
+            return False
+
+        DICTATIONS.inc(outcome='submitted')
+        logger.debug(f"Queued dictation {job.job_id} (depth {self.queue_depth()})")
+        return True
+
+    def reinject_last(self) -> bool:
+        """Queue the most recent transcript for injection again.
+
+        Returns:
+            True if there was a transcript to inject
+        """
+        if not self.last_text:
+            logger.info("No transcript to re-inject yet")
+            return False
+        self._injection_queue.put((None, self.last_text, time.monotonic()))
+        return True
+
+    def preempt(self, window: Optional[float] = None) -> int:
+        """Cancel dictations superseded by a new recording (see ActiveJobs.preempt)."""
+        return self.jobs.preempt(window)
+
+    def queue_depth(self) -> int:
+        """Get number of dictations waiting for transcription.
+
+        Returns:
+            Approximate queue size
+        """
+        return self._transcription_queue.qsize()
+
+    def metrics(self) -> dict:
+        """Get dictation counts and current queue depths.
+
+        Returns:
+            Dictionary of outcome counters and queue depths
+        """
+        metrics = {outcome: DICTATIONS.value(outcome=outcome) for outcome in OUTCOMES}
+        metrics['silence_trimmed_seconds'] = SILENCE_TRIMMED.value()
+        metrics['transcription_queue_depth'] = self.queue_depth()
+        metrics['injection_queue_depth'] = self._injection_queue.qsize()
+        return metrics
+
+    def _transcription_loop(self) -> None:
+        """Transcribe queued dictations in order."""
+        while True:
+            job = self._transcription_queue.get()
+            if job is None:
+                self.refiner.queue.put(None)
+                return
+
+            wait = time.monotonic() - job.created_at
+            QUEUE_WAIT.observe(wait, queue='transcription')
+            if job.token.cancelled:
+                logger.info(f"Skipping dictation {job.job_id}: {job.token.reason}")
+                job.audio_data = None
+                self.jobs.discard(job, 'cancelled')
+                continue
+
+            logger.info(
+                f"Transcribing dictation {job.job_id} "
+                f"(waited {wait:.3f}s, {self.queue_depth()} queued)"
+            )
+
+            if not trim_silence(job, self.vad, self.min_audio_length):
+                job.audio_data = None
+                self.jobs.discard(job)
+                continue
+
+            if self.deadline_seconds > 0:
+                duration = len(job.audio_data) / job.sample_rate
+                job.token.set_deadline(self.deadline_seconds + self.deadline_per_audio_second * duration)
+
+            if job.session is None and getattr(self.transcriber, 'has_draft', False):
+                self.refiner.draft(job)
+                continue
+
+            text = transcribe_job(self.transcriber, job, self.jobs)
+            if text is None:
+                continue
+
+            logger.info(f"Transcription: {text}")
+            self._injection_queue.put((job, text, time.monotonic()))
+
+    def _injection_loop(self) -> None:
+        """Inject transcribed text in the order it was dictated."""
+        while True:
+            item = self._injection_queue.get()
+            if item is None:
+                return
+
+            job, text, queued_at, *kind = item
+            kind = kind[0] if kind else 'final'
+            if job is None:
+                # Re-injection of the last transcript, outside dictation metrics
+                self.refiner.on_screen = None
+                try:
+                    self.text_injector.inject_text(text)
+                except Exception as e:
+                    logger.error(f"Error re-injecting last transcript: {e}")
+                continue
+
+            QUEUE_WAIT.observe(time.monotonic() - queued_at, queue='injection')
+            if kind != 'draft':
+                self.last_text = text
+            if kind == 'refine':
+                self.refiner.apply(job, text)
+                continue
+            if job.token.cancelled:
+                logger.info(f"Not injecting dictation {job.job_id}: {job.token.reason}")
+                self.jobs.discard(job, 'cancelled')
+                continue
+
+            typed = " " + text if job.join_previous else text
+            self.refiner.on_screen = None
+            try:
+                with span('injection'):
+                    if job.live_injector is not None:
+                        # Most of the text is already on screen
+                        success = job.live_injector.finish(text)
+                    else:
+                        success = self.text_injector.inject_text(typed)
+            except Exception as e:
+                success = False
+                logger.error(f"Error injecting dictation {job.job_id}: {e}")
+
+            if kind == 'draft':
+                self.refiner.draft_typed(job, typed, success)
+                continue
+
+            self.jobs.pop(job.job_id)
+            if success:
+                DICTATIONS.inc(outcome='completed')
+                STAGE_SECONDS.observe(time.monotonic() - job.created_at, stage='release_to_text')
+                logger.info("Text injected successfully")
+            else:
+                DICTATIONS.inc(outcome='failed')
+                logger.error("Failed to inject text")
+            logger.debug(f"Pipeline metrics: {self.metrics()}")
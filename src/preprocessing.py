@@ -0,0 +1,54 @@
+"""Capture-time conversion of raw device audio into model-ready samples."""
+
+import numpy as np
+
+from .resampler import StreamingResampler
+
+
+class CapturePreprocessor:
+    """Downmixes, resamples and normalizes audio chunks as they are captured.
+
+    Each raw int16 chunk from the device becomes float32 mono audio in
+    [-1, 1] at the model's sample rate, so nothing is left to do once the
+    recording stops. The resampler's filter delay means the last few
+    milliseconds of a stream only come out with the following chunk, which
+    is negligible for dictation.
+    """
+
+    def __init__(self, input_rate: int, channels: int = 1, target_rate: int = 16000):
+        """Initialize preprocessor.
+
+        Args:
+            input_rate: Device sample rate in Hz
+            channels: Number of interleaved channels in the raw chunks
+            target_rate: Sample rate expected by the model
+        """
+        self.input_rate = input_rate
+        self.channels = channels
+        self.target_rate = target_rate
+        self._resampler = (
+            StreamingResampler(input_rate, target_rate)
+            if input_rate != target_rate else None
+        )
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Convert one raw chunk.
+
+        Args:
+            chunk: Interleaved int16 samples from the device
+
+        Returns:
+            Mono float32 samples at the target rate
+        """
+        audio = chunk.astype(np.float32) / 32768.0
+        if self.channels > 1:
+            frames = len(audio) // self.channels
+            audio = audio[:frames * self.channels].reshape(frames, self.channels).mean(axis=1)
+        if self._resampler is not None:
+            audio = self._resampler.process(audio)
+        return audio
+
+    def reset(self) -> None:
+        """Forget resampler state, e.g. after the stream was reopened."""
+        if self._resampler is not None:
+            self._resampler.reset()
@@ -0,0 +1,137 @@
+"""Hold-to-record dictation: record while the hotkey is held, submit on release."""
+
+import logging
+import time
+from typing import Optional
+
+from .config import Config
+from .dictation import DictationJob
+from .incremental_injector import IncrementalInjector
+from .metrics import span
+from .streaming import StreamingSession
+from .vad import EnergyVAD
+
+
+logger = logging.getLogger(__name__)
+
+
+class PushToTalk:
+    """Records a dictation per hotkey hold and hands it to the pipeline."""
+
+    def __init__(
+        self,
+        config: Config,
+        recorder,
+        pipeline,
+        transcriber,
+        text_injector,
+        vad: Optional[EnergyVAD] = None
+    ):
+        """Initialize push-to-talk.
+
+        Args:
+            config: Application configuration (pipeline and streaming sections)
+            recorder: AudioRecorder to record from
+            pipeline: DictationPipeline receiving the recordings
+            transcriber: Transcriber used by streaming sessions
+            text_injector: TextInjector used for live injection
+            vad: Voice activity detector for streaming windows
+        """
+        self.config = config
+        self.recorder = recorder
+        self.pipeline = pipeline
+        self.transcriber = transcriber
+        self.text_injector = text_injector
+        self.vad = vad
+        self.streaming_session: Optional[StreamingSession] = None
+        self.live_injector: Optional[IncrementalInjector] = None
+
+    def press(self) -> None:
+        """Start recording, cancelling superseded dictations if configured."""
+        logger.info("Hotkey pressed - Starting recording")
+        preempt = self.config.pipeline.preempt
+        if preempt != "off":
+            self.pipeline.preempt(None if preempt == "all" else self.config.pipeline.preempt_window)
+        try:
+            if self.config.streaming.enabled:
+                self._start_streaming()
+            self.recorder.start_recording()
+        except Exception as e:
+            session = self._stop_streaming()
+            if session is not None:
+                session.cancel()
+            if self.live_injector is not None:
+                self.live_injector.cancel()
+                self.live_injector = None
+            logger.error(f"Failed to start recording: {e}")
+
+    def release(self) -> None:
+        """Stop recording and submit the dictation to the pipeline."""
+        logger.info("Hotkey released - Stopping recording")
+        released_at = time.monotonic()
+
+        try:
+            # Stop recording and get audio data
+            with span('hotkey_release'):
+                audio_data = self.recorder.stop_recording()
+                session = self._stop_streaming()
+                live_injector, self.live_injector = self.live_injector, None
+
+            if audio_data is None:
+                logger.warning("No audio data to transcribe")
+                if session is not None:
+                    session.cancel()
+                if live_injector is not None:
+                    live_injector.cancel()
+                return
+
+            duration = self.recorder.get_audio_duration(audio_data)
+            logger.info(f"Recorded audio duration: {duration:.2f}s")
+
+            # Hand off to the pipeline so the listener thread returns immediately
+            self.pipeline.submit(DictationJob(
+                audio_data=audio_data,
+                sample_rate=self.recorder.output_sample_rate,
+                session=session,
+                live_injector=live_injector,
+                created_at=released_at
+            ))
+
+        except Exception as e:
+            logger.error(f"Error processing recording: {e}", exc_info=True)
+
+    def _start_streaming(self) -> None:
+        """Start a streaming session fed by the recorder's chunks."""
+        streaming = self.config.streaming
+        on_update = None
+        if streaming.live_injection:
+            self.live_injector = IncrementalInjector(
+                self.text_injector,
+                min_interval=streaming.live_min_interval,
+                inject_tentative=streaming.live_tentative
+            )
+            self.live_injector.start()
+            on_update = self.live_injector.update
+
+        self.streaming_session = StreamingSession(
+            self.transcriber,
+            window_seconds=streaming.window_seconds,
+            step_seconds=streaming.step_seconds,
+            overlap_seconds=streaming.overlap_seconds,
+            on_update=on_update,
+            vad=self.vad
+        )
+        self.recorder.add_chunk_listener(self.streaming_session.feed)
+        self.streaming_session.start()
+
+    def _stop_streaming(self) -> Optional[StreamingSession]:
+        """Detach the current streaming session from the recorder.
+
+        Returns:
+            The detached session, or None if streaming was not active
+        """
+        session = self.streaming_session
+        self.streaming_session = None
+        if session is not None:
+            self.recorder.remove_chunk_listener(session.feed)
+        return session
@@ -0,0 +1,189 @@
+"""Two-pass decoding: a typed draft is replaced by the main model's transcript."""
+
+import difflib
+import logging
+import queue
+import time
+from typing import Optional
+
+from .cancellation import TranscriptionCancelled
+from .dictation import DICTATIONS, ActiveJobs, DictationJob
+from .incremental_injector import plan_edit
+from .metrics import REGISTRY, STAGE_SECONDS, span
+
+
+logger = logging.getLogger(__name__)
+
+REFINEMENTS = REGISTRY.counter(
+    "wispr_refinements_total", "Two-pass refinements by result (applied, unchanged, rejected, failed)"
+)
+
+
+class DraftRefiner:
+    """Second pass of the dictation pipeline for transcribers with a draft model.
+
+    The transcription worker calls ``draft`` to queue a dictation's draft
+    text for typing; the refine worker (``run``) then decodes it with the
+    main model and queues the result, which the injection worker hands to
+    ``apply`` to edit the draft on screen into it.
+    """
+
+    def __init__(
+        self,
+        transcriber,
+        text_injector,
+        jobs: ActiveJobs,
+        injection_queue: queue.Queue,
+        max_delay: float = 10.0,
+        max_change_ratio: float = 1.0
+    ):
+        """Initialize refiner.
+
+        Args:
+            transcriber: Transcriber with a draft model
+            text_injector: TextInjector used to edit the draft
+            jobs: The pipeline's active dictations
+            injection_queue: The injection worker's queue
+            max_delay: Seconds after the draft was typed during which the
+                refined transcript may replace it
+            max_change_ratio: Largest fraction of the draft's text a
+                refinement may change (0 to 1, by character similarity)
+        """
+        self.transcriber = transcriber
+        self.text_injector = text_injector
+        self.jobs = jobs
+        self.injection_queue = injection_queue
+        self.max_delay = max_delay
+        self.max_change_ratio = max_change_ratio
+        # Drafted dictations waiting for the main model
+        self.queue: queue.Queue = queue.Queue()
+        # (job_id, typed text, window, time) of the last draft typed, while
+        # nothing else has been typed after it
+        self.on_screen: Optional[tuple] = None
+
+    def draft(self, job: DictationJob) -> None:
+        """First pass: queue the draft model's text, then hand off to the refine worker."""
+        try:
+            draft = self.transcriber.transcribe_draft(job.audio_data, job.sample_rate, token=job.token)
+        except TranscriptionCancelled as e:
+            logger.info(f"Dictation {job.job_id} cancelled: {e}")
+            job.audio_data = None
+            self.jobs.discard(job, 'cancelled')
+            return
+        except Exception as e:
+            # The main model still transcribes it
+            logger.warning(f"Draft transcription of dictation {job.job_id} failed: {e}")
+            draft = ""
+        if draft:
+            logger.info(f"Draft: {draft}")
+            self.injection_queue.put((job, draft, time.monotonic(), 'draft'))
+        self.queue.put((job, draft))
+
+    def run(self) -> None:
+        """Second pass: transcribe drafted dictations with the main model."""
+        while True:
+            item = self.queue.get()
+            if item is None:
+                self.injection_queue.put(None)
+                return
+
+            job, draft = item
+            try:
+                # Don't decode a dictation cancelled while its draft was handled
+                job.token.check()
+                text = self.transcriber.transcribe(job.audio_data, job.sample_rate, token=job.token)
+            except TranscriptionCancelled as e:
+                logger.info(f"Refinement of dictation {job.job_id} cancelled: {e}")
+                if not draft:
+                    self.jobs.discard(job, 'cancelled')
+                    continue
+                # The draft on screen stays as the result
+                text = draft
+            except Exception as e:
+                logger.error(f"Error refining dictation {job.job_id}: {e}", exc_info=True)
+                text = draft
+            finally:
+                job.audio_data = None
+
+            if not text:
+                logger.warning("Transcription returned empty text")
+                self.jobs.discard(job, 'completed')
+                continue
+
+            logger.info(f"Transcription: {text}")
+            self.injection_queue.put((job, text, time.monotonic(), 'refine' if draft else 'final'))
+
+    def draft_typed(self, job: DictationJob, typed: str, success: bool) -> None:
+        """Remember a draft the injection worker typed, for its refinement."""
+        if success:
+            # Perceived latency; the dictation completes with its refinement
+            STAGE_SECONDS.observe(time.monotonic() - job.created_at, stage='release_to_draft')
+            self.on_screen = (job.job_id, typed, self.text_injector.get_active_window_id(), time.monotonic())
+        else:
+            # Nothing on screen; the refined text is typed in full instead
+            logger.warning(f"Failed to inject draft of dictation {job.job_id}")
+            self.on_screen = (job.job_id, "", None, time.monotonic())
+
+    def apply(self, job: DictationJob, text: str) -> None:
+        """Replace a typed draft with the main model's transcript, if still safe.
+
+        The edit is only made while the draft is the last thing typed, focus
+        hasn't moved, it arrives within ``max_delay`` and it changes at most
+        ``max_change_ratio`` of the draft; otherwise the draft stays as the
+        result.
+        """
+        if self.jobs.pop(job.job_id) is None:
+            return  # Cancelled before its draft was typed
+        DICTATIONS.inc(outcome='completed')
+        self._edit(job, text)
+        # The dictation's final text (refined or the kept draft) is on screen now
+        STAGE_SECONDS.observe(time.monotonic() - job.created_at, stage='release_to_text')
+
+    def _edit(self, job: DictationJob, text: str) -> None:
+        """Edit the typed draft into the refined text, or keep it with a logged reason."""
+        on_screen = self.on_screen
+        if on_screen is None or on_screen[0] != job.job_id:
+            REFINEMENTS.inc(result='rejected')
+            logger.info(f"Draft of dictation {job.job_id} is no longer the last text typed, keeping it")
+            return
+        self.on_screen = None
+        _, draft, window, typed_at = on_screen
+        target = " " + text if job.join_previous else text
+        backspaces, insert = plan_edit(draft, target)
+        if not backspaces and not insert:
+            REFINEMENTS.inc(result='unchanged')
+            return
+
+        change = 1 - difflib.SequenceMatcher(None, draft, target).ratio()
+        if job.token.cancelled:
+            reason = job.token.reason
+        elif not draft:
+            reason = None
+        elif time.monotonic() - typed_at > self.max_delay:
+            reason = f"arrived after {self.max_delay}s"
+        elif change > self.max_change_ratio:
+            reason = f"differs from it by {change:.0%}"
+        elif self.text_injector.get_active_window_id() != window:
+            reason = "focus moved"
+        else:
+            reason = None
+        if reason is not None:
+            REFINEMENTS.inc(result='rejected')
+            logger.info(f"Keeping draft of dictation {job.job_id}: {reason}")
+            return
+
+        try:
+            with span('refinement'):
+                success = (
+                    (not backspaces or self.text_injector.press_keys('BackSpace', backspaces))
+                    and (not insert or self.text_injector.inject_text(insert))
+                )
+        except Exception as e:
+            success = False
+            logger.error(f"Error refining dictation {job.job_id}: {e}")
+        if success:
+            REFINEMENTS.inc(result='applied')
+            logger.info(f"Refined dictation {job.job_id}: -{backspaces} +{len(insert)} characters")
+        else:
+            REFINEMENTS.inc(result='failed')
+            logger.error("Failed to apply refinement")
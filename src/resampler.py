@@ -0,0 +1,204 @@
+"""Rational polyphase resampling with cached filter design.
+
+Filter taps are designed once per (orig_sr, target_sr) pair. Whole clips are
+resampled with ``scipy.signal.resample_poly`` when scipy is available;
+``StreamingResampler`` applies the same filter chunk by chunk so audio can be
+resampled while it is being captured.
+"""
+
+import logging
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+# Outputs computed per vectorized block (bounds temporary memory)
+BLOCK_SIZE = 4096
+
+
+@dataclass(frozen=True)
+class PolyphaseFilter:
+    """Anti-aliasing low-pass filter split into polyphase components."""
+    up: int
+    down: int
+    taps: np.ndarray      # Prototype filter with unity DC gain
+    phases: np.ndarray    # (up, taps_per_phase) matrix, scaled by ``up``
+    delay: int            # Group delay in upsampled samples
+
+
+@lru_cache(maxsize=16)
+def design_filter(orig_sr: int, target_sr: int) -> PolyphaseFilter:
+    """Design the polyphase filter for a sample rate pair.
+
+    Uses the same Kaiser-windowed sinc as ``scipy.signal.resample_poly``.
+
+    Args:
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+
+    Returns:
+        Cached polyphase filter
+    """
+    divisor = gcd(orig_sr, target_sr)
+    up, down = target_sr // divisor, orig_sr // divisor
+
+    max_rate = max(up, down)
+    cutoff = 1.0 / max_rate
+    half_len = 10 * max_rate
+    n = np.arange(2 * half_len + 1) - half_len
+    taps = cutoff * np.sinc(cutoff * n) * np.kaiser(len(n), 5.0)
+    taps /= taps.sum()
+
+    per_phase = -(-len(taps) // up)
+    padded = np.zeros(per_phase * up)
+    padded[:len(taps)] = taps * up
+    phases = padded.reshape(per_phase, up).T.astype(np.float32)
+
+    logger.debug(
+        f"Designed resampling filter {orig_sr}->{target_sr}Hz: "
+        f"up={up}, down={down}, {len(taps)} taps"
+    )
+    return PolyphaseFilter(up, down, taps, phases, half_len)
+
+
+def resample(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Resample a whole clip.
+
+    Args:
+        audio: Input samples (any numeric dtype)
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+
+    Returns:
+        Resampled audio as float32, in the input's scale
+    """
+    if orig_sr == target_sr:
+        return audio.astype(np.float32)
+
+    poly = design_filter(orig_sr, target_sr)
+    try:
+        from scipy import signal
+    except ImportError:
+        resampler = StreamingResampler(orig_sr, target_sr)
+        return np.concatenate((resampler.process(audio), resampler.flush()))
+
+    return signal.resample_poly(
+        audio.astype(np.float32), poly.up, poly.down, window=poly.taps
+    ).astype(np.float32)
+
+
+def to_int16(audio: np.ndarray) -> np.ndarray:
+    """Round and clip resampled audio back to int16.
+
+    Args:
+        audio: Float samples in int16 scale
+
+    Returns:
+        Audio as int16
+    """
+    return np.clip(np.round(audio), -32768, 32767).astype(np.int16)
+
+
+
+def resample_like(audio: np.ndarray, orig_sr: int, target_sr: int) -> np.ndarray:
+    """Resample a whole clip, keeping int16 input as int16.
+
+    Args:
+        audio: Input samples (int16, or float32 in [-1, 1])
+        orig_sr: Input sample rate
+        target_sr: Output sample rate
+
+    Returns:
+        Resampled audio in the input's dtype
+    """
+    resampled = resample(audio, orig_sr, target_sr)
+    if audio.dtype == np.int16:
+        return to_int16(resampled)
+    return resampled
+
+
+class StreamingResampler:
+    """Resamples audio incrementally, one chunk at a time.
+
+    Concatenating the outputs of ``process`` and ``flush`` gives the same
+    result as ``resample`` on the whole clip.
+    """
+
+    def __init__(self, orig_sr: int, target_sr: int):
+        """Initialize streaming resampler.
+
+        Args:
+            orig_sr: Input sample rate
+            target_sr: Output sample rate
+        """
+        self.orig_sr = orig_sr
+        self.target_sr = target_sr
+        self._filter = design_filter(orig_sr, target_sr)
+        self._offsets = np.arange(self._filter.phases.shape[1])
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all buffered input."""
+        history = self._filter.phases.shape[1] - 1
+        # Absolute index of _buffer[0]; leading zeros stand in for the past
+        self._buffer = np.zeros(history, dtype=np.float32)
+        self._buffer_start = -history
+        self._inputs = 0
+        self._outputs = 0
+
+    def process(self, chunk: np.ndarray) -> np.ndarray:
+        """Resample a chunk of input.
+
+        Args:
+            chunk: Input samples
+
+        Returns:
+            Output samples that can be computed so far (float32)
+        """
+        self._buffer = np.concatenate((self._buffer, chunk.astype(np.float32)))
+        self._inputs += len(chunk)
+
+        poly = self._filter
+        available = (self._inputs * poly.up - 1 - poly.delay) // poly.down + 1
+        return self._emit(max(available, self._outputs))
+
+    def flush(self) -> np.ndarray:
+        """Produce the remaining output and reset for a new stream.
+
+        Returns:
+            Final output samples (float32)
+        """
+        poly = self._filter
+        total = -(-self._inputs * poly.up // poly.down)
+        padding = poly.delay // poly.up + poly.phases.shape[1] + 1
+        self._buffer = np.concatenate((self._buffer, np.zeros(padding, dtype=np.float32)))
+        output = self._emit(max(total, self._outputs))
+        self.reset()
+        return output
+
+    def _emit(self, end: int) -> np.ndarray:
+        """Compute outputs up to (not including) index ``end``."""
+        poly = self._filter
+        output = np.empty(end - self._outputs, dtype=np.float32)
+
+        for block_start in range(self._outputs, end, BLOCK_SIZE):
+            m = np.arange(block_start, min(block_start + BLOCK_SIZE, end))
+            position = m * poly.down + poly.delay
+            newest = position // poly.up - self._buffer_start
+            window = self._buffer[newest[:, None] - self._offsets[None, :]]
+            block = np.einsum('ij,ij->i', poly.phases[position % poly.up], window)
+            output[block_start - self._outputs:block_start - self._outputs + len(m)] = block
+
+        self._outputs = end
+
+        # Keep only the history needed by the next output
+        position = end * poly.down + poly.delay
+        oldest = position // poly.up - len(self._offsets) + 1 - self._buffer_start
+        if oldest > 0:
+            self._buffer = self._buffer[oldest:]
+            self._buffer_start += oldest
+        return output
@@ -0,0 +1,264 @@
+"""Routing clips across several resident transcription backends.
+
+Backends are listed from most to least accurate. Short clips go to the
+fastest backend; longer ones go to the most accurate backend whose
+expected latency (measured real-time factor x clip length, scaled by the
+dictations already queued) fits the latency budget. Real-time factors are
+tracked per backend as an exponentially weighted moving average, starting
+from a configured prior; estimates of backends that are not being used
+decay back towards their prior, so one slow sample doesn't exclude a
+backend for good.
+"""
+
+import json
+import logging
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import numpy as np
+
+from .cancellation import CancelToken
+from .metrics import REGISTRY
+
+
+logger = logging.getLogger(__name__)
+
+ROUTED = REGISTRY.counter(
+    "wispr_routed_clips_total", "Clips dispatched by the model router, by backend and reason"
+)
+
+
+@dataclass
+class RoutedBackend:
+    """A resident backend and its measured speed."""
+    name: str
+    model: object
+    prior: float  # Assumed real-time factor before (and between) measurements
+    rtf: float  # EWMA of decode seconds per audio second
+    samples: int = 0
+    warmed: bool = False
+
+
+class ModelRouter:
+    """Backend-compatible dispatcher over several loaded backends."""
+
+    # Passes cancellation tokens on to backends that accept them
+    cancellable = True
+
+    def __init__(
+        self,
+        latency_budget: float = 1.0,
+        short_clip_seconds: float = 2.0,
+        ewma_alpha: float = 0.3,
+        default_rtf: float = 0.5,
+        rtf_decay: float = 0.05,
+        decision_log: Optional[Path] = None
+    ):
+        """Initialize router (backends are added once loaded).
+
+        Args:
+            latency_budget: Longest acceptable decode time in seconds
+            short_clip_seconds: Clips up to this long go to the fastest backend
+            ewma_alpha: Weight of the newest measurement in the RTF average
+            default_rtf: RTF prior for backends without a configured one
+            rtf_decay: Fraction by which the estimates of backends not chosen
+                for a clip move back towards their prior
+            decision_log: JSONL file receiving one record per routed clip
+        """
+        self.latency_budget = latency_budget
+        self.short_clip_seconds = short_clip_seconds
+        self.ewma_alpha = ewma_alpha
+        self.default_rtf = default_rtf
+        self.rtf_decay = rtf_decay
+        self.decision_log = Path(decision_log).expanduser() if decision_log else None
+        self.backends: list[RoutedBackend] = []
+        # Returns the number of dictations waiting behind the current one
+        self.load_probe: Optional[Callable[[], int]] = None
+        self._log_lock = threading.Lock()
+
+    def add_backend(self, name: str, model, rtf: Optional[float] = None) -> None:
+        """Register a loaded backend (call in order of decreasing accuracy).
+
+        Args:
+            name: Name used in logs and metrics
+            model: Loaded backend
+            rtf: Expected real-time factor until measured (default_rtf if None)
+        """
+        prior = self.default_rtf if rtf is None else rtf
+        self.backends.append(RoutedBackend(name, model, prior=prior, rtf=prior))
+
+    def _fastest(self) -> RoutedBackend:
+        """Backend with the lowest RTF estimate.
+
+        Ties (e.g. unmeasured backends with equal priors) go to the one
+        listed last, i.e. the least accurate and presumably fastest.
+        """
+        return min(reversed(self.backends), key=lambda backend: backend.rtf)
+
+    def route(self, duration: float, depth: int = 0) -> tuple[RoutedBackend, str, float]:
+        """Choose the backend for a clip.
+
+        Args:
+            duration: Clip length in seconds
+            depth: Dictations queued behind the clip
+
+        Returns:
+            (backend, reason, estimated decode seconds)
+        """
+        fastest = self._fastest()
+        if duration <= self.short_clip_seconds:
+            return fastest, "short clip", fastest.rtf * duration
+
+        # Queued dictations of similar length have to be decoded first
+        scale = duration * (1 + depth)
+        for backend in self.backends:
+            estimate = backend.rtf * scale
+            if estimate <= self.latency_budget:
+                reason = "within budget" if not depth else f"within budget at queue depth {depth}"
+                return backend, reason, estimate
+        return fastest, "over budget, using fastest", fastest.rtf * scale
+
+    def _observe(self, backend: RoutedBackend, duration: float, elapsed: float) -> None:
+        """Fold a measured decode into the backend's RTF average."""
+        if duration <= 0:
+            return
+        rtf = elapsed / duration
+        if backend.samples == 0:
+            backend.rtf = rtf
+        else:
+            backend.rtf += self.ewma_alpha * (rtf - backend.rtf)
+        backend.samples += 1
+
+    def _decay(self, chosen: RoutedBackend) -> None:
+        """Move the estimates of the backends not chosen towards their prior.
+
+        A backend is only measured when it is used, so without this a single
+        slow sample (cold cache, GC pause) could keep it over budget forever.
+        """
+        for backend in self.backends:
+            if backend is not chosen:
+                backend.rtf += self.rtf_decay * (backend.prior - backend.rtf)
+
+    def transcribe(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Transcribe a clip with the backend chosen for it."""
+        def decode(model):
+            if token is not None and getattr(model, 'cancellable', False):
+                return model.transcribe(audio_data, sample_rate, token=token)
+            return model.transcribe(audio_data, sample_rate)
+
+        return self._dispatch(len(audio_data) / sample_rate, 1, decode)
+
+    def transcribe_batch(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> list[str]:
+        """Transcribe a batch with one backend, routed by its total audio length."""
+        def decode(model):
+            kwargs = {'token': token} if token is not None and getattr(model, 'cancellable', False) else {}
+            if hasattr(model, 'transcribe_batch'):
+                return model.transcribe_batch(audio_list, sample_rate, **kwargs)
+            return [model.transcribe(a, sample_rate, **kwargs) if len(a) else "" for a in audio_list]
+
+        return self._dispatch(sum(len(a) for a in audio_list) / sample_rate, len(audio_list), decode)
+
+    def _dispatch(self, duration: float, clips: int, decode: Callable[[object], object]):
+        """Route audio, decode it and record the decision and its outcome.
+
+        Args:
+            duration: Seconds of audio to decode
+            clips: Number of clips in the request
+            decode: Runs the request on the chosen backend's model
+        """
+        depth = self.load_probe() if self.load_probe is not None else 0
+        backend, reason, estimate = self.route(duration, depth)
+        self._decay(backend)
+        ROUTED.inc(clips, backend=backend.name, reason=reason)
+        batch = f" in {clips} clips" if clips > 1 else ""
+        logger.info(
+            f"Routing {duration:.1f}s of audio{batch} to {backend.name} "
+            f"({reason}, estimated {estimate:.2f}s)"
+        )
+
+        start = time.perf_counter()
+        result = decode(backend.model)
+        elapsed = time.perf_counter() - start
+
+        self._observe(backend, duration, elapsed)
+        logger.info(
+            f"{backend.name} decoded {duration:.1f}s in {elapsed:.2f}s "
+            f"(RTF now {backend.rtf:.3f}, budget {self.latency_budget:.2f}s)"
+        )
+        self._log_decision(backend, reason, duration, clips, depth, estimate, elapsed)
+        return result
+
+    def transcribe_segments(self, audio_data: np.ndarray, batch_size: int = 8):
+        """Long-form transcription with the most accurate backend that supports it.
+
+        Returns:
+            (start, end, text) segments, or None if no backend has a
+            long-form API
+        """
+        for backend in self.backends:
+            if hasattr(backend.model, 'transcribe_segments'):
+                return backend.model.transcribe_segments(audio_data, batch_size)
+        return None
+
+    def warmup(self, audio: np.ndarray, sample_rate: int = 16000) -> None:
+        """Run a warm-up clip through every backend, seeding their RTFs.
+
+        The first (cold) call of each backend is not measured.
+        """
+        duration = len(audio) / sample_rate
+        for backend in self.backends:
+            start = time.perf_counter()
+            backend.model.transcribe(audio, sample_rate)
+            if backend.warmed:
+                self._observe(backend, duration, time.perf_counter() - start)
+            backend.warmed = True
+        summary = ", ".join(f"{b.name}: {b.rtf:.3f}" for b in self.backends)
+        logger.debug(f"Router RTF after {duration:.1f}s warm-up clip: {summary}")
+
+    def _log_decision(
+        self,
+        backend: RoutedBackend,
+        reason: str,
+        duration: float,
+        clips: int,
+        depth: int,
+        estimate: float,
+        elapsed: float
+    ) -> None:
+        """Append a routing decision and its outcome to the decision log."""
+        if self.decision_log is None:
+            return
+        record = {
+            'time': round(time.time(), 3),
+            'backend': backend.name,
+            'reason': reason,
+            'duration': round(duration, 3),
+            'clips': clips,
+            'queue_depth': depth,
+            'estimate': round(estimate, 3),
+            'elapsed': round(elapsed, 3),
+            'rtf': round(backend.rtf, 4),
+            'budget': self.latency_budget,
+        }
+        try:
+            with self._log_lock, open(self.decision_log, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record) + "\n")
+        except OSError as e:
+            logger.warning(f"Failed to write routing decision log: {e}")
+
+    def is_ready(self) -> bool:
+        """Check that every backend is loaded."""
+        return bool(self.backends) and all(b.model.is_ready() for b in self.backends)
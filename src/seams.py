@@ -0,0 +1,31 @@
+"""De-duplication of words repeated where consecutive decode windows overlap."""
+
+import re
+
+
+# Longest run of words compared when de-duplicating window seams
+MAX_SEAM_WORDS = 8
+
+
+def _normalize_word(word: str) -> str:
+    """Normalize a word for comparison (case and punctuation insensitive)."""
+    return re.sub(r"[^\w']", "", word.lower())
+
+
+def seam_overlap_length(committed: list[str], words: list[str]) -> int:
+    """Find how many leading words repeat the tail of the committed text.
+
+    Args:
+        committed: Words already committed
+        words: Hypothesis for the new window
+
+    Returns:
+        Number of leading words in ``words`` to drop
+    """
+    limit = min(len(committed), len(words), MAX_SEAM_WORDS)
+    for k in range(limit, 0, -1):
+        tail = [_normalize_word(w) for w in committed[-k:]]
+        head = [_normalize_word(w) for w in words[:k]]
+        if tail == head:
+            return k
+    return 0
@@ -0,0 +1,298 @@
+"""Streaming transcription while the hotkey is still held.
+
+Audio chunks are fed in from the recorder callback and decoded in sliding
+windows on a background thread. The text of the current window stays
+tentative; when a window fills up, its text is committed and the window
+slides forward keeping a short overlap, so on release only the last window
+has to be decoded. Chunks are resampled to the model rate as they arrive.
+"""
+
+import logging
+import threading
+from typing import Callable, Optional
+
+import numpy as np
+
+from .metrics import span, stage_alias
+from .resampler import StreamingResampler, to_int16
+from .seams import seam_overlap_length
+
+
+logger = logging.getLogger(__name__)
+
+
+class StreamingSession:
+    """Incrementally transcribes one dictation while it is being recorded."""
+
+    def __init__(
+        self,
+        transcriber,
+        window_seconds: float = 8.0,
+        step_seconds: float = 1.0,
+        overlap_seconds: float = 1.0,
+        on_update: Optional[Callable[[str, str], None]] = None,
+        target_sample_rate: int = 16000,
+        vad=None
+    ):
+        """Initialize streaming session.
+
+        Args:
+            transcriber: Transcriber used to decode windows
+            window_seconds: Maximum audio decoded in one pass
+            step_seconds: New audio required before re-decoding the window
+            overlap_seconds: Audio kept from the previous window when sliding
+            on_update: Called with (committed, tentative) text after each decode
+            target_sample_rate: Sample rate the windows are decoded at
+            vad: Optional EnergyVAD; windows without speech are not decoded
+        """
+        self.transcriber = transcriber
+        self.window_seconds = window_seconds
+        self.step_seconds = step_seconds
+        self.overlap_seconds = min(overlap_seconds, window_seconds / 2)
+        self.on_update = on_update
+        self.vad = vad
+
+        self.sample_rate: Optional[int] = None
+        self.target_sample_rate = target_sample_rate
+        self._resampler: Optional[StreamingResampler] = None
+        self._pending: list[np.ndarray] = []
+        self._input_dtype = None
+        self._input_samples = 0
+        self._last_decoded_input = 0
+
+        # Resampled audio at the target rate
+        self._chunks: list[np.ndarray] = []
+        self._chunk_starts: list[int] = []
+        self._total_samples = 0
+        self._window_start = 0
+
+        self._committed: list[str] = []
+        self._tentative: list[str] = []
+
+        self._cond = threading.Condition()
+        self._stopping = False
+        self._worker: Optional[threading.Thread] = None
+
+    @property
+    def committed_text(self) -> str:
+        """Text that will not change anymore."""
+        return " ".join(self._committed)
+
+    @property
+    def tentative_text(self) -> str:
+        """Text of the current window that may still be revised."""
+        return " ".join(self._tentative)
+
+    def start(self) -> None:
+        """Start the background decoding thread."""
+        self._worker = threading.Thread(
+            target=self._run, name="streaming-decoder", daemon=True
+        )
+        self._worker.start()
+
+    def feed(self, chunk: np.ndarray, sample_rate: int) -> None:
+        """Append an audio chunk. Safe to call from the audio callback.
+
+        Args:
+            chunk: Audio samples
+            sample_rate: Sample rate of the chunk
+        """
+        with self._cond:
+            if self._stopping:
+                return
+            self.sample_rate = sample_rate
+            self._input_dtype = chunk.dtype
+            self._pending.append(chunk)
+            self._input_samples += len(chunk)
+            self._cond.notify()
+
+    def finish(self) -> str:
+        """Stop streaming, decode the final window and return the full text.
+
+        Returns:
+            Transcribed text for the whole dictation
+        """
+        self._stop_worker()
+        if self.sample_rate is not None:
+            self._resample_pending(final=True)
+        if self._total_samples > self._window_start:
+            self._decode(self._total_samples, final=True)
+        text = " ".join(self._committed).strip()
+        logger.info(f"Streaming transcription complete: {len(text)} characters")
+        return text
+
+    def cancel(self) -> None:
+        """Stop streaming and discard all pending audio."""
+        self._stop_worker()
+        self._pending.clear()
+        self._chunks.clear()
+        self._chunk_starts.clear()
+
+    def _stop_worker(self) -> None:
+        """Signal the worker to stop and wait for its current decode."""
+        with self._cond:
+            self._stopping = True
+            self._cond.notify()
+        if self._worker is not None:
+            self._worker.join()
+            self._worker = None
+
+    def _run(self) -> None:
+        """Worker loop: decode the current window every step of new audio."""
+        while True:
+            with self._cond:
+                while not self._stopping and not self._step_ready():
+                    self._cond.wait()
+                if self._stopping:
+                    return
+                self._last_decoded_input = self._input_samples
+            try:
+                self._resample_pending(final=False)
+                self._decode(self._total_samples, final=False)
+            except Exception as e:
+                logger.error(f"Streaming decode failed: {e}")
+                return
+
+    def _step_ready(self) -> bool:
+        """Check whether enough new audio arrived for another decode."""
+        if self.sample_rate is None:
+            return False
+        step = int(self.step_seconds * self.sample_rate)
+        return self._input_samples - self._last_decoded_input >= step
+
+    def _resample_pending(self, final: bool) -> None:
+        """Resample chunks received since the last decode to the target rate.
+
+        Args:
+            final: Also flush the resampler's tail
+        """
+        with self._cond:
+            pending, self._pending = self._pending, []
+        if self.sample_rate == self.target_sample_rate:
+            converted = pending
+        else:
+            if self._resampler is None:
+                self._resampler = StreamingResampler(
+                    self.sample_rate, self.target_sample_rate
+                )
+            converted = [self._resampler.process(c) for c in pending]
+            if final:
+                converted.append(self._resampler.flush())
+            if self._input_dtype == np.int16:
+                converted = [to_int16(c) for c in converted]
+
+        with self._cond:
+            for chunk in converted:
+                self._chunks.append(chunk)
+                self._chunk_starts.append(self._total_samples)
+                self._total_samples += len(chunk)
+
+    def _window_audio(self, end: int) -> np.ndarray:
+        """Assemble audio from the window start up to ``end``."""
+        with self._cond:
+            pieces = []
+            for start, chunk in zip(self._chunk_starts, self._chunks):
+                stop = start + len(chunk)
+                if stop <= self._window_start or start >= end:
+                    continue
+                pieces.append(chunk[max(self._window_start - start, 0):end - start])
+        if not pieces:
+            return np.zeros(0, dtype=np.int16)
+        return np.concatenate(pieces)
+
+    def _decode(self, end: int, final: bool) -> None:
+        """Decode the window ending at ``end`` and update committed text.
+
+        Args:
+            end: Absolute sample index where the window ends
+            final: True for the last decode after recording stopped
+        """
+        audio = self._window_audio(end)
+        if len(audio) == 0:
+            return
+        if self.vad is not None and not self.vad.has_speech(audio, self.target_sample_rate):
+            # Skip only the model call; the window must still move on
+            self._skip_silent_window(end, final)
+            return
+
+        if final:
+            words = self.transcriber.transcribe(audio, self.target_sample_rate).split()
+        else:
+            # Timed apart from the final decode's inference (also when the
+            # model runs in the worker process or daemon)
+            with span('stream_window'), stage_alias('inference', None):
+                words = self.transcriber.transcribe(audio, self.target_sample_rate).split()
+        words = words[seam_overlap_length(self._committed, words):]
+
+        if final:
+            self._committed.extend(words)
+            self._tentative = []
+            self._notify()
+            return
+
+        self._tentative = words
+
+        window_samples = int(self.window_seconds * self.target_sample_rate)
+        if end - self._window_start >= window_samples:
+            self._slide_window(end, words)
+
+        self._notify()
+
+    def _slide_window(self, end: int, words: list[str]) -> None:
+        """Commit a full window and slide it forward, keeping an overlap.
+
+        Words estimated to fall inside the overlap stay uncommitted so the
+        next window decodes them again with more context. The estimate errs
+        towards committing: a word decoded twice is removed at the seam,
+        while a word left out of both windows would be lost.
+        """
+        overlap_samples = int(self.overlap_seconds * self.target_sample_rate)
+        window_len = end - self._window_start
+        tail = int(len(words) * overlap_samples / window_len)
+        commit = max(len(words) - tail, 0)
+
+        self._committed.extend(words[:commit])
+        self._tentative = words[commit:]
+        self._window_start = end - overlap_samples
+        self._release_chunks()
+        logger.debug(
+            f"Streaming window committed {commit} words, "
+            f"{len(self._committed)} total"
+        )
+
+    def _skip_silent_window(self, end: int, final: bool) -> None:
+        """Handle a window without speech.
+
+        Words still pending from the previous window are committed, and a
+        full window is dropped entirely (there is nothing to re-decode in
+        its overlap), so pauses don't make the next decode grow.
+        """
+        window_samples = int(self.window_seconds * self.target_sample_rate)
+        if not final and end - self._window_start < window_samples:
+            return
+        self._committed.extend(self._tentative)
+        self._tentative = []
+        self._window_start = end
+        self._release_chunks()
+        logger.debug(f"Streaming window without speech skipped, {len(self._committed)} words total")
+        self._notify()
+
+    def _release_chunks(self) -> None:
+        """Drop chunks that lie entirely before the window start."""
+        with self._cond:
+            keep = 0
+            for start, chunk in zip(self._chunk_starts, self._chunks):
+                if start + len(chunk) > self._window_start:
+                    break
+                keep += 1
+            del self._chunks[:keep]
+            del self._chunk_starts[:keep]
+
+    def _notify(self) -> None:
+        """Report committed and tentative text to the update callback."""
+        if self.on_update is None:
+            return
+        try:
+            self.on_update(self.committed_text, self.tentative_text)
+        except Exception as e:
+            logger.error(f"Streaming update callback failed: {e}")
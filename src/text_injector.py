@@ -1,81 +1,209 @@
-"""Text injection module using xdotool."""
+"""Text injection at the cursor position with selectable strategies."""
 
 import subprocess
 import logging
+import threading
 from typing import Optional
 
+from .injectors.clipboard_injector import ClipboardInjector
+from .injectors.synthetic_keys import SyntheticKeys
+from .injectors.x_connection import XConnection
+from .injectors.xdotool_injector import XdotoolInjector
+from .injectors.xtest_injector import XTestInjector
+from .metrics import REGISTRY
+
 
 logger = logging.getLogger(__name__)
 
+STRATEGIES = ('clipboard', 'xtest', 'xdotool')
+
+DEFAULT_TERMINAL_CLASSES = [
+    'gnome-terminal', 'konsole', 'xterm', 'urxvt', 'alacritty', 'kitty',
+    'tilix', 'terminator', 'xfce4-terminal', 'wezterm', 'st-256color'
+]
+
+INJECTIONS = REGISTRY.counter(
+    "wispr_injections_total", "Text injections by strategy and outcome"
+)
+
 
 class TextInjector:
-    """Injects text at cursor position using xdotool."""
-    
-    def __init__(self):
-        """Initialize text injector."""
-        self._check_xdotool()
-        logger.info("TextInjector initialized")
-    
-    def _check_xdotool(self) -> None:
-        """Check if xdotool is available."""
-        try:
-            subprocess.run(
-                ['which', 'xdotool'],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE
-            )
-        except subprocess.CalledProcessError:
+    """Injects text at the cursor position.
+
+    Strategies:
+        clipboard: paste via the clipboard (constant time, any length)
+        xtest: synthetic key events over a persistent X connection
+        xdotool: ``xdotool type`` with a per-key delay (fallback)
+
+    With ``strategy="auto"`` the strategy is chosen per active window:
+    explicit window rules first, then clipboard for long text and XTest for
+    short text, falling back to xdotool when a strategy fails.
+    """
+
+    def __init__(
+        self,
+        strategy: str = "auto",
+        typing_delay: int = 12,
+        paste_min_length: int = 20,
+        restore_clipboard: bool = True,
+        restore_delay: float = 0.3,
+        terminal_classes: Optional[list[str]] = None,
+        window_strategies: Optional[dict[str, str]] = None
+    ):
+        """Initialize text injector.
+
+        Args:
+            strategy: "auto" or one of clipboard, xtest, xdotool
+            typing_delay: xdotool delay between keystrokes in milliseconds
+            paste_min_length: In auto mode, paste text at least this long
+            restore_clipboard: Restore the previous clipboard after pasting
+            restore_delay: Seconds before the clipboard is restored
+            terminal_classes: Window classes that paste with ctrl+shift+v
+            window_strategies: Window class substring -> strategy overrides
+        """
+        if strategy != "auto" and strategy not in STRATEGIES:
+            raise ValueError(f"Unknown injection strategy: {strategy}")
+
+        self.strategy = strategy
+        self.paste_min_length = paste_min_length
+        self.terminal_classes = [c.lower() for c in (terminal_classes or DEFAULT_TERMINAL_CLASSES)]
+        self.window_strategies = {
+            pattern.lower(): name for pattern, name in (window_strategies or {}).items()
+        }
+
+        self._lock = threading.RLock()
+        # Key events we send; hotkey listeners skip them
+        self.synthetic = SyntheticKeys()
+        self.connection = XConnection()
+        self.xdotool = XdotoolInjector(
+            delay=typing_delay,
+            synthetic=self.synthetic,
+            held_modifiers=self.connection.held_modifier_names
+        )
+        self.xtest = XTestInjector(self.connection, self.synthetic)
+        key_sender = self.xtest if self.xtest.is_available() else self.xdotool
+        self.clipboard = ClipboardInjector(key_sender, restore_clipboard, restore_delay)
+
+        self._injectors = {
+            injector.name: injector
+            for injector in (self.clipboard, self.xtest, self.xdotool)
+            if injector.is_available()
+        }
+        # Pasting also needs XTest or xdotool to press the shortcut
+        if not {'xtest', 'xdotool'} & self._injectors.keys():
             raise RuntimeError(
-                "xdotool not found. Install it with: sudo apt install xdotool"
+                "No text injection backend available. Install xdotool with: "
+                "sudo apt install xdotool (optionally xclip and python-xlib)"
             )
-    
-    def inject_text(self, text: str, delay: int = 12) -> bool:
+        logger.info(f"TextInjector initialized: strategy={strategy}, available={list(self._injectors)}")
+
+    def _strategy_order(self, text: str, window_class: str) -> list[str]:
+        """Pick strategies to try, best first, for the given text and window."""
+        if self.strategy != "auto":
+            order = [self.strategy]
+        else:
+            rule = next(
+                (name for pattern, name in self.window_strategies.items() if pattern in window_class),
+                None
+            )
+            if rule:
+                order = [rule]
+            elif len(text) >= self.paste_min_length:
+                order = ['clipboard', 'xtest']
+            else:
+                order = ['xtest', 'clipboard']
+
+        order.append('xdotool')
+        return [name for name in dict.fromkeys(order) if name in self._injectors]
+
+    def _is_terminal(self, window_class: str) -> bool:
+        """Check whether the window is a terminal emulator."""
+        return any(name in window_class for name in self.terminal_classes)
+
+    def inject_text(self, text: str) -> bool:
         """Inject text at current cursor position.
-        
+
         Args:
             text: Text to inject
-            delay: Delay between keystrokes in milliseconds
-            
+
         Returns:
             True if successful, False otherwise
         """
         if not text:
             logger.warning("Empty text provided, nothing to inject")
             return False
-        
-        try:
-            # Use xdotool to type the text
-            # --delay controls typing speed (12ms is reasonable)
-            subprocess.run(
-                ['xdotool', 'type', '--delay', str(delay), '--', text],
-                check=True,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                timeout=10
-            )
-            logger.info(f"Successfully injected text: {len(text)} characters")
-            return True
-            
-        except subprocess.TimeoutExpired:
-            logger.error("Text injection timeout")
-            return False
-        except subprocess.CalledProcessError as e:
-            logger.error(f"Text injection failed: {e}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error during text injection: {e}")
-            return False
-    
+
+        window_class = (self.get_active_window_class() or "").lower()
+        with self._lock:
+            for name in self._strategy_order(text, window_class):
+                if name == 'clipboard':
+                    paste_keys = 'ctrl+shift+v' if self._is_terminal(window_class) else 'ctrl+v'
+                    success = self.clipboard.inject_text(text, paste_keys)
+                else:
+                    success = self._injectors[name].inject_text(text)
+
+                INJECTIONS.inc(strategy=name, outcome='success' if success else 'failure')
+                if success:
+                    logger.info(f"Successfully injected text via {name}: {len(text)} characters")
+                    return True
+                logger.warning(f"Injection via {name} failed, trying next strategy")
+
+        logger.error("Text injection failed with all strategies")
+        return False
+
+    def press_keys(self, combo: str, repeat: int = 1) -> bool:
+        """Press a key combination, e.g. ``BackSpace`` to erase text.
+
+        Args:
+            combo: Key names joined by ``+`` (X keysym names)
+            repeat: Number of presses
+
+        Returns:
+            True if successful, False otherwise
+        """
+        sender = self._injectors.get('xtest') or self._injectors.get('xdotool')
+        with self._lock:
+            return sender.send_keys(combo, repeat)
+
+    def get_active_window_class(self) -> Optional[str]:
+        """Get the WM_CLASS of the currently active window.
+
+        Returns:
+            Window class or None if unknown
+        """
+        if 'xtest' in self._injectors:
+            return self.connection.active_window_class()
+        return self._xdotool_query('getwindowclassname')
+
     def get_active_window(self) -> Optional[str]:
         """Get name of currently active window.
-        
+
         Returns:
             Window name or None if error
         """
+        if 'xtest' in self._injectors:
+            return self.connection.active_window_name()
+        return self._xdotool_query('getwindowname')
+
+    def get_active_window_id(self) -> Optional[int]:
+        """Get the X id of the currently active window.
+
+        Unlike the title, the id doesn't change while the user types (e.g.
+        an editor's modified marker), so it identifies the focused window.
+
+        Returns:
+            Window id or None if unknown
+        """
+        if 'xtest' in self._injectors:
+            return self.connection.active_window_id()
+        window = self._xdotool_query()
+        return int(window) if window and window.isdigit() else None
+
+    def _xdotool_query(self, command: Optional[str] = None) -> Optional[str]:
+        """Run ``xdotool getactivewindow [command]`` (only without Xlib)."""
         try:
             result = subprocess.run(
-                ['xdotool', 'getactivewindow', 'getwindowname'],
+                ['xdotool', 'getactivewindow'] + ([command] if command else []),
                 check=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
@@ -84,5 +212,10 @@ class TextInjector:
             )
             return result.stdout.strip()
         except Exception as e:
-            logger.error(f"Failed to get active window: {e}")
+            logger.debug(f"Failed to query active window: {e}")
             return None
+
+    def close(self) -> None:
+        """Restore a pending clipboard and close the X connection."""
+        self.clipboard.close()
+        self.connection.close()
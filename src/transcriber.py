@@ -1,9 +1,17 @@
 """Transcription interface that delegates to specific model implementations."""
 
+import json
 import logging
+import time
 import numpy as np
+from threading import Event, Lock, Thread
 from typing import Optional
+from .backends import cache_key, create_cache, create_router, load_models, run_warmup
+from .cancellation import CancelToken, TranscriptionCancelled
 from .config import Config
+from .metrics import span
+from .resampler import resample_like
+from .router import ModelRouter
 
 
 logger = logging.getLogger(__name__)
@@ -12,134 +20,276 @@ logger = logging.getLogger(__name__)
 class Transcriber:
     """Main transcription interface."""
     
-    def __init__(self, config: Config):
+    def __init__(
+        self,
+        config: Config,
+        model: Optional[any] = None,
+        load_in_background: bool = False
+    ):
         """Initialize transcriber with configuration.
         
         Args:
             config: Application configuration
+            model: Ready backend to use instead of the configured one
+                (e.g. a stub model for benchmarks)
+            load_in_background: Return immediately and load (and warm up)
+                the model on a background thread; transcribe() waits for it
         """
         self.config = config
-        self.model: Optional[any] = None
-        self._initialize_model()
-    
-    def _initialize_model(self) -> None:
-        """Initialize the appropriate model based on configuration."""
-        model_type = self.config.model.type.lower()
-        
-        logger.info(f"Initializing transcription model: {model_type}")
-        
-        if model_type == "whisper":
-            from .models.whisper_model import WhisperTranscriber
-            
-            self.model = WhisperTranscriber(
-                model_size=self.config.model.size,
-                device=self.config.model.device,
-                language=self.config.model.language
-            )
-        
-        elif model_type == "parakeet":
-            from .models.parakeet_model import ParakeetTranscriber
-            
-            # Map size to model name if needed
-            model_name = self._get_parakeet_model_name(self.config.model.size)
-            
-            self.model = ParakeetTranscriber(
-                model_name=model_name,
-                device=self.config.model.device,
-                language=self.config.model.language
-            )
+        self.model: Optional[any] = model
+        # Small fast model for two-pass decoding (see transcribe_draft)
+        self.draft_model: Optional[any] = None
+        # Dispatcher over several resident backends (see config.router)
+        self.router: Optional[ModelRouter] = create_router(config) if model is None else None
+        # Models are not safe to call from several threads at once
+        self._lock = Lock()
+        self._draft_lock = Lock()
+        self._ready = Event()
+        self._load_error: Optional[Exception] = None
+        self.cache = create_cache(config)
         
+        if self.model is not None:
+            self._ready.set()
+        elif load_in_background:
+            Thread(target=self._load, name="model-loader", daemon=True).start()
         else:
-            raise ValueError(
-                f"Unknown model type: {model_type}. "
-                "Supported types: whisper, parakeet"
-            )
-        
-        if not self.model.is_ready():
-            raise RuntimeError("Failed to initialize transcription model")
-        
-        logger.info("Transcription model initialized successfully")
+            self._load()
+            if self._load_error is not None:
+                raise self._load_error
+    
+    def _load(self) -> None:
+        """Load and warm up the configured model, then mark it ready."""
+        start = time.perf_counter()
+        try:
+            self.model, self.draft_model = load_models(self.config, self.router)
+            if self.config.model.warmup:
+                self.warmup(self.config.model.warmup_seconds)
+            logger.info(f"Transcription model ready in {time.perf_counter() - start:.1f}s")
+        except Exception as e:
+            self._load_error = e
+            logger.error(f"Failed to load transcription model: {e}")
+        finally:
+            self._ready.set()
     
-    def _get_parakeet_model_name(self, size: str) -> str:
-        """Get Parakeet model name from size specification.
+    def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """Block until the model has finished loading.
         
         Args:
-            size: Model size or full name
+            timeout: Maximum seconds to wait (None waits indefinitely)
             
         Returns:
-            Full Hugging Face model name
+            True if the model is loaded, False on timeout
+            
+        Raises:
+            RuntimeError: If loading the model failed
         """
-        # Map common names to full model names
-        size_map = {
-            "parakeet": "nvidia/parakeet-tdt-0.6b-v3",
-            "parakeet-0.6b": "nvidia/parakeet-tdt-0.6b-v3",
-            "parakeet-1.1b": "nvidia/parakeet-rnnt-1.1b"
-        }
-        
-        return size_map.get(size.lower(), "nvidia/parakeet-tdt-0.6b-v3")
+        if not self._ready.wait(timeout):
+            return False
+        if self._load_error is not None:
+            raise RuntimeError(f"Transcription model failed to load: {self._load_error}")
+        return True
     
     def transcribe(
         self,
         audio_data: np.ndarray,
-        sample_rate: int = 16000
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
     ) -> str:
         """Transcribe audio data.
         
         Args:
-            audio_data: Audio data as numpy array (int16)
+            audio_data: Audio data as numpy array (int16, or float32 in [-1, 1])
             sample_rate: Sample rate of audio data
+            token: Cancellation token; checked before inference and, for
+                backends that support it, while decoding
             
         Returns:
             Transcribed text
+            
+        Raises:
+            TranscriptionCancelled: If the token was cancelled
         """
-        if self.model is None:
-            raise RuntimeError("Transcription model not initialized")
+        if not self._ready.is_set():
+            logger.info("Model still loading, transcription will start when it is ready")
+        self.wait_until_ready()
         
         try:
             # Resample to 16kHz if needed (ASR models expect 16kHz)
             if sample_rate != 16000:
                 logger.info(f"Resampling audio from {sample_rate}Hz to 16000Hz")
-                audio_data = self._resample_audio(audio_data, sample_rate, 16000)
-                sample_rate = 16000
+                with span('resample'):
+                    audio_data = resample_like(audio_data, sample_rate, 16000)
+            
+            key = self._cache_key(audio_data)
+            if key is not None:
+                text = self.cache.get(key)
+                if text is not None:
+                    logger.debug("Transcript served from cache")
+                    return text
             
-            text = self.model.transcribe(audio_data, sample_rate)
+            with self._lock, span('inference'):
+                # The job may have been cancelled while waiting for the model
+                if token is not None:
+                    token.check()
+                kwargs = {'token': token} if token is not None and getattr(self.model, 'cancellable', False) else {}
+                text = self.model.transcribe(audio_data, 16000, **kwargs)
+            if key is not None:
+                self.cache.put(key, text)
             return text
+        except TranscriptionCancelled:
+            raise
         except Exception as e:
             logger.error(f"Transcription error: {e}")
             raise
     
-    def _resample_audio(
+    @property
+    def has_draft(self) -> bool:
+        """Whether a draft model for two-pass decoding is loaded (or loading)."""
+        if not self._ready.is_set():
+            # transcribe_draft() waits for the background load
+            return self.config.refine.enabled
+        return self.draft_model is not None
+    
+    def transcribe_draft(
         self,
         audio_data: np.ndarray,
-        orig_sr: int,
-        target_sr: int
-    ) -> np.ndarray:
-        """Resample audio data to target sample rate.
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> str:
+        """Quickly transcribe audio with the draft model.
+        
+        The draft is typed right away and later replaced by the main model's
+        transcript (see DictationPipeline). Drafts bypass the cache.
         
         Args:
-            audio_data: Input audio data (int16)
-            orig_sr: Original sample rate
-            target_sr: Target sample rate
+            audio_data: Audio data (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate of audio data
+            token: Cancellation token
             
         Returns:
-            Resampled audio data (int16)
+            Draft text
         """
-        try:
-            # Try using scipy (most common)
-            from scipy import signal
-            num_samples = int(len(audio_data) * target_sr / orig_sr)
-            resampled = signal.resample(audio_data, num_samples)
-            return resampled.astype(np.int16)
-        except ImportError:
-            # Fallback: simple linear interpolation (less accurate but works)
-            logger.warning("scipy not available, using simple resampling")
-            indices = np.arange(0, len(audio_data), orig_sr / target_sr)
-            resampled = np.interp(
-                np.arange(len(indices)),
-                np.arange(len(audio_data)) * target_sr / orig_sr,
-                audio_data
-            )
-            return resampled.astype(np.int16)
+        self.wait_until_ready()
+        if sample_rate != 16000:
+            with span('resample'):
+                audio_data = resample_like(audio_data, sample_rate, 16000)
+        with self._draft_lock, span('draft_inference'):
+            if token is not None:
+                token.check()
+            return self.draft_model.transcribe(audio_data, 16000)
+    
+    def transcribe_batch(
+        self,
+        audio_list: list[np.ndarray],
+        sample_rate: int = 16000,
+        token: Optional[CancelToken] = None
+    ) -> list[str]:
+        """Transcribe several clips, in one forward pass where the backend can.
+        
+        Args:
+            audio_list: Audio clips (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate of the clips
+            token: Cancellation token (e.g. with the batch's tightest
+                deadline), passed on to backends that support it
+            
+        Returns:
+            Transcribed text for each clip
+            
+        Raises:
+            TranscriptionCancelled: If the token was cancelled
+        """
+        self.wait_until_ready()
+        
+        if sample_rate != 16000:
+            with span('resample'):
+                audio_list = [resample_like(a, sample_rate, 16000) for a in audio_list]
+        
+        keys = [self._cache_key(audio) for audio in audio_list]
+        texts = [self.cache.get(key) if key is not None else None for key in keys]
+        misses = [i for i, text in enumerate(texts) if text is None]
+        if not misses:
+            return texts
+        
+        clips = [audio_list[i] for i in misses]
+        kwargs = {'token': token} if token is not None and getattr(self.model, 'cancellable', False) else {}
+        with self._lock, span('inference'):
+            if token is not None:
+                token.check()
+            if hasattr(self.model, 'transcribe_batch'):
+                decoded = self.model.transcribe_batch(clips, 16000, **kwargs)
+            else:
+                decoded = [self.model.transcribe(audio, 16000, **kwargs) if len(audio) else "" for audio in clips]
+        for i, text in zip(misses, decoded):
+            texts[i] = text
+            if keys[i] is not None:
+                self.cache.put(keys[i], text)
+        return texts
+    
+    def transcribe_segments(
+        self,
+        audio_data: np.ndarray,
+        sample_rate: int = 16000,
+        batch_size: int = 8
+    ) -> Optional[list[tuple[float, float, str]]]:
+        """Transcribe a long recording with the backend's long-form API.
+        
+        Args:
+            audio_data: Audio data (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate of audio data
+            batch_size: Windows decoded per forward pass
+            
+        Returns:
+            (start, end, text) segments, or None if the backend has no
+            long-form API and the caller should window the audio itself
+        """
+        self.wait_until_ready()
+        if not hasattr(self.model, 'transcribe_segments'):
+            return None
+        if sample_rate != 16000:
+            audio_data = resample_like(audio_data, sample_rate, 16000)
+        key = self._cache_key(audio_data, 'segments')
+        if key is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                return [tuple(segment) for segment in json.loads(cached)]
+        with self._lock, span('inference'):
+            segments = self.model.transcribe_segments(audio_data, batch_size)
+        if key is not None and segments is not None:
+            self.cache.put(key, json.dumps(segments, ensure_ascii=False))
+        return segments
+    
+    def _cache_key(self, audio_data: np.ndarray, kind: str = 'text') -> Optional[str]:
+        """Get the cache key of 16kHz audio (see backends.cache_key), or None when caching is disabled."""
+        if self.cache is None:
+            return None
+        return cache_key(self.config, audio_data, kind, routed=self.router is not None)
+    
+    def warmup(self, durations: Optional[list[float]] = None) -> dict[float, float]:
+        """Run synthetic clips through the model before the first dictation.
+
+        Backends allocate buffers, load auxiliary models and select kernels
+        lazily on the first calls for a given input shape; doing that here
+        gives the first real dictation steady-state latency.
+
+        Args:
+            durations: Clip lengths in seconds, one per input-length bucket
+
+        Returns:
+            Seconds spent on each clip length
+        """
+        def decode(clip: np.ndarray) -> None:
+            # Bypass transcribe() so warm-up doesn't skew inference metrics
+            with self._lock:
+                if self.router is not None:
+                    # Also seeds each backend's real-time factor
+                    self.router.warmup(clip)
+                else:
+                    self.model.transcribe(clip, 16000)
+            if self.draft_model is not None:
+                with self._draft_lock:
+                    self.draft_model.transcribe(clip, 16000)
+
+        return run_warmup(decode, durations)
     
     def is_ready(self) -> bool:
         """Check if transcriber is ready.
@@ -147,4 +297,4 @@ class Transcriber:
         Returns:
             True if ready to transcribe
         """
-        return self.model is not None and self.model.is_ready()
+        return self._ready.is_set() and self.model is not None and self.model.is_ready()
@@ -0,0 +1,147 @@
+"""Lightweight energy-based voice activity detection."""
+
+from dataclasses import dataclass
+from typing import Optional
+
+import numpy as np
+
+
+# Default upper bound for the adaptive threshold, so recordings that are
+# speech almost throughout don't raise the "noise floor" above quiet syllables
+MAX_ADAPTIVE_THRESHOLD_DB = -30.0
+
+
+def speech_threshold(
+    noise_floor_db: float,
+    noise_margin_db: float,
+    threshold_db: float,
+    max_adaptive_db: float = MAX_ADAPTIVE_THRESHOLD_DB
+) -> float:
+    """Level (dBFS) a frame must exceed to count as speech.
+
+    The noise floor plus margin, capped at ``max_adaptive_db`` (never below
+    ``threshold_db``), and never below ``threshold_db`` itself.
+    """
+    cap = max(max_adaptive_db, threshold_db)
+    return max(threshold_db, min(noise_floor_db + noise_margin_db, cap))
+
+
+@dataclass
+class VADResult:
+    """Outcome of trimming a recording."""
+    audio: Optional[np.ndarray]  # Trimmed view, None if no speech was found
+    speech_seconds: float
+    trimmed_seconds: float
+
+
+class EnergyVAD:
+    """Detects speech frames by their energy relative to the noise floor."""
+
+    def __init__(
+        self,
+        threshold_db: float = -45.0,
+        noise_margin_db: float = 10.0,
+        frame_ms: int = 30,
+        padding_ms: int = 200,
+        min_speech_seconds: float = 0.3,
+        max_adaptive_threshold_db: float = MAX_ADAPTIVE_THRESHOLD_DB
+    ):
+        """Initialize voice activity detector.
+
+        Args:
+            threshold_db: Minimum frame level (dBFS) that can count as speech
+            noise_margin_db: Required level above the estimated noise floor
+            frame_ms: Analysis frame length in milliseconds
+            padding_ms: Audio kept around detected speech in milliseconds
+            min_speech_seconds: Less speech than this counts as silence
+            max_adaptive_threshold_db: Highest level (dBFS) the noise-floor
+                threshold may rise to; lower it for quiet speakers on noisy
+                microphones
+        """
+        self.threshold_db = threshold_db
+        self.max_adaptive_threshold_db = max_adaptive_threshold_db
+        self.noise_margin_db = noise_margin_db
+        self.frame_ms = frame_ms
+        self.padding_ms = padding_ms
+        self.min_speech_seconds = min_speech_seconds
+
+    def frame_levels(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Compute the level of each frame in dBFS.
+
+        Args:
+            audio: Mono audio (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Level per frame
+        """
+        frame = max(int(sample_rate * self.frame_ms / 1000), 1)
+        count = len(audio) // frame
+        if count == 0:
+            return np.zeros(0, dtype=np.float32)
+
+        frames = audio[:count * frame].reshape(count, frame).astype(np.float32)
+        if audio.dtype == np.int16:
+            frames /= 32768.0
+        rms = np.sqrt(np.mean(frames * frames, axis=1))
+        return 20 * np.log10(np.maximum(rms, 1e-6))
+
+    def speech_frames(self, audio: np.ndarray, sample_rate: int) -> np.ndarray:
+        """Classify each frame as speech or silence.
+
+        Args:
+            audio: Mono audio (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Boolean array, True for speech frames
+        """
+        levels = self.frame_levels(audio, sample_rate)
+        if len(levels) == 0:
+            return np.zeros(0, dtype=bool)
+        threshold = speech_threshold(
+            float(np.percentile(levels, 10)),
+            self.noise_margin_db,
+            self.threshold_db,
+            self.max_adaptive_threshold_db
+        )
+        return levels > threshold
+
+    def has_speech(self, audio: np.ndarray, sample_rate: int) -> bool:
+        """Check whether audio contains enough speech to transcribe.
+
+        Args:
+            audio: Mono audio (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            True if speech was detected
+        """
+        speech = self.speech_frames(audio, sample_rate)
+        return np.count_nonzero(speech) * self.frame_ms / 1000 >= self.min_speech_seconds
+
+    def trim(self, audio: np.ndarray, sample_rate: int) -> VADResult:
+        """Cut leading and trailing silence.
+
+        Args:
+            audio: Mono audio (int16, or float32 in [-1, 1])
+            sample_rate: Sample rate in Hz
+
+        Returns:
+            Trimmed audio (a view of the input) and timing details
+        """
+        total_seconds = len(audio) / sample_rate
+        speech = self.speech_frames(audio, sample_rate)
+        speech_seconds = float(np.count_nonzero(speech)) * self.frame_ms / 1000
+
+        if speech_seconds < self.min_speech_seconds:
+            return VADResult(None, speech_seconds, total_seconds)
+
+        frame = int(sample_rate * self.frame_ms / 1000)
+        padding = int(sample_rate * self.padding_ms / 1000)
+        indices = np.flatnonzero(speech)
+        start = max(indices[0] * frame - padding, 0)
+        end = min((indices[-1] + 1) * frame + padding, len(audio))
+
+        trimmed = audio[start:end]
+        return VADResult(trimmed, speech_seconds, total_seconds - len(trimmed) / sample_rate)
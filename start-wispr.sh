@@ -8,14 +8,14 @@ cd "$SCRIPT_DIR"
 
 # Function to check if already running
 check_if_running() {
-    if pgrep -f "python -m src.main" > /dev/null; then
+    if pgrep -f "python -m src\.main$" > /dev/null; then
         echo "⚠️  Wispr-Flow is already running!"
         echo ""
         read -p "Do you want to restart it? (y/N) " -n 1 -r
         echo
         if [[ $REPLY =~ ^[Yy]$ ]]; then
             echo "Stopping existing instance..."
-            pkill -f "python -m src.main"
+            pkill -f "python -m src\.main$"
             sleep 2
         else
             echo "Keeping existing instance. Exiting..."
@@ -0,0 +1,84 @@
+"""Tests for the preallocated capture buffer."""
+
+import numpy as np
+
+from src.audio_buffer import AudioRingBuffer
+
+
+def _ramp(start: int, count: int) -> np.ndarray:
+    return np.arange(start, start + count, dtype=np.int16)
+
+
+def test_capture_grows_past_initial_size():
+    buffer = AudioRingBuffer(10, max_seconds=100, initial_seconds=1)
+    buffer.start()
+    for i in range(0, 95, 5):
+        buffer.write(_ramp(i, 5))
+    np.testing.assert_array_equal(buffer.stop(), _ramp(0, 95))
+
+
+def test_capture_is_truncated_at_max_length():
+    buffer = AudioRingBuffer(10, max_seconds=2, initial_seconds=1)
+    buffer.start()
+    for i in range(0, 30, 6):
+        buffer.write(_ramp(i, 6))
+    np.testing.assert_array_equal(buffer.stop(), _ramp(0, 20))
+
+
+def test_stop_returns_view_that_next_capture_does_not_overwrite():
+    buffer = AudioRingBuffer(10)
+    buffer.start()
+    buffer.write(_ramp(0, 8))
+    first = buffer.stop()
+    buffer.start()
+    buffer.write(_ramp(100, 8))
+    buffer.stop()
+    np.testing.assert_array_equal(first, _ramp(0, 8))
+
+
+def test_stop_without_capture_is_empty():
+    buffer = AudioRingBuffer(10)
+    buffer.start()
+    buffer.stop()
+    assert len(buffer.stop()) == 0
+    assert not buffer.is_capturing
+
+
+def test_preroll_keeps_latest_audio_in_order():
+    buffer = AudioRingBuffer(10, preroll_seconds=1)
+    # 23 samples into a 10-sample ring, in uneven writes that wrap around
+    for start, count in ((0, 4), (4, 7), (11, 3), (14, 9)):
+        buffer.write(_ramp(start, count))
+    preroll = buffer.start()
+    np.testing.assert_array_equal(preroll, _ramp(13, 10))
+    buffer.write(_ramp(23, 5))
+    np.testing.assert_array_equal(buffer.stop(), _ramp(13, 15))
+
+
+def test_preroll_partially_filled():
+    buffer = AudioRingBuffer(10, preroll_seconds=1)
+    buffer.write(_ramp(0, 3))
+    np.testing.assert_array_equal(buffer.start(), _ramp(0, 3))
+
+
+def test_preroll_is_consumed_by_a_capture():
+    buffer = AudioRingBuffer(10, preroll_seconds=1)
+    buffer.write(_ramp(0, 10))
+    buffer.start()
+    buffer.stop()
+    assert len(buffer.start()) == 0
+
+
+def test_clear_preroll():
+    buffer = AudioRingBuffer(10, preroll_seconds=1)
+    buffer.write(_ramp(0, 10))
+    buffer.clear_preroll()
+    assert len(buffer.start()) == 0
+    assert len(buffer.stop()) == 0
+
+
+def test_preroll_ring_respects_channels():
+    buffer = AudioRingBuffer(5, channels=2, preroll_seconds=0.5)
+    # 5 samples per second x 2 channels x 0.5s = 5, trimmed to whole frames
+    buffer.write(_ramp(0, 12))
+    np.testing.assert_array_equal(buffer.start(), _ramp(8, 4))
@@ -0,0 +1,86 @@
+"""Tests for the transcript cache."""
+
+import os
+
+import numpy as np
+
+from src.cache import TranscriptCache, audio_fingerprint
+
+MB = 1024 * 1024
+
+
+def _age(cache: TranscriptCache, key: str, mtime: float) -> None:
+    """Set an entry's last use on disk."""
+    os.utime(cache._path(key), (mtime, mtime))
+
+
+def test_memory_lru_evicts_least_recently_used():
+    cache = TranscriptCache(max_entries=2)
+    cache.put("a", "A")
+    cache.put("b", "B")
+    assert cache.get("a") == "A"  # "b" is now the oldest
+    cache.put("c", "C")
+    assert cache.get("b") is None
+    assert cache.get("a") == "A"
+    assert cache.get("c") == "C"
+
+
+def test_disk_tier_serves_entries_evicted_from_memory(tmp_path):
+    cache = TranscriptCache(max_entries=1, disk_dir=tmp_path)
+    cache.put("aa1", "first")
+    cache.put("bb2", "second")
+    assert cache.get("aa1") == "first"
+    # A new instance (e.g. after a restart) finds them on disk
+    assert TranscriptCache(disk_dir=tmp_path).get("bb2") == "second"
+
+
+def test_disk_eviction_removes_least_recently_used(tmp_path):
+    cache = TranscriptCache(max_entries=0, disk_dir=tmp_path, disk_max_mb=350 / MB)
+    for i, key in enumerate(("k0", "k1", "k2")):
+        cache.put(key, "x" * 100)
+        _age(cache, key, 1000 + i)
+    _age(cache, "k0", 2000)  # Used most recently
+    # Over the limit: trimmed to 90% of it, least recently used first
+    cache.put("k3", "x" * 100)
+    assert cache.get("k1") is None
+    assert all(cache.get(key) == "x" * 100 for key in ("k0", "k2", "k3"))
+    assert cache._disk_bytes == 300
+
+
+def test_rewriting_an_entry_does_not_grow_disk_usage(tmp_path):
+    cache = TranscriptCache(disk_dir=tmp_path)
+    cache.put("key", "x" * 50)
+    cache.put("key", "y" * 30)
+    assert cache._disk_bytes == 30
+    assert TranscriptCache(disk_dir=tmp_path)._disk_bytes == 30
+
+
+def test_fingerprint_depends_on_audio_dtype_and_params():
+    audio = np.arange(100, dtype=np.int16)
+    key = audio_fingerprint(audio, "whisper|base|en")
+    assert audio_fingerprint(audio.copy(), "whisper|base|en") == key
+    assert audio_fingerprint(audio, "whisper|base|de") != key
+    assert audio_fingerprint(audio.astype(np.float32), "whisper|base|en") != key
+    changed = audio.copy()
+    changed[50] += 1
+    assert audio_fingerprint(changed, "whisper|base|en") != key
+
+
+def test_fingerprint_of_non_contiguous_view():
+    audio = np.arange(200, dtype=np.int16)
+    assert audio_fingerprint(audio[::2], "p") == audio_fingerprint(audio[::2].copy(), "p")
+
+
+def test_cache_key_tracks_decoding_settings(tmp_path):
+    from src.backends import cache_key
+    from src.config import Config
+
+    path = tmp_path / "config.yaml"
+    path.write_text("model:\n  type: whisper\n  size: base\n")
+    config = Config(path)
+    audio = np.zeros(1600, dtype=np.float32)
+    key = cache_key(config, audio)
+    assert cache_key(config, audio, 'segments') != key
+    assert cache_key(config, audio, routed=True) != key
+    config.whisper.profile = "fast"
+    assert cache_key(config, audio) != key
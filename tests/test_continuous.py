@@ -0,0 +1,76 @@
+"""Tests for the hands-free VAD endpointer."""
+
+import numpy as np
+import pytest
+
+from src.continuous import VADEndpointer
+
+RATE = 16000
+FRAME = 480  # 30ms
+
+
+def _tone(seconds: float, amplitude: float = 0.3) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (1e-3 * rng.standard_normal(int(seconds * RATE))).astype(np.float32)
+
+
+def _feed(endpointer: VADEndpointer, audio: np.ndarray, chunk: int = 1000) -> list[np.ndarray]:
+    """Feed audio in chunks that don't line up with frames."""
+    segments = []
+    for start in range(0, len(audio), chunk):
+        segments += endpointer.feed(audio[start:start + chunk])
+    return segments
+
+
+def test_splits_utterances_at_pauses():
+    endpointer = VADEndpointer(RATE, silence_ms=600, padding_ms=150)
+    audio = np.concatenate((
+        _silence(1.0), _tone(1.0), _silence(1.0, seed=1), _tone(0.8), _silence(1.0, seed=2)
+    ))
+    segments = _feed(endpointer, audio)
+    assert len(segments) == 2
+    # Speech plus 150ms padding on each side (whole frames)
+    assert len(segments[0]) / RATE == pytest.approx(1.3, abs=2 * FRAME / RATE)
+    assert len(segments[1]) / RATE == pytest.approx(1.1, abs=2 * FRAME / RATE)
+    assert endpointer.flush() is None
+
+
+def test_short_pause_does_not_split():
+    endpointer = VADEndpointer(RATE, silence_ms=600)
+    audio = np.concatenate((_silence(0.5), _tone(0.6), _silence(0.3), _tone(0.6), _silence(1.0, seed=1)))
+    assert len(_feed(endpointer, audio)) == 1
+
+
+def test_discards_blips_shorter_than_min_speech():
+    endpointer = VADEndpointer(RATE, min_speech_ms=300)
+    audio = np.concatenate((_silence(0.5), _tone(0.1), _silence(1.5, seed=1)))
+    assert _feed(endpointer, audio) == []
+
+
+def test_cuts_long_utterances():
+    endpointer = VADEndpointer(RATE, max_segment_seconds=2.0)
+    segments = _feed(endpointer, np.concatenate((_silence(0.3), _tone(5.0))))
+    assert len(segments) == 2
+    assert all(len(s) / RATE <= 2.0 for s in segments)
+
+
+def test_flush_returns_utterance_in_progress():
+    endpointer = VADEndpointer(RATE)
+    assert _feed(endpointer, np.concatenate((_silence(0.5), _tone(1.0)))) == []
+    segment = endpointer.flush()
+    assert segment is not None
+    assert len(segment) / RATE == pytest.approx(1.2, abs=2 * FRAME / RATE)
+    assert endpointer.flush() is None
+
+
+def test_int16_input():
+    endpointer = VADEndpointer(RATE)
+    audio = np.concatenate((_silence(0.5), _tone(1.0), _silence(1.0, seed=1)))
+    segments = _feed(endpointer, (audio * 32767).astype(np.int16))
+    assert len(segments) == 1
+    assert segments[0].dtype == np.int16
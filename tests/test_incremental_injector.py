@@ -0,0 +1,35 @@
+"""Tests for planning live-injection edits."""
+
+import random
+
+import pytest
+
+from src.incremental_injector import plan_edit
+
+
+def _apply(current: str, backspaces: int, insert: str) -> str:
+    return current[:len(current) - backspaces] + insert
+
+
+@pytest.mark.parametrize("current, target, expected", [
+    ("", "hello", (0, "hello")),
+    ("hello", "hello world", (0, " world")),
+    ("hello wrld", "hello world", (3, "orld")),
+    ("hello world", "hello", (6, "")),
+    ("hello", "hello", (0, "")),
+    ("abc", "xyz", (3, "xyz")),
+    ("naïve", "naïf", (2, "f")),
+])
+def test_plan_edit(current, target, expected):
+    assert plan_edit(current, target) == expected
+
+
+def test_plan_edit_always_reaches_target():
+    rng = random.Random(0)
+    for _ in range(500):
+        current = "".join(rng.choice("ab ") for _ in range(rng.randrange(12)))
+        target = "".join(rng.choice("ab ") for _ in range(rng.randrange(12)))
+        backspaces, insert = plan_edit(current, target)
+        assert _apply(current, backspaces, insert) == target
+        # Nothing of the common prefix is erased
+        assert backspaces == len(current) - (len(target) - len(insert))
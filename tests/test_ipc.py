@@ -0,0 +1,99 @@
+"""Tests for the daemon's JSON-lines protocol."""
+
+import io
+import json
+import socket
+
+import numpy as np
+import pytest
+
+from src import ipc
+from src.ipc import decode_audio, encode_audio, read_message, resolve_socket_path, write_message
+
+
+def test_messages_round_trip_in_order():
+    stream = io.BytesIO()
+    write_message(stream, {'cmd': 'transcribe', 'id': 1})
+    write_message(stream, {'text': "héllo\nworld"})
+    stream.seek(0)
+    assert read_message(stream) == {'cmd': 'transcribe', 'id': 1}
+    # Newlines inside strings are escaped, so they don't split the frame
+    assert read_message(stream) == {'text': "héllo\nworld"}
+    assert read_message(stream) is None
+
+
+def test_messages_round_trip_over_socket():
+    left, right = socket.socketpair()
+    with left, right:
+        writer = left.makefile('wb')
+        reader = right.makefile('rb')
+        audio = (np.arange(1600) - 800).astype(np.int16)
+        write_message(writer, {'cmd': 'transcribe', **encode_audio(audio, 16000)})
+        message = read_message(reader)
+        assert message['cmd'] == 'transcribe'
+        decoded, sample_rate = decode_audio(message)
+        np.testing.assert_array_equal(decoded, audio)
+        assert sample_rate == 16000
+
+        writer.close()
+        left.shutdown(socket.SHUT_WR)
+        assert read_message(reader) is None
+
+
+def test_read_rejects_oversized_message(monkeypatch):
+    monkeypatch.setattr(ipc, 'MAX_MESSAGE_BYTES', 16)
+    stream = io.BytesIO(json.dumps({'text': "x" * 32}).encode() + b"\n")
+    with pytest.raises(ValueError, match="too long"):
+        read_message(stream)
+
+
+def test_read_accepts_message_at_limit(monkeypatch):
+    line = json.dumps({'t': "xy"}).encode() + b"\n"
+    monkeypatch.setattr(ipc, 'MAX_MESSAGE_BYTES', len(line))
+    assert read_message(io.BytesIO(line)) == {'t': "xy"}
+
+
+def test_read_rejects_non_object_and_garbage():
+    with pytest.raises(ValueError, match="JSON object"):
+        read_message(io.BytesIO(b"[1, 2]\n"))
+    with pytest.raises(ValueError):
+        read_message(io.BytesIO(b"not json\n"))
+
+
+@pytest.mark.parametrize('dtype', [np.int16, np.float32])
+def test_audio_round_trip_keeps_dtype(dtype):
+    audio = np.linspace(-0.5, 0.5, 480)
+    audio = (audio * 32767).astype(dtype) if dtype == np.int16 else audio.astype(dtype)
+    fields = encode_audio(audio, 48000)
+    decoded, sample_rate = decode_audio(json.loads(json.dumps(fields)))
+    assert decoded.dtype == dtype
+    np.testing.assert_array_equal(decoded, audio)
+    assert sample_rate == 48000
+
+
+def test_encode_audio_converts_other_dtypes_to_float32():
+    audio = np.array([0.25, -0.5], dtype=np.float64)
+    decoded, _ = decode_audio(encode_audio(audio, 16000))
+    assert decoded.dtype == np.float32
+    np.testing.assert_array_equal(decoded, audio.astype(np.float32))
+
+
+def test_decode_audio_rejects_unknown_dtype():
+    with pytest.raises(ValueError, match="Unsupported"):
+        decode_audio({'audio': "", 'dtype': 'int8'})
+
+
+def test_decode_audio_defaults_to_int16_at_16khz():
+    audio = np.array([1, -1], dtype=np.int16)
+    message = {'audio': encode_audio(audio, 8000)['audio']}
+    decoded, sample_rate = decode_audio(message)
+    assert decoded.dtype == np.int16
+    assert sample_rate == 16000
+
+
+def test_socket_path_resolution(monkeypatch, tmp_path):
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert resolve_socket_path(None) == tmp_path / "wispr-flow.sock"
+    assert resolve_socket_path("") == tmp_path / "wispr-flow.sock"
+    monkeypatch.setenv('HOME', str(tmp_path))
+    assert resolve_socket_path("~/custom.sock") == tmp_path / "custom.sock"
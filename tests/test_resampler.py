@@ -0,0 +1,70 @@
+"""Tests for the polyphase resampler."""
+
+import sys
+
+import numpy as np
+import pytest
+
+from src.resampler import StreamingResampler, resample, resample_like, to_int16
+
+RATE_PAIRS = [(48000, 16000), (44100, 16000), (22050, 16000), (8000, 16000)]
+
+
+def _noise(samples: int, seed: int = 0) -> np.ndarray:
+    return np.random.default_rng(seed).standard_normal(samples).astype(np.float32)
+
+
+@pytest.mark.parametrize("orig_sr, target_sr", RATE_PAIRS)
+def test_matches_resample_poly(orig_sr, target_sr):
+    signal = pytest.importorskip("scipy.signal")
+    audio = _noise(orig_sr)
+    expected = signal.resample_poly(audio, target_sr, orig_sr)
+    result = resample(audio, orig_sr, target_sr)
+    assert result.dtype == np.float32
+    assert len(result) == len(expected)
+    np.testing.assert_allclose(result, expected, atol=1e-5)
+
+
+@pytest.mark.parametrize("orig_sr, target_sr", RATE_PAIRS)
+def test_streaming_matches_whole_clip(orig_sr, target_sr):
+    audio = _noise(orig_sr // 2, seed=1)
+    resampler = StreamingResampler(orig_sr, target_sr)
+    chunks = [resampler.process(chunk) for chunk in np.array_split(audio, 37)]
+    chunks.append(resampler.flush())
+    np.testing.assert_allclose(np.concatenate(chunks), resample(audio, orig_sr, target_sr), atol=1e-5)
+
+
+def test_streaming_resampler_resets_after_flush():
+    audio = _noise(4800, seed=2)
+    resampler = StreamingResampler(48000, 16000)
+    first = np.concatenate((resampler.process(audio), resampler.flush()))
+    second = np.concatenate((resampler.process(audio), resampler.flush()))
+    np.testing.assert_array_equal(first, second)
+
+
+def test_fallback_without_scipy_matches(monkeypatch):
+    audio = _noise(44100, seed=3)
+    with_scipy = resample(audio, 44100, 16000)
+    monkeypatch.setitem(sys.modules, "scipy", None)
+    np.testing.assert_allclose(resample(audio, 44100, 16000), with_scipy, atol=1e-5)
+
+
+def test_same_rate_is_passthrough():
+    audio = np.arange(10, dtype=np.int16)
+    result = resample(audio, 16000, 16000)
+    assert result.dtype == np.float32
+    np.testing.assert_array_equal(result, audio)
+
+
+def test_resample_like_keeps_int16():
+    audio = (_noise(4800, seed=4) * 10000).astype(np.int16)
+    result = resample_like(audio, 48000, 16000)
+    assert result.dtype == np.int16
+    assert len(result) == 1600
+    assert resample_like(audio.astype(np.float32) / 32768, 48000, 16000).dtype == np.float32
+
+
+def test_to_int16_rounds_and_clips():
+    result = to_int16(np.array([1.4, 1.6, -40000.0, 40000.0], dtype=np.float32))
+    np.testing.assert_array_equal(result, [1, 2, -32768, 32767])
+    assert result.dtype == np.int16
@@ -0,0 +1,132 @@
+"""Tests for routing clips across resident backends."""
+
+import json
+
+import numpy as np
+import pytest
+
+from src import router as router_module
+from src.router import ModelRouter
+
+RATE = 16000
+
+
+class FakeClock:
+    """perf_counter replacement advanced by the fake models."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeModel:
+    """Backend whose decodes take ``rtf`` x clip length on the fake clock."""
+
+    def __init__(self, name: str, rtf: float, clock: FakeClock):
+        self.name = name
+        self.rtf = rtf
+        self.clock = clock
+        self.calls = 0
+
+    def transcribe(self, audio, sample_rate=RATE):
+        self.calls += 1
+        self.clock.now += self.rtf * len(audio) / sample_rate
+        return self.name
+
+    def is_ready(self):
+        return True
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(router_module.time, "perf_counter", clock)
+    return clock
+
+
+def _router(clock, **kwargs) -> ModelRouter:
+    router = ModelRouter(latency_budget=1.0, short_clip_seconds=2.0, **kwargs)
+    router.add_backend("accurate", FakeModel("accurate", 0.2, clock), rtf=0.2)
+    router.add_backend("fast", FakeModel("fast", 0.05, clock), rtf=0.05)
+    return router
+
+
+def _clip(seconds: float) -> np.ndarray:
+    return np.zeros(int(seconds * RATE), dtype=np.float32)
+
+
+def test_short_clips_go_to_fastest(clock):
+    router = _router(clock)
+    backend, reason, _ = router.route(1.5)
+    assert (backend.name, reason) == ("fast", "short clip")
+
+
+def test_most_accurate_backend_within_budget(clock):
+    router = _router(clock)
+    assert router.route(4.0)[0].name == "accurate"  # 0.8s estimate
+    assert router.route(10.0)[0].name == "fast"  # 2s > budget, fast fits 0.5s
+    backend, reason, estimate = router.route(40.0)
+    assert (backend.name, reason) == ("fast", "over budget, using fastest")
+    assert estimate == pytest.approx(2.0)
+
+
+def test_queue_depth_scales_estimates(clock):
+    router = _router(clock)
+    assert router.route(4.0, depth=0)[0].name == "accurate"
+    backend, reason, estimate = router.route(4.0, depth=1)
+    assert backend.name == "fast"
+    assert reason == "within budget at queue depth 1"
+    assert estimate == pytest.approx(0.4)
+
+
+def test_ewma_starts_at_first_measurement(clock):
+    router = _router(clock, ewma_alpha=0.5)
+    accurate = router.backends[0]
+    accurate.model.rtf = 0.1
+    router.transcribe(_clip(4.0))
+    assert accurate.rtf == pytest.approx(0.1)
+    accurate.model.rtf = 0.2
+    router.transcribe(_clip(4.0))
+    assert accurate.rtf == pytest.approx(0.15)
+    assert accurate.samples == 2
+
+
+def test_slow_backend_is_avoided_then_decays_back(clock):
+    router = _router(clock, ewma_alpha=1.0, rtf_decay=0.5)
+    accurate, fast = router.backends
+    accurate.model.rtf = 1.0  # One slow decode (cold cache)
+    assert router.transcribe(_clip(4.0)) == "accurate"
+    assert router.transcribe(_clip(4.0)) == "fast"
+    # Each clip routed elsewhere moves its estimate halfway back to the prior
+    assert accurate.rtf == pytest.approx(0.6)
+    for _ in range(3):
+        assert router.transcribe(_clip(4.0)) == "fast"
+    assert accurate.rtf == pytest.approx(0.25)
+    assert router.transcribe(_clip(4.0)) == "accurate"
+
+
+def test_load_probe_feeds_queue_depth(clock):
+    router = _router(clock)
+    router.load_probe = lambda: 3
+    assert router.transcribe(_clip(4.0)) == "fast"
+
+
+def test_warmup_skips_cold_call(clock):
+    router = _router(clock)
+    router.warmup(_clip(1.0))
+    assert all(b.samples == 0 and b.warmed for b in router.backends)
+    router.warmup(_clip(1.0))
+    assert [b.samples for b in router.backends] == [1, 1]
+
+
+def test_decision_log(clock, tmp_path):
+    log = tmp_path / "decisions.jsonl"
+    router = _router(clock, decision_log=log)
+    router.transcribe_batch([_clip(1.0), _clip(2.0)])
+    record = json.loads(log.read_text().splitlines()[0])
+    assert record["backend"] == "accurate"
+    assert record["clips"] == 2
+    assert record["duration"] == pytest.approx(3.0)
+    assert record["elapsed"] == pytest.approx(0.6)
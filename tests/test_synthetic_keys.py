@@ -0,0 +1,77 @@
+"""Tests for the ledger of key events synthesized by injectors."""
+
+import pytest
+
+from src.injectors import synthetic_keys
+from src.injectors.synthetic_keys import SyntheticKeys, key_name, modifier_name
+
+
+@pytest.mark.parametrize("keysym, expected", [
+    ("Control_L", "ctrl"),
+    ("Shift_R", "shift"),
+    ("Alt_L", "alt"),
+    ("Meta_L", "alt"),
+    ("Super_L", "super"),
+    ("BackSpace", None),
+    (None, None),
+])
+def test_modifier_name(keysym, expected):
+    assert modifier_name(keysym) == expected
+
+
+@pytest.mark.parametrize("key, expected", [
+    (" ", "space"),
+    ("\n", "enter"),
+    ("Return", "enter"),
+    ("A", "a"),
+    ("Control_R", "ctrl"),
+])
+def test_key_name(key, expected):
+    assert key_name(key) == expected
+
+
+def test_each_announced_event_is_consumed_once():
+    ledger = SyntheticKeys()
+    ledger.expect_text("ab", held=["ctrl"])
+    assert ledger.consume("ctrl", False)
+    assert ledger.consume("a", True)
+    assert ledger.consume("a", False)
+    # A second real press of "a" is not synthetic
+    assert not ledger.consume("a", True)
+    assert ledger.consume("b", True)
+    assert ledger.consume("b", False)
+    assert ledger.consume("ctrl", True)
+    assert not ledger.consume("ctrl", True)
+
+
+def test_unannounced_keys_pass_through():
+    ledger = SyntheticKeys()
+    ledger.expect_text("x")
+    assert not ledger.consume("y", True)
+    assert ledger.consume("x", True)
+    assert not ledger.consume("x", True)
+    assert ledger.consume("x", False)
+
+
+def test_combo_with_repeat():
+    ledger = SyntheticKeys()
+    ledger.expect_combo("ctrl+v", repeat=2, held=["alt"])
+    events = [("alt", False)] + [("ctrl", True), ("v", True), ("v", False), ("ctrl", False)] * 2 + [("alt", True)]
+    assert all(ledger.consume(name, pressed) for name, pressed in events)
+    assert not ledger.consume("v", True)
+
+
+def test_events_expire_after_grace(monkeypatch):
+    now = [100.0]
+    monkeypatch.setattr(synthetic_keys.time, "monotonic", lambda: now[0])
+    ledger = SyntheticKeys(grace=1.0)
+    ledger.expect([("ctrl", False)], duration=0.5)
+    now[0] += 1.6
+    assert not ledger.consume("ctrl", False)
+
+
+def test_clear():
+    ledger = SyntheticKeys()
+    ledger.expect_text("a")
+    ledger.clear()
+    assert not ledger.consume("a", True)
@@ -0,0 +1,78 @@
+"""Tests for the energy voice activity detector."""
+
+import numpy as np
+import pytest
+
+from src.vad import EnergyVAD, speech_threshold
+
+RATE = 16000
+
+
+def _tone(seconds: float, amplitude: float) -> np.ndarray:
+    t = np.arange(int(seconds * RATE)) / RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _noise(seconds: float, amplitude: float = 1e-3, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return (amplitude * rng.standard_normal(int(seconds * RATE))).astype(np.float32)
+
+
+@pytest.mark.parametrize("floor, expected", [
+    (-80.0, -45.0),  # Quiet room: the absolute threshold applies
+    (-50.0, -40.0),  # Noise floor plus margin
+    (-20.0, -30.0),  # Capped so loud recordings keep their quiet syllables
+])
+def test_speech_threshold(floor, expected):
+    assert speech_threshold(floor, 10.0, -45.0, -30.0) == expected
+
+
+def test_speech_threshold_cap_never_below_absolute_threshold():
+    assert speech_threshold(-20.0, 10.0, -25.0, -30.0) == -25.0
+
+
+def test_trim_keeps_speech_with_padding():
+    vad = EnergyVAD(padding_ms=200)
+    audio = np.concatenate((_noise(1.0), _tone(1.0, 0.3), _noise(1.0, seed=1)))
+    result = vad.trim(audio, RATE)
+    assert result.audio is not None
+    assert result.speech_seconds == pytest.approx(1.0, abs=0.06)
+    assert len(result.audio) / RATE == pytest.approx(1.4, abs=0.06)
+    assert result.trimmed_seconds == pytest.approx(3.0 - len(result.audio) / RATE)
+    # The result is a view of the input, not a copy
+    assert np.shares_memory(result.audio, audio)
+
+
+def test_trim_discards_silence():
+    result = EnergyVAD().trim(_noise(2.0), RATE)
+    assert result.audio is None
+    assert result.trimmed_seconds == pytest.approx(2.0)
+
+
+def test_short_blip_is_not_speech():
+    vad = EnergyVAD(min_speech_seconds=0.3)
+    audio = np.concatenate((_noise(1.0), _tone(0.1, 0.3), _noise(1.0, seed=1)))
+    assert not vad.has_speech(audio, RATE)
+    assert vad.trim(audio, RATE).audio is None
+
+
+def test_int16_and_float_agree():
+    vad = EnergyVAD()
+    audio = np.concatenate((_noise(0.5), _tone(0.5, 0.3), _noise(0.5, seed=1)))
+    as_int16 = (audio * 32767).astype(np.int16)
+    np.testing.assert_array_equal(vad.speech_frames(audio, RATE), vad.speech_frames(as_int16, RATE))
+
+
+def test_adaptive_cap_keeps_quiet_speech_in_loud_recordings():
+    # Speech almost throughout puts the 10th-percentile "noise floor" at
+    # speech level; the cap keeps a quiet (-27.5 dBFS) syllable at the end
+    audio = np.concatenate((_tone(2.5, 0.5), _tone(0.1, 0.06)))
+    assert EnergyVAD().speech_frames(audio, RATE)[-2:].all()
+    uncapped = EnergyVAD(max_adaptive_threshold_db=0.0)
+    assert not uncapped.speech_frames(audio, RATE)[-2:].any()
+
+
+def test_empty_audio():
+    vad = EnergyVAD()
+    assert len(vad.frame_levels(np.zeros(0, dtype=np.int16), RATE)) == 0
+    assert not vad.has_speech(np.zeros(10, dtype=np.int16), RATE)